@@ -183,9 +183,6 @@ from .models import (
 )
 from .models.save import save
 from . import core
-from . import integrations
-from . import curators
-from . import examples
 
 track = context._track
 finish = context._finish
@@ -196,6 +193,23 @@ from django.db.models import Q
 
 Param = Feature  # backward compat
 
+# these modules import pandera, anndata & other heavy dependencies
+# and are only imported on first access, e.g., ln.curators
+_LAZY_MODULES = {"curators", "integrations", "examples"}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_MODULES:
+        from importlib import import_module
+
+        return import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_MODULES)
+
+
 __all__ = [
     # data lineage
     "track",
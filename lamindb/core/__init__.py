@@ -23,6 +23,23 @@ Data loaders:
 
    MappedCollection
 
+Search index:
+
+.. autosummary::
+   :toctree: .
+
+   create_search_index
+   drop_search_index
+
+Connections to other instances:
+
+.. autosummary::
+   :toctree: .
+
+   warmup_connections
+   close_connections
+   connection_stats
+
 Modules:
 
 .. autosummary::
@@ -37,8 +54,25 @@ from lamin_utils import logger
 from lamin_utils._inspect import InspectResult
 
 from .. import errors as exceptions
-from ..examples import datasets  # backward compat
+from ..models._connections import (
+    close_connections,
+    connection_stats,
+    warmup_connections,
+)
+from ..models._search_index import create_search_index, drop_search_index
 from . import loaders, subsettings, types
 from ._context import Context
-from ._mapped_collection import MappedCollection
 from ._settings import Settings
+
+
+def __getattr__(name: str):
+    # MappedCollection and the example datasets import anndata
+    if name == "MappedCollection":
+        from ._mapped_collection import MappedCollection
+
+        return MappedCollection
+    elif name == "datasets":  # backward compat
+        from ..examples import datasets
+
+        return datasets
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,4 +1,5 @@
 import importlib.util
+import sys
 from typing import Any, Callable, TypeVar
 
 T = TypeVar("T")
@@ -9,6 +10,20 @@ def is_package_installed(package_name: str) -> bool:
     return spec is not None
 
 
+def isinstance_if_imported(obj: Any, package_name: str, class_name: str) -> bool:
+    """Check whether an object is an instance of a class without importing its package.
+
+    If the package hasn't been imported, no instance of the class can exist.
+
+    Examples:
+        isinstance_if_imported(dmem, "anndata", "AnnData")
+    """
+    module = sys.modules.get(package_name)
+    if module is None:
+        return False
+    return isinstance(obj, getattr(module, class_name))
+
+
 def with_package(package_name: str, operation: Callable[[Any], T]) -> T:
     """Execute an operation that requires a specific package.
 
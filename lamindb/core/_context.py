@@ -3,11 +3,15 @@ from __future__ import annotations
 import builtins
 import hashlib
 import os
+import queue
 import signal
 import sys
 import threading
+import time
 import traceback
 from datetime import datetime, timezone
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, TextIO
 
@@ -166,42 +170,247 @@ def pretty_pypackages(dependencies: dict) -> str:
     return " ".join(deps_list)
 
 
-def last_non_empty_r_block(line: str) -> str:
-    for block in reversed(line.split("\r")):
+# the seconds between flushes of the log file to disk
+LOG_FLUSH_INTERVAL = 1.0
+# the seconds the log file writer waits for writes to accumulate
+LOG_BATCH_INTERVAL = 0.05
+# the number of writes the log file writer can lag behind before writes block
+LOG_QUEUE_SIZE = 10_000
+
+
+class LineCollapser:
+    """Keeps only the last non-empty part of a line with carriage returns.
+
+    Progress bars like `tqdm` redraw a line by writing carriage returns. The
+    parts of a line are processed as they are written instead of buffering the
+    whole line.
+    """
+
+    def __init__(self):
+        self._block: list[str] = []  # the parts of the current `\r` block
+        self._last_block = ""  # the last non-empty, completed `\r` block
+
+    def _end_block(self) -> str:
+        block = "".join(self._block)
         if block:
-            return block
-    return ""
+            self._last_block = block
+        self._block = []
+        return self._last_block
+
+    def _add(self, text: str) -> None:
+        first, *blocks = text.split("\r")
+        self._block.append(first)
+        if not blocks:
+            return None
+        self._end_block()
+        for block in reversed(blocks[:-1]):
+            if block:
+                self._last_block = block
+                break
+        self._block = [blocks[-1]]
+
+    def collapse(self, data: str) -> str:
+        """The collapsed lines that `data` completes."""
+        if "\r" not in data:
+            # only the first line can have carriage returns from earlier data
+            first, sep, rest = data.partition("\n")
+            self._block.append(first)
+            if not sep:
+                return ""
+            collapsed = self._end_block() + "\n"
+            self._last_block = ""
+            lines, sep, rest = rest.rpartition("\n")
+            self._block = [rest]
+            return collapsed + lines + sep
+        *lines, rest = data.split("\n")
+        collapsed = []
+        for line in lines:
+            self._add(line)
+            collapsed.append(self._end_block() + "\n")
+            self._last_block = ""
+        self._add(rest)
+        return "".join(collapsed)
+
+    def collapse_rest(self) -> str:
+        """The collapsed incomplete line."""
+        rest = self._end_block()
+        self._last_block = ""
+        return rest
+
+
+# closes the log file writer
+_CLOSE = object()
+
+
+class LogFileWriter:
+    """Writes to a log file in a background thread.
+
+    Writes are queued and the thread writes them in batches. The file is flushed
+    to disk every `flush_interval` seconds rather than after every write.
 
+    Args:
+        path: The path of the log file.
+        file: The open log file.
+        flush_interval: The seconds between flushes of the file to disk.
+        max_bytes: If passed, the log file is rotated when it exceeds this size
+            in bytes, the previous part is kept at `{path}.1`.
+        queue_size: The number of writes the thread can lag behind before
+            writes block.
+    """
 
-class LogStreamHandler:
-    def __init__(self, log_stream: TextIO, file: TextIO, use_buffer: bool):
-        self.log_stream = log_stream
+    def __init__(
+        self,
+        path: Path,
+        file: TextIO,
+        flush_interval: float = LOG_FLUSH_INTERVAL,
+        max_bytes: int | None = None,
+        queue_size: int = LOG_QUEUE_SIZE,
+    ):
+        self.path = path
         self.file = file
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.queue_size = queue_size
+        self._size = file.tell()
+        self._closed = False
+        # the line collapsers of the streams, stream 0 is written as is
+        self._collapsers: list[LineCollapser | None] = [None]
+        # a `SimpleQueue` is reentrant, hence, it can be used in signal handlers
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        # wakes up the thread before the batch interval is over
+        self._wake = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="lamindb-log-writer", daemon=True
+        )
+        self._thread.start()
 
-        self._buffer = ""
-        self._use_buffer = use_buffer
+    @property
+    def closed(self) -> bool:
+        return self._closed
 
-    def write(self, data: str) -> int:
-        self.log_stream.write(data)
+    def add_stream(self, collapse: bool) -> int:
+        """Add a stream, returns its id for `write()`.
+
+        Args:
+            collapse: Whether to collapse carriage returns in lines of the stream.
+        """
+        self._collapsers.append(LineCollapser() if collapse else None)
+        return len(self._collapsers) - 1
+
+    def write(self, data: str, stream: int = 0) -> None:
+        """Queue data of a stream."""
+        # a tuple of a string and an int isn't tracked by the garbage collector
+        self._queue.put((data, stream))
+        if self._queue.qsize() > self.queue_size:
+            # wait for the thread to catch up
+            self.drain()
+
+    def write_rest(self, stream: int) -> None:
+        """Queue the incomplete last line of a stream."""
+        if (collapser := self._collapsers[stream]) is not None:
+            self._queue.put((None, collapser.collapse_rest))
+
+    def drain(self, timeout: float | None = None) -> None:
+        """Wait until all queued writes are written and flushed."""
+        if self.closed or not self._thread.is_alive():
+            return None
+        done = threading.Event()
+        self._queue.put((None, done))
+        self._wake.set()
+        done.wait(timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Write the queued writes and close the file."""
+        if self.closed:
+            return None
+        self._queue.put((None, _CLOSE))
+        self._wake.set()
+        self._thread.join(timeout)
+
+    def _rotate(self) -> None:
+        self.file.close()
+        self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+        self.file = open(self.path, "w", encoding="utf-8")
+        self._size = 0
+
+    def _write(self, text: str) -> None:
+        if self.max_bytes is None:
+            self.file.write(text)
+            return None
+        data = text.encode("utf-8", errors="surrogateescape")
+        while self._size + len(data) > self.max_bytes:
+            # fill the file up to the last line that fits
+            n_free = self.max_bytes - self._size
+            n_write = data.rfind(b"\n", 0, n_free) + 1
+            if n_write == 0 and self._size == 0:  # the line doesn't fit at all
+                n_write = n_free
+                # don't split a multi-byte character
+                while n_write > 0 and data[n_write] & 0xC0 == 0x80:
+                    n_write -= 1
+            self.file.write(data[:n_write].decode("utf-8", errors="surrogateescape"))
+            data = data[n_write:]
+            self._rotate()
+        self.file.write(data.decode("utf-8", errors="surrogateescape"))
+        self._size += len(data)
+
+    def _flush(self) -> None:
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def _run(self) -> None:
+        last_flush = time.monotonic()
+        while True:
+            items = [self._queue.get() for _ in range(self._queue.qsize())]
+            texts = []
+            controls = []
+            # consecutive data of the same stream is collapsed at once
+            for key, group in groupby(items, key=itemgetter(1)):
+                group = list(group)
+                if group[0][0] is not None:
+                    text = "".join(map(itemgetter(0), group))
+                    collapser = self._collapsers[key]
+                    texts.append(
+                        text if collapser is None else collapser.collapse(text)
+                    )
+                elif callable(key):  # the incomplete line of a stream
+                    texts.append(key())
+                else:
+                    controls.append(key)
+            try:
+                if texts:
+                    self._write("".join(texts))
+                if controls or time.monotonic() - last_flush >= self.flush_interval:
+                    self._flush()
+                    last_flush = time.monotonic()
+            except (OSError, ValueError):  # e.g., the disk is full
+                pass
+            for control in controls:
+                if isinstance(control, threading.Event):
+                    control.set()
+            if _CLOSE in controls:
+                self.file.close()
+                self._closed = True
+                return None
+            # let writes accumulate rather than competing for the GIL
+            self._wake.wait(LOG_BATCH_INTERVAL)
+            self._wake.clear()
 
-        if not self._use_buffer:
-            self.file.write(data)
-            self.file.flush()
-            return len(data)
 
-        self._buffer += data
-        # write only the last part of a line with carriage returns
-        while "\n" in self._buffer:
-            line, self._buffer = self._buffer.split("\n", 1)
-            self.file.write(last_non_empty_r_block(line) + "\n")
-            self.file.flush()
+class LogStreamHandler:
+    def __init__(self, log_stream: TextIO, writer: LogFileWriter, use_buffer: bool):
+        self.log_stream = log_stream
+        self.writer = writer
+        # collapse carriage returns in lines, otherwise write everything as is
+        self._stream = writer.add_stream(collapse=use_buffer)
 
+    def write(self, data: str) -> int:
+        self.log_stream.write(data)
+        self.writer.write(data, self._stream)
         return len(data)
 
+    # the log file is flushed by the writer
     def flush(self):
         self.log_stream.flush()
-        if not self.file.closed:
-            self.file.flush()
 
     # https://laminlabs.slack.com/archives/C07DB677JF6/p1759423901926139
     # other tracking frameworks like W&B use our output stream and expect
@@ -212,17 +421,25 @@ class LogStreamHandler:
     # .flush is sometimes (in jupyter etc.) called after every .write
     # this needs to be called only at the end
     def flush_buffer(self):
-        if not self.file.closed and self._buffer:
-            self.file.write(last_non_empty_r_block(self._buffer))
-            self._buffer = ""
+        if not self.writer.closed:
+            self.writer.write_rest(self._stream)
         self.flush()
+        self.writer.drain()
 
 
 class LogStreamTracker:
-    def __init__(self):
+    """Tracks stdout and stderr of a run in a log file.
+
+    Args:
+        max_bytes: If passed, the log file is rotated when it exceeds this size
+            in bytes, see `LogFileWriter`. Defaults to `settings.run_logs_max_bytes`.
+    """
+
+    def __init__(self, max_bytes: int | None = None):
         self.original_stdout = None
         self.original_stderr = None
-        self.log_file = None
+        self.log_writer: LogFileWriter | None = None
+        self.max_bytes = max_bytes
         self.original_excepthook = sys.excepthook
         self.is_cleaning_up = False
 
@@ -233,18 +450,25 @@ class LogStreamTracker:
         self.log_file_path = (
             ln_setup.settings.cache_dir / f"run_logs_{self.run.uid}.txt"
         )
-        self.log_file = open(self.log_file_path, "w")
+        log_file = open(self.log_file_path, "w", encoding="utf-8")
         # the instance that's connected is important information
-        self.log_file.write(
+        log_file.write(
             f"\x1b[92m→\x1b[0m connected lamindb: {ln_setup.settings.instance.slug}\n"
         )
-        # use buffering for correct handling of carriage returns
+        # writes in a background thread so that printing isn't slowed down
+        max_bytes = self.max_bytes
+        if max_bytes is None:
+            max_bytes = settings.run_logs_max_bytes
+        self.log_writer = LogFileWriter(
+            self.log_file_path, log_file, max_bytes=max_bytes
+        )
+        # collapse carriage returns for correct handling of progress bars
         sys.stdout = LogStreamHandler(
-            self.original_stdout, self.log_file, use_buffer=True
+            self.original_stdout, self.log_writer, use_buffer=True
         )
-        # write evrything immediately in stderr
+        # write evrything as is in stderr
         sys.stderr = LogStreamHandler(
-            self.original_stderr, self.log_file, use_buffer=False
+            self.original_stderr, self.log_writer, use_buffer=False
         )
         # handle signals
         # signal should be used only in the main thread, otherwise
@@ -257,13 +481,18 @@ class LogStreamTracker:
         # reset handler for lamin logger because sys.stdout has been replaced
         logger.set_handler()
 
+    def flush(self):
+        """Write what was tracked so far to the log file."""
+        if self.log_writer is not None:
+            self.log_writer.drain()
+
     def finish(self):
         if self.original_stdout:
             getattr(sys.stdout, "flush_buffer", sys.stdout.flush)()
             sys.stderr.flush()
             sys.stdout = self.original_stdout
             sys.stderr = self.original_stderr
-            self.log_file.close()
+            self.log_writer.close()
             # reset handler for lamin logger because sys.stdout has been replaced
             logger.set_handler()
 
@@ -281,15 +510,14 @@ class LogStreamTracker:
                         signal_msg += (
                             f"Frame info:\n{''.join(traceback.format_stack(frame))}"
                         )
-                    self.log_file.write(signal_msg)
-                    self.log_file.flush()
+                    self.log_writer.write(signal_msg)
                     self.run._status_code = 2  # aborted
                 else:
                     self.run._status_code = 1  # errored
                 self.run.finished_at = datetime.now(timezone.utc)
                 sys.stdout = self.original_stdout
                 sys.stderr = self.original_stderr
-                self.log_file.close()
+                self.log_writer.close()
                 save_run_logs(self.run, save_run=True)
         except:  # noqa: E722, S110
             pass
@@ -298,13 +526,13 @@ class LogStreamTracker:
         try:
             if not self.is_cleaning_up:
                 error_msg = f"{''.join(traceback.format_exception(exc_type, exc_value, exc_traceback))}"
-                if self.log_file.closed:
-                    self.log_file = open(self.log_file_path, "a")
+                if self.log_writer.closed:
+                    with open(self.log_file_path, "a", encoding="utf-8") as log_file:
+                        log_file.write(error_msg)
                 else:
                     getattr(sys.stdout, "flush_buffer", sys.stdout.flush)()
                     sys.stderr.flush()
-                self.log_file.write(error_msg)
-                self.log_file.flush()
+                    self.log_writer.write(error_msg)
                 self.cleanup()
         except:  # noqa: E722, S110
             pass
@@ -1000,9 +1228,11 @@ class Context:
 
         """
         from .._finish import save_context_core, save_run_logs
+        from ._functions import flush_buffered_runs
 
         if self.run is None:
             raise TrackNotCalled("Please run `ln.track()` before `ln.finish()`")
+        flush_buffered_runs()
         if self._path is None:
             if self.run.transform.kind in {"script", "notebook"}:
                 raise ValueError(
@@ -1034,6 +1264,7 @@ class Context:
                 logger.important(
                     f"go to: {ui_url}/{instance_slug}/transform/{self.transform.uid}"
                 )
+            self._stream_tracker.flush()
             save_run_logs(self.run, save_run=True)
             self._stream_tracker.finish()
         # reset the context attributes so that somebody who runs `track()` after finish
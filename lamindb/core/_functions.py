@@ -1,5 +1,7 @@
+import atexit
 import functools
 import inspect
+import threading
 from contextvars import ContextVar
 from datetime import datetime, timezone
 from typing import Callable, ParamSpec, TypeVar
@@ -20,36 +22,107 @@ from ._context import context as global_context
 P = ParamSpec("P")
 R = TypeVar("R")
 
+# number of buffered runs that triggers writing them to the database
+RUN_BUFFER_SIZE = 1000
+
 # Create a context variable to store the current tracked run
 current_tracked_run: ContextVar[Run | None] = ContextVar(
     "current_tracked_run", default=None
 )
 
 
+class RunBuffer:
+    """Finished runs of buffered steps that are saved in bulk."""
+
+    def __init__(self):
+        self._runs: list[Run] = []
+        self._lock = threading.Lock()
+        self._registered_atexit = False
+
+    def __len__(self) -> int:
+        return len(self._runs)
+
+    def add(self, run: Run) -> None:
+        with self._lock:
+            self._runs.append(run)
+            if not self._registered_atexit:
+                atexit.register(self.flush)
+                self._registered_atexit = True
+            is_full = len(self._runs) >= RUN_BUFFER_SIZE
+        if is_full:
+            self.flush()
+
+    def flush(self) -> None:
+        """Save all buffered runs whose initiating runs are saved."""
+        from ..models.save import bulk_create
+
+        with self._lock:
+            pending, self._runs = self._runs, []
+        # an initiating run needs a primary key before its initiated runs are saved
+        # initiating runs that are still running keep their initiated runs pending
+        while pending:
+            ready = [
+                run
+                for run in pending
+                if run.initiated_by_run is None or run.initiated_by_run.pk is not None
+            ]
+            if not ready:
+                break
+            bulk_create(ready)
+            pending = [run for run in pending if run.pk is None]
+        if pending:
+            with self._lock:
+                self._runs = pending + self._runs
+
+
+run_buffer = RunBuffer()
+
+
+def flush_buffered_runs() -> None:
+    """Save the runs of buffered steps, see :func:`~lamindb.step`."""
+    run_buffer.flush()
+
+
+def _save_buffered_run(run: Run) -> None:
+    # saves a buffered run that's still running and its initiating runs
+    if run.initiated_by_run is not None and run.initiated_by_run.pk is None:
+        _save_buffered_run(run.initiated_by_run)
+    run.save()
+
+
 def get_current_tracked_run() -> Run | None:
     """Get the run object."""
     run = current_tracked_run.get()
     if run is None:
         run = global_context.run
+    elif run.pk is None:
+        # a record is linked to a run of a buffered step
+        _save_buffered_run(run)
     return run
 
 
 def _create_tracked_decorator(
-    uid: str | None = None, is_flow: bool = True
+    uid: str | None = None, is_flow: bool = True, buffered: bool = False
 ) -> Callable[[Callable[P, R]], Callable[P, R]]:
     """Internal helper to create tracked decorators.
 
     Args:
         uid: Persist the uid to identify this transform across renames.
         is_flow: Triggered through @ln.flow(), otherwise @ln.step().
+        buffered: Whether to buffer runs in memory and save them in bulk.
     """
 
     def decorator_tracked(func: Callable[P, R]) -> Callable[P, R]:
         # Get the original signature
         sig = inspect.signature(func)
+        # the transform of a buffered step is only resolved on the first call
+        cached_transform: Transform | None = None
 
-        @functools.wraps(func)
-        def wrapper_tracked(*args: P.args, **kwargs: P.kwargs) -> R:
+        def get_transform(initiated_by_run: Run | None) -> Transform:
+            nonlocal cached_transform
+
+            if cached_transform is not None:
+                return cached_transform
             # Get function metadata
             path, transform_type, reference, reference_type = (
                 detect_and_process_source_code_file(
@@ -57,19 +130,6 @@ def _create_tracked_decorator(
                     transform_type="function",
                 )
             )
-
-            initiated_by_run = get_current_tracked_run()
-            if initiated_by_run is None:
-                if global_context.run is None:
-                    if not is_flow:
-                        raise RuntimeError(
-                            "Please track the global run context before using @ln.step(): ln.track()"
-                        )
-                    else:
-                        initiated_by_run = None
-                else:
-                    initiated_by_run = global_context.run
-
             # get the fully qualified module name, including submodules
             module_path = func.__module__.replace(".", "/")
             key = (
@@ -98,9 +158,27 @@ def _create_tracked_decorator(
                     type="function",
                     source_code=inspect.getsource(func),
                 ).save()
+            if buffered:
+                cached_transform = transform
+            return transform
+
+        def start_run(args, kwargs) -> Run:
+            initiated_by_run = current_tracked_run.get()
+            if initiated_by_run is None:
+                if global_context.run is None:
+                    if not is_flow:
+                        raise RuntimeError(
+                            "Please track the global run context before using @ln.step(): ln.track()"
+                        )
+                    else:
+                        initiated_by_run = None
+                else:
+                    initiated_by_run = global_context.run
+            elif not buffered and initiated_by_run.pk is None:
+                _save_buffered_run(initiated_by_run)
 
             run = Run(
-                transform=transform,
+                transform=get_transform(initiated_by_run),
                 initiated_by_run=initiated_by_run,
                 entrypoint=func.__qualname__,
             )  # type: ignore
@@ -120,18 +198,54 @@ def _create_tracked_decorator(
 
             # Add parameters to the run
             run.params = serialize_params_to_json(params)
-            run.save()
+            if not buffered:
+                run.save()
+            return run
+
+        def finish_run(run: Run, completed: bool) -> None:
+            if completed:
+                run.finished_at = datetime.now(timezone.utc)
+                run._status_code = 0  # completed
+            if not buffered or run.pk is not None:
+                # buffered runs are saved while running if records link them
+                if completed:
+                    run.save()
+            else:
+                run_buffer.add(run)
+
+        if inspect.iscoroutinefunction(func):
+            from asgiref.sync import sync_to_async
+
+            @functools.wraps(func)
+            async def async_wrapper_tracked(*args: P.args, **kwargs: P.kwargs) -> R:
+                # django doesn't allow synchronous database queries in the event loop
+                run = await sync_to_async(start_run)(args, kwargs)
+                # Set the run in context and execute function
+                token = current_tracked_run.set(run)
+                completed = False
+                try:
+                    result = await func(*args, **kwargs)
+                    completed = True
+                    return result
+                finally:
+                    current_tracked_run.reset(token)
+                    await sync_to_async(finish_run)(run, completed)
+
+            return async_wrapper_tracked  # type: ignore
 
+        @functools.wraps(func)
+        def wrapper_tracked(*args: P.args, **kwargs: P.kwargs) -> R:
+            run = start_run(args, kwargs)
             # Set the run in context and execute function
             token = current_tracked_run.set(run)
+            completed = False
             try:
                 result = func(*args, **kwargs)
-                run.finished_at = datetime.now(timezone.utc)
-                run._status_code = 0  # completed
-                run.save()
+                completed = True
                 return result
             finally:
                 current_tracked_run.reset(token)
+                finish_run(run, completed)
 
         return wrapper_tracked
 
@@ -174,7 +288,9 @@ def flow(uid: str | None = None) -> Callable[[Callable[P, R]], Callable[P, R]]:
     return _create_tracked_decorator(uid=uid, is_flow=True)
 
 
-def step(uid: str | None = None) -> Callable[[Callable[P, R]], Callable[P, R]]:
+def step(
+    uid: str | None = None, *, buffered: bool = False
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
     """Use `@step()` to track a function as a step.
 
     Behaves like :func:`~lamindb.flow()`, but acts as a step in a workflow.
@@ -183,8 +299,22 @@ def step(uid: str | None = None) -> Callable[[Callable[P, R]], Callable[P, R]]:
 
     Args:
         uid: Persist the uid to identify a transform across renames.
+        buffered: For functions that are called many times, keep runs in memory
+            and save them in batches rather than saving each run when it starts and finishes.
+            Remaining runs are saved upon :func:`~lamindb.finish()` and when the
+            Python process exits. The transform is only looked up on the first call.
+
+    Examples:
+
+        A step that's called many times::
+
+            @ln.step(buffered=True)
+            def normalize(value: float) -> float:
+                return value / 2
+
+        Both `def` and `async def` functions can be tracked.
     """
-    return _create_tracked_decorator(uid=uid, is_flow=False)
+    return _create_tracked_decorator(uid=uid, is_flow=False, buffered=buffered)
 
 
 @deprecated("step")
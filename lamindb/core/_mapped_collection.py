@@ -1,8 +1,14 @@
 from __future__ import annotations
 
-from collections import Counter
+import json
+import shutil
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from functools import reduce
-from typing import TYPE_CHECKING, Literal
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Literal
+from uuid import uuid4
 
 import numpy as np
 import pandas as pd
@@ -21,6 +27,8 @@ from .storage._anndata_accessor import (
 )
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
     from lamindb_setup.types import UPathStr
 
 
@@ -51,6 +59,297 @@ class _Connect:
 
 _decode = np.frompyfunc(lambda x: x.decode("utf-8"), 1, 1)
 
+# bump when the format of manifests changes
+MANIFEST_VERSION = 1
+
+
+def mapped_manifest_path(hashes: list[str | None], *args) -> Path | None:
+    """Manifest directory in the cache for stores with these hashes.
+
+    Args:
+        hashes: The hashes of the stores.
+        args: The arguments of `MappedCollection` that determine the index.
+
+    Returns `None` if a store has no hash.
+    """
+    from lamindb_setup import settings as setup_settings
+    from lamindb_setup.core.hashing import hash_string
+
+    if any(store_hash is None for store_hash in hashes):
+        return None
+    key = json.dumps([MANIFEST_VERSION, hashes, args], sort_keys=True, default=str)
+    return setup_settings.cache_dir / "mapped" / hash_string(key)
+
+
+def _categories_to_json(cats: np.ndarray | None) -> dict | None:
+    if cats is None:
+        return None
+    if cats.dtype.kind == "T":
+        # variable-width strings of numpy 2 have no dtype string
+        dtype = "StringDType"
+    elif cats.dtype.kind == "O":
+        dtype = "object"
+    else:
+        dtype = cats.dtype.str
+    return {"dtype": dtype, "values": cats.tolist()}
+
+
+def _categories_from_json(cats: dict | None) -> np.ndarray | None:
+    if cats is None:
+        return None
+    if cats["dtype"] == "StringDType":
+        dtype = np.dtypes.StringDType()
+    elif cats["dtype"] == "object":
+        dtype = object
+    else:
+        dtype = np.dtype(cats["dtype"])
+    return np.array(cats["values"], dtype=dtype)
+
+
+# code of NaN labels in the precomputed codes of encoded labels
+_NAN_CODE = np.iinfo(np.int32).min
+
+
+def _codes_to_labels(codes: np.ndarray) -> np.ndarray:
+    """Encoded labels from precomputed codes, NaN labels are `np.nan`."""
+    nans = codes == _NAN_CODE
+    if nans.any():
+        labels = codes.astype(object)
+        labels[nans] = np.nan
+        return labels
+    return codes.astype(np.int64)
+
+
+def _read_rows(lazy_data: ArrayType, rows: np.ndarray) -> np.ndarray:
+    """Read sorted unique rows of an array in one go."""
+    span = rows[-1] - rows[0] + 1
+    # read a contiguous block if it is not much larger than the requested rows
+    if span <= 2 * len(rows):
+        return lazy_data[rows[0] : rows[-1] + 1][rows - rows[0]]
+    if hasattr(lazy_data, "oindex"):  # zarr
+        return lazy_data.oindex[rows]
+    return lazy_data[rows]
+
+
+def _read_csr_rows(
+    data: ArrayType, indices: ArrayType, starts: np.ndarray, ends: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Read data and indices of sorted csr rows given by indptr starts and ends."""
+    lengths = ends - starts
+    n_entries = lengths.sum()
+    span_start, span_end = starts[0], ends[-1]
+    if span_end - span_start <= 2 * n_entries:
+        # read a contiguous block and take the rows from it
+        offsets = np.repeat(
+            starts - span_start - (np.cumsum(lengths) - lengths), lengths
+        )
+        positions = offsets + np.arange(n_entries)
+        return (
+            data[span_start:span_end][positions],
+            indices[span_start:span_end][positions],
+        )
+    # read runs of adjacent rows
+    breaks = np.flatnonzero(starts[1:] != ends[:-1]) + 1
+    run_starts = starts[np.r_[0, breaks]]
+    run_ends = ends[np.r_[breaks - 1, len(ends) - 1]]
+    data_s = np.concatenate([data[s:e] for s, e in zip(run_starts, run_ends)])
+    indices_s = np.concatenate([indices[s:e] for s, e in zip(run_starts, run_ends)])
+    return data_s, indices_s
+
+
+class _CsrChunk:
+    """Rows of a csr matrix held in memory, accessed like a lazy csr group."""
+
+    def __init__(
+        self,
+        data: np.ndarray,
+        indices: np.ndarray,
+        indptr: np.ndarray,
+        shape: tuple[int, int],
+    ):
+        self._arrays = {"data": data, "indices": indices, "indptr": indptr}
+        self.attrs = {"shape": shape}
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        return self._arrays[key]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(array.nbytes for array in self._arrays.values())
+
+
+def _read_chunk(
+    lazy_data: ArrayType | GroupType, start: int, stop: int
+) -> np.ndarray | _CsrChunk:
+    """Read a contiguous range of rows of a dense array or a csr matrix."""
+    if isinstance(lazy_data, ArrayTypes):  # type: ignore
+        return lazy_data[start:stop]
+    indptr = lazy_data["indptr"][start : stop + 1]  # type: ignore
+    data = lazy_data["data"][indptr[0] : indptr[-1]]  # type: ignore
+    indices = lazy_data["indices"][indptr[0] : indptr[-1]]  # type: ignore
+    n_vars = lazy_data.attrs["shape"][1]  # type: ignore
+    return _CsrChunk(data, indices, indptr - indptr[0], (stop - start, n_vars))
+
+
+class _ReadaheadChunk(dict):
+    """A chunk of rows of an `AnnData` object, accessed like a store.
+
+    Holds `"X"`, `"layers"` and `"obsm"` like a store and the decoded labels
+    of `.obs` columns in `labels`.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.labels: dict[str, np.ndarray] = {}
+
+    @property
+    def nbytes(self) -> int:
+        arrays = [self["X"]] if "X" in self else []
+        for key in ("layers", "obsm"):
+            arrays += list(self.get(key, {}).values())
+        arrays += list(self.labels.values())
+        return sum(array.nbytes for array in arrays)
+
+
+class _Readahead:
+    """Fetch chunks of rows in background threads into a bounded LRU cache.
+
+    Chunks are identified by keys `(storage_idx, chunk_id)` and fetched with `fetch`.
+    Chunks passed to `schedule()` are fetched in order, at most `n_chunks_ahead`
+    of them ahead of use.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[int, int], _ReadaheadChunk],
+        chunk_size: int,
+        max_cache_bytes: int,
+        max_workers: int,
+        n_chunks_ahead: int,
+    ):
+        self.fetch = fetch
+        self.chunk_size = chunk_size
+        self.max_cache_bytes = max_cache_bytes
+        self.max_workers = max_workers
+        self.n_chunks_ahead = n_chunks_ahead
+        self._init_state()
+
+    def _init_state(self):
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._cache: OrderedDict[tuple[int, int], _ReadaheadChunk] = OrderedDict()
+        self._cache_bytes = 0
+        self._futures: dict[tuple[int, int], Future] = {}
+        # chunks that were fetched ahead and weren't used yet
+        self._prefetched: set[tuple[int, int]] = set()
+        self._queue: deque[tuple[int, int]] = deque()
+        self.hits = 0
+        self.misses = 0
+        self.bytes_fetched = 0
+
+    def __getstate__(self):
+        # threads, locks and futures can't be pickled, e.g., for dataloader workers
+        return {
+            "fetch": self.fetch,
+            "chunk_size": self.chunk_size,
+            "max_cache_bytes": self.max_cache_bytes,
+            "max_workers": self.max_workers,
+            "n_chunks_ahead": self.n_chunks_ahead,
+        }
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_state()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "bytes_fetched": self.bytes_fetched,
+                "cached_bytes": self._cache_bytes,
+                "n_cached_chunks": len(self._cache),
+            }
+
+    def schedule(self, keys: list[tuple[int, int]]):
+        with self._lock:
+            self._queue = deque(keys)
+            self._prefetched.clear()
+            self._fill()
+
+    def get(self, key: tuple[int, int]) -> _ReadaheadChunk:
+        with self._lock:
+            chunk = self._cache.get(key)
+            if chunk is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                self._prefetched.discard(key)
+                self._fill()
+                return chunk
+            future = self._futures.get(key)
+        if future is not None:
+            chunk = future.result()
+            with self._lock:
+                self.hits += 1
+                self._prefetched.discard(key)
+                self._fill()
+            return chunk
+        chunk = self.fetch(*key)
+        with self._lock:
+            self.misses += 1
+            self.bytes_fetched += chunk.nbytes
+            self._put(key, chunk)
+            self._fill()
+        return chunk
+
+    def close(self):
+        with self._lock:
+            self._queue.clear()
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fill(self):
+        # needs to be called with the lock held
+        while (
+            self._queue
+            and len(self._futures) + len(self._prefetched) < self.n_chunks_ahead
+        ):
+            key = self._queue.popleft()
+            if key in self._cache or key in self._futures:
+                continue
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            self._futures[key] = self._executor.submit(self._fetch_ahead, key)
+
+    def _fetch_ahead(self, key: tuple[int, int]) -> _ReadaheadChunk:
+        try:
+            chunk = self.fetch(*key)
+        except BaseException:
+            with self._lock:
+                self._futures.pop(key, None)
+            raise
+        with self._lock:
+            self._futures.pop(key, None)
+            self.bytes_fetched += chunk.nbytes
+            self._put(key, chunk)
+            if key in self._cache:
+                self._prefetched.add(key)
+        return chunk
+
+    def _put(self, key: tuple[int, int], chunk: _ReadaheadChunk):
+        # needs to be called with the lock held
+        nbytes = chunk.nbytes
+        if key in self._cache or nbytes > self.max_cache_bytes:
+            return
+        self._cache[key] = chunk
+        self._cache_bytes += nbytes
+        while self._cache_bytes > self.max_cache_bytes:
+            evicted_key, evicted = self._cache.popitem(last=False)
+            self._cache_bytes -= evicted.nbytes
+            self._prefetched.discard(evicted_key)
+
 
 class MappedCollection:
     """Map-style collection for use in data loaders.
@@ -67,6 +366,13 @@ class MappedCollection:
     (`.X` is in `"X"`), `obs_keys`, `obsm_keys` (under `f"obsm_{key}"`) and also `"_store_idx"`
     for the index of the `AnnData` object containing this observation sample.
 
+    :meth:`~lamindb.core.MappedCollection.get_batch` reads many observations at once
+    and returns the same keys with stacked arrays. `__getitems__` uses it
+    to fetch whole batches in `torch.utils.data.DataLoader` for `torch>=2.2`.
+
+    When streaming from the cloud, :meth:`~lamindb.core.MappedCollection.enable_readahead`
+    reads chunks of rows ahead of use in background threads.
+
     .. note::
 
         For a guide, see :doc:`docs:scrna-mappedcollection`.
@@ -93,12 +399,17 @@ class MappedCollection:
             does not join.
         encode_labels: Encode labels into integers.
             Can be a list with elements from ``obs_keys``.
+            The codes of all observations are computed on construction.
         unknown_label: Encode this label to -1.
             Can be a dictionary with keys from ``obs_keys`` if ``encode_labels=True``
             or from ``encode_labels`` if it is a list.
         cache_categories: Enable caching categories of ``obs_keys`` for faster access.
         parallel: Enable sampling with multiple processes.
         dtype: Convert numpy arrays from ``.X``, ``.layers`` and ``.obsm``
+        manifest: A directory for the index of the observations, categories,
+            encoders and variables. If it exists, the index is memory-mapped
+            from it instead of reading the stores, otherwise it's written to it.
+            The index has to belong to the same stores and arguments.
     """
 
     def __init__(
@@ -114,6 +425,7 @@ class MappedCollection:
         cache_categories: bool = True,
         parallel: bool = False,
         dtype: str | None = None,
+        manifest: UPathStr | None = None,
     ):
         if join not in {None, "inner", "outer"}:  # pragma: nocover
             raise ValueError(
@@ -161,6 +473,7 @@ class MappedCollection:
                 )
         self.unknown_label = unknown_label
 
+        self._readahead: _Readahead | None = None
         self.storages = []  # type: ignore
         self.conns = []  # type: ignore
         self.parallel = parallel
@@ -168,12 +481,33 @@ class MappedCollection:
         self._make_connections(path_list, parallel)
 
         self._cache_cats: dict = {}
+        # codes of encoded labels per store, indexed by the rows of the store
+        self._label_codes: dict[str, list[np.ndarray]] = {}
+        self.join_vars: Literal["inner", "outer"] | None = join
+        self.var_indices: list | None = None
+        self.var_joint: pd.Index | None = None
+        self.n_vars_list: list | None = None
+        self.var_list: list | None = None
+        self.n_vars: int | None = None
+        if manifest is None or not self._read_manifest(manifest):
+            self._make_index(obs_filter, cache_categories)
+            if manifest is not None:
+                self._write_manifest(manifest)
+
+        self._dtype = dtype
+        self._closed = False
+
+    def _make_index(
+        self, obs_filter: dict[str, str | list[str]] | None, cache_categories: bool
+    ):
+        """Read the observations, categories and variables of all stores."""
         if self.obs_keys is not None:
             if cache_categories:
                 self._cache_categories(self.obs_keys)
             self.encoders: dict = {}
             if self.encode_labels:
                 self._make_encoders(self.encode_labels)  # type: ignore
+                self._make_label_codes(self.encode_labels)  # type: ignore
 
         self.n_obs_list = []
         self.indices_list = []
@@ -227,18 +561,106 @@ class MappedCollection:
         self.indices = np.hstack(self.indices_list)
         self.storage_idx = np.repeat(np.arange(len(self.storages)), self.n_obs_list)
 
-        self.join_vars: Literal["inner", "outer"] | None = join
-        self.var_indices: list | None = None
-        self.var_joint: pd.Index | None = None
-        self.n_vars_list: list | None = None
-        self.var_list: list | None = None
-        self.n_vars: int | None = None
         if self.join_vars is not None:
             self._make_join_vars()
             self.n_vars = len(self.var_joint)
 
-        self._dtype = dtype
-        self._closed = False
+    def _write_manifest(self, manifest: UPathStr):
+        """Write the index to a manifest directory, see `_read_manifest()`."""
+        manifest = Path(manifest)
+        tmp_dir = manifest.with_name(f"{manifest.name}.{uuid4().hex}.tmp")
+        try:
+            tmp_dir.mkdir(parents=True)
+            meta = {
+                "version": MANIFEST_VERSION,
+                "n_obs_list": [int(n) for n in self.n_obs_list],
+                "offsets": {},
+                "join_vars": self.join_vars,
+                "var_joint": None
+                if self.var_joint is None
+                else self.var_joint.tolist(),
+                "n_vars_list": self.n_vars_list,
+                "categories": {
+                    label: [_categories_to_json(cats) for cats in cats_list]
+                    for label, cats_list in self._cache_cats.items()
+                },
+                "encoders": {
+                    label: [
+                        [cat.item() if isinstance(cat, np.generic) else cat, code]
+                        for cat, code in encoder.items()
+                    ]
+                    for label, encoder in getattr(self, "encoders", {}).items()
+                },
+                "label_codes": list(self._label_codes),
+            }
+            np.save(tmp_dir / "indices.npy", self.indices)
+            np.save(tmp_dir / "storage_idx.npy", self.storage_idx)
+            arrays = {
+                f"codes_{i}": codes
+                for i, codes in enumerate(self._label_codes.values())
+            }
+            if self.var_indices is not None:
+                arrays["var_indices"] = self.var_indices
+            for name, array_list in arrays.items():
+                np.save(tmp_dir / f"{name}.npy", np.concatenate(array_list))
+                meta["offsets"][name] = np.cumsum(
+                    [0] + [len(array) for array in array_list]
+                ).tolist()
+            (tmp_dir / "manifest.json").write_text(json.dumps(meta))
+            tmp_dir.rename(manifest)
+        except (OSError, TypeError, ValueError) as e:
+            # e.g., another process wrote the manifest or labels aren't serializable
+            logger.debug(f"not writing manifest of mapped collection: {e}")
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def _read_manifest(self, manifest: UPathStr) -> bool:
+        """Memory-map the index from a manifest directory if it exists."""
+        manifest = Path(manifest)
+        manifest_file = manifest / "manifest.json"
+        if not manifest_file.exists():
+            return False
+        meta = json.loads(manifest_file.read_text())
+        if meta["version"] != MANIFEST_VERSION or len(meta["n_obs_list"]) != len(
+            self.storages
+        ):
+            return False
+
+        def load(name: str) -> np.ndarray:
+            return np.load(manifest / f"{name}.npy", mmap_mode="r")
+
+        def split(name: str) -> list[np.ndarray]:
+            array = load(name)
+            offsets = meta["offsets"][name]
+            return [array[start:stop] for start, stop in zip(offsets, offsets[1:])]
+
+        self.n_obs_list = meta["n_obs_list"]
+        self.n_obs = sum(self.n_obs_list)
+        self.indices = load("indices")
+        self.storage_idx = load("storage_idx")
+        offsets = np.cumsum([0] + self.n_obs_list)
+        self.indices_list = [
+            self.indices[start:stop] for start, stop in zip(offsets, offsets[1:])
+        ]
+        self._cache_cats = {
+            label: [_categories_from_json(cats) for cats in cats_list]
+            for label, cats_list in meta["categories"].items()
+        }
+        if self.obs_keys is not None:
+            self.encoders = {
+                label: dict(encoder) for label, encoder in meta["encoders"].items()
+            }
+        self._label_codes = {
+            label: split(f"codes_{i}") for i, label in enumerate(meta["label_codes"])
+        }
+        self.join_vars = meta["join_vars"]
+        if meta["var_joint"] is not None:
+            self.var_joint = pd.Index(meta["var_joint"])
+            self.n_vars = len(self.var_joint)
+        self.n_vars_list = meta["n_vars_list"]
+        if "var_indices" in meta["offsets"]:
+            self.var_indices = split("var_indices")
+        return True
 
     def _make_connections(self, path_list: list, parallel: bool):
         for path in path_list:
@@ -281,6 +703,31 @@ class MappedCollection:
             encoder.update({cat: i for i, cat in enumerate(cats)})
             self.encoders[label] = encoder
 
+    def _make_label_codes(self, encode_labels: list):
+        """Map the labels of each store to the codes of the encoders."""
+        for label in encode_labels:
+            encoder = self.encoders[label]
+            self._label_codes[label] = []
+            for i, storage in enumerate(self.storages):
+                with _Connect(storage) as store:
+                    codes = self._get_codes(store, label)
+                    if label in self._cache_cats:
+                        cats = self._cache_cats[label][i]
+                    else:
+                        cats = self._get_categories(store, label)
+                    if cats is not None:
+                        cats = _decode(cats) if isinstance(cats[0], bytes) else cats
+                        # NaN is coded as -1, which takes the last element
+                        mapping = [encoder[cat] for cat in cats] + [_NAN_CODE]
+                    else:
+                        if len(codes) > 0 and isinstance(codes[0], bytes):
+                            codes = _decode(codes)
+                        uniques, codes = np.unique(codes, return_inverse=True)
+                        mapping = [encoder[value] for value in uniques]
+                self._label_codes[label].append(
+                    np.take(np.array(mapping, dtype=np.int32), codes)
+                )
+
     def _read_vars(self):
         self.var_list = []
         self.n_vars_list = []
@@ -366,6 +813,8 @@ class MappedCollection:
         return list(zip(self.n_obs_list, n_vars_list))
 
     def __getitem__(self, idx: int):
+        if self._readahead is not None:
+            return {key: value[0] for key, value in self.get_batch([idx]).items()}
         obs_idx = self.indices[idx]
         storage_idx = self.storage_idx[idx]
         if self.var_indices is not None:
@@ -389,18 +838,250 @@ class MappedCollection:
             out["_store_idx"] = storage_idx
             if self.obs_keys is not None:
                 for label in self.obs_keys:
+                    if label in self._label_codes:
+                        code = self._label_codes[label][storage_idx][obs_idx]
+                        out[label] = np.nan if code == _NAN_CODE else int(code)
+                        continue
                     if label in self._cache_cats:
                         cats = self._cache_cats[label][storage_idx]
                         if cats is None:
                             cats = []
                     else:
                         cats = None
-                    label_idx = self._get_obs_idx(store, obs_idx, label, cats)
-                    if label in self.encoders and label_idx is not np.nan:
-                        label_idx = self.encoders[label][label_idx]
-                    out[label] = label_idx
+                    out[label] = self._get_obs_idx(store, obs_idx, label, cats)
         return out
 
+    def __getitems__(self, indices: list[int]) -> list[dict]:
+        """Get a list of observation data samples for a batch of indices.
+
+        `torch.utils.data.DataLoader` calls this with all indices of a batch.
+        """
+        batch = self.get_batch(indices)
+        return [
+            {key: value[i] for key, value in batch.items()} for i in range(len(indices))
+        ]
+
+    def get_batch(self, indices: np.ndarray | list[int]) -> dict[str, np.ndarray]:
+        """Get a batch of observation data samples.
+
+        The indices are grouped by `AnnData` object and sorted within each of them,
+        so that the data and `.obs` codes of all requested observations in an object
+        are read together, instead of one read per observation as in `__getitem__`.
+
+        Args:
+            indices: Integer indices of the observations.
+
+        Returns:
+            A dictionary with the keys returned by `__getitem__`,
+            the values are arrays stacked in the order of `indices`.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        obs_idxs = self.indices[indices]
+        storage_idxs = self.storage_idx[indices]
+
+        parts: dict[str, list] = {}
+        positions_list = []
+        for storage_idx in np.unique(storage_idxs):
+            positions = np.flatnonzero(storage_idxs == storage_idx)
+            positions_list.append(positions)
+            # sorted unique rows, inverse maps them back to the requested positions
+            rows, inverse = np.unique(obs_idxs[positions], return_inverse=True)
+            if self._readahead is not None:
+                rows_data = self._read_rows_readahead(storage_idx, rows)
+            else:
+                with _Connect(self.storages[storage_idx]) as store:
+                    rows_data = self._read_store_rows(store, storage_idx, rows)
+            for key, values in rows_data.items():
+                parts.setdefault(key, []).append(values[inverse])
+
+        order = np.argsort(np.concatenate(positions_list), kind="stable")
+        return {key: np.concatenate(values)[order] for key, values in parts.items()}
+
+    def _read_store_rows(
+        self,
+        store: StorageType | _ReadaheadChunk,
+        storage_idx: int,
+        rows: np.ndarray,
+    ) -> dict[str, np.ndarray]:
+        """Read sorted unique rows of a store or of a chunk of rows of a store."""
+        if self.var_indices is not None:
+            var_idxs_join = self.var_indices[storage_idx]
+        else:
+            var_idxs_join = None
+        out = {}
+        for layers_key in self.layers_keys:
+            lazy_data = store["X"] if layers_key == "X" else store["layers"][layers_key]
+            out[layers_key] = self._get_data_batch(
+                lazy_data, rows, self.join_vars, var_idxs_join, self.n_vars
+            )
+        if self.obsm_keys is not None:
+            for obsm_key in self.obsm_keys:
+                lazy_data = store["obsm"][obsm_key]
+                out[f"obsm_{obsm_key}"] = self._get_data_batch(lazy_data, rows)
+        out["_store_idx"] = np.full(len(rows), storage_idx)
+        if self.obs_keys is not None:
+            for label in self.obs_keys:
+                if isinstance(store, _ReadaheadChunk):
+                    labels = store.labels[label][rows]
+                elif label in self._label_codes:
+                    labels = self._label_codes[label][storage_idx][rows]
+                else:
+                    if label in self._cache_cats:
+                        cats = self._cache_cats[label][storage_idx]
+                        if cats is None:
+                            cats = []
+                    else:
+                        cats = None
+                    labels = self._get_obs_batch(store, rows, label, cats)
+                if label in self._label_codes:
+                    labels = _codes_to_labels(labels)
+                out[label] = labels
+        return out
+
+    def enable_readahead(
+        self,
+        chunk_size: int = 1024,
+        max_cache_bytes: int = 2**30,
+        max_workers: int = 8,
+        n_chunks_ahead: int = 32,
+    ) -> None:
+        """Read chunks of rows ahead of use in background threads.
+
+        Useful with `stream=True` in :meth:`~lamindb.Collection.mapped` where every
+        read is a request to the cloud. Observations are then read in contiguous
+        chunks of rows, which are kept in a least-recently-used memory cache.
+        Pass the upcoming indices, e.g., the order of a sampler, to
+        :meth:`~lamindb.core.MappedCollection.readahead` to fetch their chunks
+        concurrently in the background.
+
+        For `.h5ad` files, background reads are serialized by `h5py`, so that
+        readahead is most effective for `.zarr` stores.
+
+        Args:
+            chunk_size: Number of rows per chunk. Ideally a multiple of the chunk
+                size of the arrays in `.zarr` stores.
+            max_cache_bytes: Maximal size of the chunks kept in memory.
+            max_workers: Maximal number of threads that fetch chunks.
+            n_chunks_ahead: Maximal number of chunks that are fetched ahead of use.
+
+        Example::
+
+            mapped = collection.mapped(obs_keys="cell_type", stream=True)
+            mapped.enable_readahead()
+            sampler = torch.utils.data.RandomSampler(mapped)
+            indices = list(sampler)
+            mapped.readahead(indices)
+            for i in range(0, len(indices), 128):
+                batch = mapped.get_batch(indices[i : i + 128])
+            mapped.readahead_stats
+        """
+        if self._readahead is not None:
+            self._readahead.close()
+        self._readahead = _Readahead(
+            self._fetch_readahead_chunk,
+            chunk_size=chunk_size,
+            max_cache_bytes=max_cache_bytes,
+            max_workers=max_workers,
+            n_chunks_ahead=n_chunks_ahead,
+        )
+
+    def readahead(self, indices: np.ndarray | list[int]) -> None:
+        """Schedule fetching the chunks of upcoming indices in the background.
+
+        Replaces previously scheduled indices. Chunks are fetched in the order in
+        which they are first needed. Requires
+        :meth:`~lamindb.core.MappedCollection.enable_readahead`.
+
+        Args:
+            indices: Integer indices of the observations in the order of use.
+        """
+        if self._readahead is None:
+            raise ValueError("Call `.enable_readahead()` first.")
+        indices = np.asarray(indices, dtype=np.int64)
+        if len(indices) == 0:
+            self._readahead.schedule([])
+            return None
+        storage_idxs = self.storage_idx[indices]
+        chunk_ids = self.indices[indices] // self._readahead.chunk_size
+        # unique chunks in the order of the first index that needs them
+        n_chunks_max = int(chunk_ids.max()) + 1
+        _, first = np.unique(storage_idxs * n_chunks_max + chunk_ids, return_index=True)
+        first.sort()
+        keys = list(zip(storage_idxs[first].tolist(), chunk_ids[first].tolist()))
+        self._readahead.schedule(keys)
+
+    @property
+    def readahead_stats(self) -> dict[str, int] | None:
+        """Counters of the readahead cache.
+
+        `"hits"` counts chunks that were cached or fetched ahead when needed,
+        `"misses"` chunks that had to be fetched on demand. `None` if
+        readahead isn't enabled.
+        """
+        if self._readahead is None:
+            return None
+        return self._readahead.stats
+
+    def _read_rows_readahead(
+        self, storage_idx: int, rows: np.ndarray
+    ) -> dict[str, np.ndarray]:
+        chunk_size = self._readahead.chunk_size  # type: ignore
+        chunk_ids = rows // chunk_size
+        # rows are sorted, so are the chunks
+        bounds = np.flatnonzero(np.diff(chunk_ids)) + 1
+        parts: dict[str, list] = {}
+        for chunk_rows in np.split(rows, bounds):
+            chunk_id = int(chunk_rows[0] // chunk_size)
+            chunk = self._readahead.get((int(storage_idx), chunk_id))  # type: ignore
+            chunk_data = self._read_store_rows(
+                chunk, storage_idx, chunk_rows - chunk_id * chunk_size
+            )
+            for key, values in chunk_data.items():
+                parts.setdefault(key, []).append(values)
+        return {key: np.concatenate(values) for key, values in parts.items()}
+
+    def _fetch_readahead_chunk(
+        self, storage_idx: int, chunk_id: int
+    ) -> _ReadaheadChunk:
+        storage = self.storages[storage_idx]
+        # h5py file handles can't be shared across threads, open a new one
+        if self.conns[storage_idx] is not None or isinstance(storage, UPath):
+            storage = UPath(self.path_list[storage_idx])
+        chunk = _ReadaheadChunk()
+        with _Connect(storage) as store:
+            X = store["X"]
+            n_rows = X.shape[0] if isinstance(X, ArrayTypes) else X.attrs["shape"][0]  # type: ignore
+            start = chunk_id * self._readahead.chunk_size  # type: ignore
+            stop = min(start + self._readahead.chunk_size, n_rows)  # type: ignore
+            for layers_key in self.layers_keys:
+                if layers_key == "X":
+                    chunk["X"] = _read_chunk(X, start, stop)
+                else:
+                    chunk.setdefault("layers", {})[layers_key] = _read_chunk(
+                        store["layers"][layers_key], start, stop
+                    )
+            if self.obsm_keys is not None:
+                for obsm_key in self.obsm_keys:
+                    chunk.setdefault("obsm", {})[obsm_key] = _read_chunk(
+                        store["obsm"][obsm_key], start, stop
+                    )
+            if self.obs_keys is not None:
+                rows = np.arange(start, stop)
+                for label in self.obs_keys:
+                    if label in self._label_codes:
+                        chunk.labels[label] = self._label_codes[label][storage_idx][
+                            start:stop
+                        ]
+                        continue
+                    if label in self._cache_cats:
+                        cats = self._cache_cats[label][storage_idx]
+                        if cats is None:
+                            cats = []
+                    else:
+                        cats = None
+                    chunk.labels[label] = self._get_obs_batch(store, rows, label, cats)
+        return chunk
+
     def _get_data_idx(
         self,
         lazy_data: ArrayType | GroupType,
@@ -442,6 +1123,84 @@ class MappedCollection:
                     lazy_data_idx = lazy_data_idx[var_idxs_join]
             return lazy_data_idx
 
+    def _get_data_batch(
+        self,
+        lazy_data: ArrayType | GroupType,
+        rows: np.ndarray,
+        join_vars: Literal["inner", "outer"] | None = None,
+        var_idxs_join: list | None = None,
+        n_vars_out: int | None = None,
+    ) -> np.ndarray:
+        """Get the data for sorted unique indices as a dense array."""
+        if isinstance(lazy_data, (*ArrayTypes, np.ndarray)):  # type: ignore
+            lazy_data_rows = _read_rows(lazy_data, rows)  # type: ignore
+            if join_vars is None:
+                result = lazy_data_rows
+                if self._dtype is not None:
+                    result = result.astype(self._dtype, copy=False)
+            elif join_vars == "outer":
+                dtype = lazy_data_rows.dtype if self._dtype is None else self._dtype
+                result = np.zeros((len(rows), n_vars_out), dtype=dtype)
+                result[:, var_idxs_join] = lazy_data_rows
+            else:  # inner join
+                result = lazy_data_rows[:, var_idxs_join]
+                if self._dtype is not None:
+                    result = result.astype(self._dtype, copy=False)
+            return result
+        else:  # assume csr_matrix here
+            data = lazy_data["data"]  # type: ignore
+            indices = lazy_data["indices"]  # type: ignore
+            indptr = lazy_data["indptr"]  # type: ignore
+            # a single read of the indptr range spanning all rows
+            indptr_rows = indptr[rows[0] : rows[-1] + 2]
+            starts = indptr_rows[rows - rows[0]]
+            ends = indptr_rows[rows - rows[0] + 1]
+            data_s, indices_s = _read_csr_rows(data, indices, starts, ends)
+            row_idxs = np.repeat(np.arange(len(rows)), ends - starts)
+            dtype = data_s.dtype if self._dtype is None else self._dtype
+            if join_vars == "outer":
+                result = np.zeros((len(rows), n_vars_out), dtype=dtype)
+                result[row_idxs, var_idxs_join[indices_s]] = data_s
+            else:
+                n_vars = lazy_data.attrs["shape"][1]  # type: ignore
+                result = np.zeros((len(rows), n_vars), dtype=dtype)
+                result[row_idxs, indices_s] = data_s
+                if join_vars == "inner":
+                    result = result[:, var_idxs_join]
+            return result
+
+    def _get_obs_batch(
+        self,
+        storage: StorageType,
+        rows: np.ndarray,
+        label_key: str,
+        categories: list | None = None,
+    ) -> np.ndarray:
+        """Get the labels for sorted unique indices by key."""
+        obs = storage["obs"]  # type: ignore
+        nans = None
+        if isinstance(obs, ArrayTypes):  # type: ignore
+            labels = _read_rows(obs, rows)[label_key]  # type: ignore
+        else:
+            labels = obs[label_key]
+            if isinstance(labels, ArrayTypes):  # type: ignore
+                labels = _read_rows(labels, rows)  # type: ignore
+            else:
+                labels = _read_rows(labels["codes"], rows)
+                nans = labels == -1
+        if categories is not None:
+            cats = categories
+        else:
+            cats = self._get_categories(storage, label_key)
+        if cats is not None and len(cats) > 0:
+            labels = np.asarray(cats[...] if hasattr(cats, "shape") else cats)[labels]
+        if len(labels) > 0 and isinstance(labels[0], bytes):
+            labels = _decode(labels)
+        if nans is not None and nans.any():
+            labels = labels.astype(object)
+            labels[nans] = np.nan
+        return labels
+
     def _get_obs_idx(
         self,
         storage: StorageType,
@@ -495,27 +1254,59 @@ class MappedCollection:
         """
         if isinstance(obs_keys, str):
             obs_keys = [obs_keys]
-        labels_list = []
-        for label_key in obs_keys:
-            labels_to_str = self.get_merged_labels(label_key).astype(str).astype("O")
-            labels_list.append(labels_to_str)
-        if len(labels_list) > 1:
-            labels = ["__".join(labels_obs) for labels_obs in zip(*labels_list)]
-        else:
-            labels = labels_list[0]
-        counter = Counter(labels)
+        combined = np.zeros(self.n_obs, dtype=np.int64)
+        names = np.array([""], dtype=object)
+        for i, label_key in enumerate(obs_keys):
+            codes, categories = self._get_merged_codes(label_key)
+            # combine the codes and keep only the observed combinations
+            uniques, combined = np.unique(
+                combined * len(categories) + codes, return_inverse=True
+            )
+            if return_categories:
+                names = names[uniques // len(categories)]
+                if i > 0:
+                    names = names + "__"
+                names = names + categories[uniques % len(categories)]
+        counts = np.bincount(combined)
         if return_categories:
-            return {
-                k: 1.0 / v if scaler is None else scaler / (v + scaler)
-                for k, v in counter.items()
-            }
-        counts = np.array([counter[label] for label in labels])
+            if scaler is None:
+                category_weights = 1.0 / counts
+            else:
+                category_weights = scaler / (counts + scaler)
+            return dict(zip(names.tolist(), category_weights.tolist()))
+        counts = counts[combined]
         if scaler is None:
             weights = 1.0 / counts
         else:
             weights = scaler / (counts + scaler)
         return weights
 
+    def _get_merged_codes(self, label_key: str) -> tuple[np.ndarray, np.ndarray]:
+        """Integer codes of the merged labels and their categories as strings."""
+        if label_key in self._label_codes:
+            codes = np.concatenate(
+                [
+                    store_codes[indices]
+                    for store_codes, indices in zip(
+                        self._label_codes[label_key], self.indices_list
+                    )
+                ]
+            ).astype(np.int64)
+            encoder = self.encoders[label_key]
+            # the encoder codes start at -1 for the unknown label
+            categories = np.array(["nan"] * (len(encoder) + 2), dtype=object)
+            for label, code in encoder.items():
+                categories[code + 1] = str(label)
+            codes = np.where(codes == _NAN_CODE, len(encoder) + 1, codes + 1)
+        else:
+            codes, uniques = pd.factorize(self.get_merged_labels(label_key))
+            # missing labels are coded as -1, which takes the last category
+            categories = np.array([str(label) for label in uniques] + ["nan"])
+            codes = np.where(codes == -1, len(uniques), codes)
+        # labels with the same string representation are counted together
+        categories, inverse = np.unique(categories.astype(str), return_inverse=True)
+        return inverse[codes], categories.astype(object)
+
     def get_merged_labels(self, label_key: str):
         """Get merged labels for `label_key` from all `.obs`."""
         labels_merge = []
@@ -578,7 +1369,7 @@ class MappedCollection:
         """Get codes."""
         obs = storage["obs"]  # type: ignore
         if isinstance(obs, ArrayTypes):  # type: ignore
-            label = obs[label_key]
+            return obs[label_key]
         else:
             label = obs[label_key]
             if isinstance(label, ArrayTypes):  # type: ignore
@@ -612,6 +1403,8 @@ class MappedCollection:
 
         No effect if `parallel=True`.
         """
+        if self._readahead is not None:
+            self._readahead.close()
         for storage in self.storages:
             if hasattr(storage, "close"):
                 storage.close()
@@ -647,3 +1440,6 @@ class MappedCollection:
         mapped.storages = []
         mapped.conns = []
         mapped._make_connections(mapped.path_list, parallel=False)
+        if mapped._readahead is not None:
+            # background threads aren't copied into worker processes
+            mapped._readahead._init_state()
@@ -118,6 +118,12 @@ class Settings:
 
     FAQ: :doc:`/faq/track-run-inputs`
     """
+    run_logs_max_bytes: int | None = None
+    """Maximal size of the log file of a run in bytes (default `None`).
+
+    If set, the log file that :func:`~lamindb.track` writes for scripts is
+    rotated when it exceeds this size so that it holds only the most recent output.
+    """
     __using_key: str | None = None
     _using_storage: str | None = None
 
@@ -20,7 +20,6 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import pandas as pd
-from anndata import read_h5ad
 from lamin_utils import logger
 from lamindb_setup import settings as setup_settings
 from lamindb_setup.core.upath import (
@@ -36,12 +35,14 @@ if TYPE_CHECKING:
 
     from lamindb.core.types import ScverseDataStructures
 
-try:
-    from ..core.storage._zarr import load_zarr
-except ImportError:
 
-    def load_zarr(storepath):  # type: ignore
-        raise ImportError("Please install zarr: pip install 'lamindb[zarr]'")
+def load_zarr(storepath: UPathStr, **kwargs) -> ScverseDataStructures:
+    """Load a `.zarr` store of an `AnnData`, `MuData` or `SpatialData` object."""
+    try:
+        from ..core.storage._zarr import load_zarr as _load_zarr
+    except ImportError:
+        raise ImportError("Please install zarr: pip install 'lamindb[zarr]'") from None
+    return _load_zarr(storepath, **kwargs)
 
 
 is_run_from_ipython = getattr(builtins, "__IPYTHON__", False)
@@ -65,6 +66,8 @@ def load_tsv(path: UPathStr, **kwargs) -> pd.DataFrame:
 
 def load_h5ad(filepath, **kwargs) -> AnnData:
     """Load an `.h5ad` file to `AnnData`."""
+    from anndata import read_h5ad
+
     fs, filepath = infer_filesystem(filepath)
     compression = kwargs.pop("compression", "infer")
     with fs.open(filepath, mode="rb", compression=compression) as file:
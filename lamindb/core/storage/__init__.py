@@ -13,8 +13,22 @@ Array accessors.
 
 from lamindb_setup.core.upath import LocalPathClasses, UPath, infer_filesystem
 
-from ._backed_access import AnnDataAccessor, BackedAccessor, SpatialDataAccessor
-from ._tiledbsoma import save_tiledbsoma_experiment
 from ._valid_suffixes import VALID_SUFFIXES
 from .objects import infer_suffix, write_to_disk
 from .paths import delete_storage
+
+# the accessors import anndata, h5py & pyarrow, only import them on access
+_LAZY_ATTRS = {
+    "AnnDataAccessor": "._backed_access",
+    "BackedAccessor": "._backed_access",
+    "SpatialDataAccessor": "._backed_access",
+    "save_tiledbsoma_experiment": "._tiledbsoma",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRS:
+        from importlib import import_module
+
+        return getattr(import_module(_LAZY_ATTRS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
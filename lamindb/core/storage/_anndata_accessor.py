@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import inspect
+import os
 from functools import cached_property
 from importlib.metadata import version as get_version
 from itertools import chain
@@ -10,7 +11,7 @@ import h5py
 import numpy as np
 import pandas as pd
 from anndata import AnnData
-from anndata._core.index import _normalize_indices
+from anndata._core.index import _normalize_indices, unpack_index
 from anndata._core.views import _resolve_idx
 from anndata._io.h5ad import read_dataframe_legacy as read_dataframe_legacy_h5
 from anndata._io.specs.registry import (
@@ -480,6 +481,156 @@ def _safer_read_index(elem):
         raise ValueError(f"Unknown elem type {type(elem)} when reading indices.")
 
 
+def _n_index_elements(elem) -> int:
+    """Get the length of the index of a dataframe without reading it."""
+    if isinstance(elem, GroupTypes):
+        index = elem[_read_attr(elem.attrs, "_index")]
+        if isinstance(index, ArrayTypes):
+            return index.shape[0]
+        # categorical index
+        return index["codes"].shape[0]
+    elif isinstance(elem, ArrayTypes):
+        return elem.shape[0]
+    else:
+        raise ValueError(f"Unknown elem type {type(elem)} when reading indices.")
+
+
+def _index_length(idx, length: int) -> int:
+    if isinstance(idx, slice):
+        return len(range(*idx.indices(length)))
+    elif isinstance(idx, (int, np.integer)):
+        return 1
+    idx = np.asarray(idx)
+    if idx.dtype == bool:
+        return int(idx.sum())
+    return len(idx)
+
+
+def _is_label_indexer(indexer) -> bool:
+    """Check whether an indexer of an axis refers to names, not positions."""
+    if isinstance(indexer, str):
+        return True
+    if isinstance(indexer, slice):
+        return isinstance(indexer.start, str) or isinstance(indexer.stop, str)
+    if isinstance(indexer, (int, np.integer, bool, np.bool_)):
+        return False
+    dtype = getattr(indexer, "dtype", None)
+    if dtype is None and isinstance(indexer, (list, tuple)):
+        dtype = np.asarray(indexer).dtype if len(indexer) > 0 else None
+    return dtype is not None and dtype.kind in {"O", "U", "S"}
+
+
+def _decode_index(values: np.ndarray) -> pd.Index:
+    if values.dtype.kind == "S":
+        values = np.char.decode(values, "utf-8")
+    return pd.Index(values, dtype=object)
+
+
+class _LazyIndex:
+    """Names of `obs` or `var` that are only read and decoded when needed.
+
+    Positional subsetting keeps track of the positions only. If `cache_path` is
+    passed, decoded names are stored in a `.npy` file that is memory-mapped,
+    so that subsets of names are read from it without loading all names.
+    """
+
+    def __init__(
+        self,
+        read: Callable[[], pd.Index],
+        length: int,
+        cache_path: UPath | None = None,
+    ):
+        self._read = read
+        self._length = length
+        self._cache_path = cache_path
+        self._index: pd.Index | None = None
+
+    @classmethod
+    def from_elem(cls, elem, cache_path: UPath | None = None) -> _LazyIndex:
+        return cls(lambda: _safer_read_index(elem), _n_index_elements(elem), cache_path)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _load_cache(self) -> np.ndarray | None:
+        if self._cache_path is None or not self._cache_path.exists():
+            return None
+        try:
+            return np.load(self._cache_path, mmap_mode="r", allow_pickle=False)
+        except (OSError, ValueError) as e:
+            logger.warning(f"could not read cached index {self._cache_path}: {e}")
+            return None
+
+    def _write_cache(self, index: pd.Index):
+        values = index.to_numpy(dtype=str)
+        try:
+            # utf-8 bytes are smaller than numpy unicode strings
+            values = np.char.encode(values, "utf-8")
+        except UnicodeEncodeError:  # pragma: no cover
+            pass
+        cache_path = self._cache_path
+        cache_path.parent.mkdir(parents=True, exist_ok=True)  # type: ignore
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")  # type: ignore
+        with tmp_path.open("wb") as f:
+            np.save(f, values, allow_pickle=False)
+        tmp_path.replace(cache_path)
+
+    def to_index(self) -> pd.Index:
+        if self._index is None:
+            cached = self._load_cache()
+            if cached is not None:
+                self._index = _decode_index(cached[:])
+            else:
+                self._index = self._read()
+                if self._cache_path is not None:
+                    self._write_cache(self._index)
+        return self._index
+
+    def subset(self, idx) -> _LazyIndex:
+        if self._index is not None:
+            index = self._index[idx]
+            return _LazyIndex(lambda: index, _index_length(idx, self._length))
+        cached = self._load_cache()
+        if cached is not None:
+
+            def read():
+                return _decode_index(cached[idx])
+        else:
+
+            def read():
+                return self.to_index()[idx]
+
+        return _LazyIndex(read, _index_length(idx, self._length))
+
+
+def _names_for_indexing(
+    index: Index, obs_names: _LazyIndex, var_names: _LazyIndex
+) -> tuple[pd.Index, pd.Index]:
+    """Only read the names of an axis if it is indexed by names."""
+    if isinstance(index, tuple) and len(index) == 1:
+        index = index[0]
+    ax0, ax1 = unpack_index(index)
+    names0 = (
+        obs_names.to_index()
+        if _is_label_indexer(ax0)
+        else pd.RangeIndex(len(obs_names))
+    )
+    names1 = (
+        var_names.to_index()
+        if _is_label_indexer(ax1)
+        else pd.RangeIndex(len(var_names))
+    )
+    return names0, names1
+
+
+def _index_cache_path(artifact: Artifact | None, attr: str) -> UPath | None:
+    if artifact is None or artifact.hash is None:
+        return None
+    from lamindb_setup import settings as setup_settings
+
+    return setup_settings.cache_dir / "anndata_index" / f"{artifact.hash}_{attr}.npy"
+
+
 class _MapAccessor:
     def __init__(self, elem, name, indices=None):
         self.elem = elem
@@ -596,11 +747,11 @@ class _AnnDataAttrsMixin:
 
     @property
     def obs_names(self):
-        return self._obs_names
+        return self._obs_names.to_index()
 
     @property
     def var_names(self):
-        return self._var_names
+        return self._var_names.to_index()
 
     @cached_property
     def shape(self):
@@ -647,8 +798,11 @@ class AnnDataAccessorSubset(_AnnDataAttrsMixin):
 
     def __getitem__(self, index: Index):
         """Access a subset of the underlying AnnData object."""
-        oidx, vidx = _normalize_indices(index, self._obs_names, self._var_names)
-        new_obs_names, new_var_names = self._obs_names[oidx], self._var_names[vidx]
+        oidx, vidx = _normalize_indices(
+            index, *_names_for_indexing(index, self._obs_names, self._var_names)
+        )
+        new_obs_names = self._obs_names.subset(oidx)
+        new_var_names = self._var_names.subset(vidx)
         if self.indices is not None:
             oidx = _resolve_idx(self.indices[0], oidx, self._ref_shape[0])
             vidx = _resolve_idx(self.indices[1], vidx, self._ref_shape[1])
@@ -695,7 +849,7 @@ class AnnDataRawAccessor(AnnDataAccessorSubset):
         var_raw = storage_raw["var"]
 
         if var_names is None:
-            var_names = _safer_read_index(var_raw)
+            var_names = _LazyIndex.from_elem(var_raw)
 
         if isinstance(ref_shape, int):
             ref_shape = ref_shape, len(var_names)
@@ -733,6 +887,7 @@ class AnnDataAccessor(_AnnDataAttrsMixin):
         storage: StorageType,
         filename: str,
         artifact: Artifact | None = None,
+        cache_index: bool = False,
     ):
         self._conn = connection
         self.storage = storage
@@ -741,8 +896,15 @@ class AnnDataAccessor(_AnnDataAttrsMixin):
 
         self._name = filename
 
-        self._obs_names = _safer_read_index(self.storage["obs"])  # type: ignore
-        self._var_names = _safer_read_index(self.storage["var"])  # type: ignore
+        # obs & var names are only read when needed, e.g., for indexing by names
+        self._obs_names = _LazyIndex.from_elem(
+            self.storage["obs"],  # type: ignore
+            _index_cache_path(artifact, "obs") if cache_index else None,
+        )
+        self._var_names = _LazyIndex.from_elem(
+            self.storage["var"],  # type: ignore
+            _index_cache_path(artifact, "var") if cache_index else None,
+        )
 
         self._artifact = artifact  # save artifact to update in write mode
 
@@ -797,8 +959,11 @@ class AnnDataAccessor(_AnnDataAttrsMixin):
 
     def __getitem__(self, index: Index) -> AnnDataAccessorSubset:
         """Access a subset of the underlying AnnData object."""
-        oidx, vidx = _normalize_indices(index, self._obs_names, self._var_names)
-        new_obs_names, new_var_names = self._obs_names[oidx], self._var_names[vidx]
+        oidx, vidx = _normalize_indices(
+            index, *_names_for_indexing(index, self._obs_names, self._var_names)
+        )
+        new_obs_names = self._obs_names.subset(oidx)
+        new_var_names = self._var_names.subset(vidx)
         return AnnDataAccessorSubset(
             self.storage,
             (oidx, vidx),
@@ -106,7 +106,10 @@ def backed_access(
         if mode not in {"r", "w"}:
             raise ValueError("`mode` should be either 'r' or 'w' for tiledbsoma.")
         return _open_tiledbsoma(objectpath, mode=mode, **kwargs)  # type: ignore
-    elif non_gz_suffix in {".h5", ".hdf5", ".h5ad"}:
+
+    # only used by AnnDataAccessor
+    cache_index = kwargs.pop("cache_index", False)
+    if non_gz_suffix in {".h5", ".hdf5", ".h5ad"}:
         conn, storage = registry.open("h5py", objectpath, mode=mode, **kwargs)
     elif suffix == ".zarr":
         if mode not in {"r", "r+"}:
@@ -131,7 +134,7 @@ def backed_access(
     if is_anndata:
         if mode != "r" and isinstance(storage, h5py.Group):
             raise ValueError("Can only access `hdf5` `AnnData` with mode='r'.")
-        return AnnDataAccessor(conn, storage, name, artifact)
+        return AnnDataAccessor(conn, storage, name, artifact, cache_index=cache_index)
     else:
         return BackedAccessor(conn, storage)
 
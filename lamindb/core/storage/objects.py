@@ -3,23 +3,24 @@ from __future__ import annotations
 from pathlib import PurePosixPath
 from typing import TYPE_CHECKING, Any, TypeAlias
 
-from anndata import AnnData
 from pandas import DataFrame
 
 from lamindb.core._compat import (
+    isinstance_if_imported,
     with_package_obj,
 )
-from lamindb.core.types import ScverseDataStructures
 
 if TYPE_CHECKING:
     from lamindb_setup.types import UPathStr
 
-SupportedDataTypes: TypeAlias = DataFrame | ScverseDataStructures
+    from lamindb.core.types import ScverseDataStructures
+
+SupportedDataTypes: TypeAlias = "DataFrame | ScverseDataStructures"
 
 
 def infer_suffix(dmem: SupportedDataTypes, format: str | dict[str, Any] | None = None):
     """Infer LaminDB storage file suffix from a data object."""
-    if isinstance(dmem, AnnData):
+    if isinstance_if_imported(dmem, "anndata", "AnnData"):
         assert not isinstance(format, dict)  # noqa: S101
         if format is not None:
             # should be `.h5ad`, `.`zarr`, or `.anndata.zarr`
@@ -75,7 +76,7 @@ def infer_suffix(dmem: SupportedDataTypes, format: str | dict[str, Any] | None =
 
 def write_to_disk(dmem: SupportedDataTypes, filepath: UPathStr, **kwargs) -> None:
     """Writes the passed in memory data to disk to a specified path."""
-    if isinstance(dmem, AnnData):
+    if isinstance_if_imported(dmem, "anndata", "AnnData"):
         suffix = PurePosixPath(filepath).suffix
         if suffix == ".h5ad":
             dmem.write_h5ad(filepath)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import TYPE_CHECKING
 
 import fsspec
@@ -21,6 +23,9 @@ if TYPE_CHECKING:
 
 
 AUTO_KEY_PREFIX = ".lamindb/"
+DELETE_MAX_WORKERS = 8
+# the number of paths per call of fs.rm(), S3 deletes at most 1000 objects per request
+DELETE_BATCH_SIZE = 1000
 
 
 # add type annotations back asap when re-organizing the module
@@ -143,6 +148,106 @@ def filepath_cache_key_from_artifact(
     return filepath, cache_key
 
 
+def filepaths_cache_keys_from_artifacts(
+    artifacts: list[Artifact], using_key: str | None = None
+) -> list[tuple[UPath, str | None]]:
+    """Like `filepath_cache_key_from_artifact()` for many artifacts.
+
+    Queries the storage locations of all artifacts at once instead of once per
+    artifact.
+    """
+    from lamindb.models import Storage
+
+    def in_default_storage(artifact: Artifact) -> bool:
+        return (
+            artifact._state.db in ("default", None)
+            and artifact.storage_id == settings._storage_settings._id
+        )
+
+    storage_ids = {
+        artifact.storage_id
+        for artifact in artifacts
+        if getattr(artifact, "_local_filepath", None) is None
+        and not in_default_storage(artifact)
+    }
+    storage_settings_by_id: dict[int, StorageSettings] = {}
+    if storage_ids:
+        db = artifacts[0]._state.db
+        if db not in ("default", None) and using_key is None:
+            storages = Storage.connect(db).filter(id__in=storage_ids)
+        else:
+            storages = Storage.objects.using(using_key).filter(id__in=storage_ids)
+        for storage in storages:
+            storage_settings_by_id[storage.id] = StorageSettings(storage.root)
+
+    filepaths_cache_keys: list[tuple[UPath, str | None]] = []
+    for artifact in artifacts:
+        if (local_filepath := getattr(artifact, "_local_filepath", None)) is not None:
+            filepaths_cache_keys.append((local_filepath.resolve(), None))
+            continue
+        if in_default_storage(artifact):
+            storage_settings = settings._storage_settings
+        else:
+            storage_settings = storage_settings_by_id[artifact.storage_id]
+        filepath = storage_settings.key_to_filepath(
+            auto_storage_key_from_artifact(artifact)
+        )
+        if isinstance(filepath, LocalPathClasses):
+            filepaths_cache_keys.append((filepath, None))
+        else:
+            cache_key = _cache_key_from_artifact_storage(artifact, storage_settings)
+            filepaths_cache_keys.append((filepath, cache_key))
+    return filepaths_cache_keys
+
+
+async def _info_files(fs: fsspec.AbstractFileSystem, paths: list[str]) -> list:
+    return await asyncio.gather(
+        *(fs._info(path) for path in paths), return_exceptions=True
+    )
+
+
+def stat_cloud_files(filepaths: list[UPath]) -> list[dict | None]:
+    """Stat cloud files, concurrently in one batch for async filesystems.
+
+    Returns `None` for files that don't exist or couldn't be stat'ed in a batch.
+    """
+    from fsspec.asyn import AsyncFileSystem, sync
+
+    stats: list[dict | None] = [None] * len(filepaths)
+    by_fs: dict[int, list[int]] = {}
+    for i, filepath in enumerate(filepaths):
+        if isinstance(filepath.fs, AsyncFileSystem):
+            by_fs.setdefault(id(filepath.fs), []).append(i)
+    for indices in by_fs.values():
+        fs = filepaths[indices[0]].fs
+        infos = sync(fs.loop, _info_files, fs, [str(filepaths[i]) for i in indices])
+        for i, info in zip(indices, infos):
+            if isinstance(info, dict):
+                stats[i] = info
+    return stats
+
+
+def is_cache_up_to_date(filepath: UPath, cloud_stat: dict, cache_path: Path) -> bool:
+    """Whether a cached file is in sync with its cloud file.
+
+    Follows the logic of `UPath.synchronize_to()` for files.
+    """
+    if cloud_stat.get("type") != "file" or not cache_path.is_file():
+        return False
+    local_stat = cache_path.stat()
+    try:
+        if filepath.protocol == "s3":
+            return int(cloud_stat["LastModified"].timestamp()) <= local_stat.st_mtime
+        elif filepath.protocol == "gs":
+            return int(cloud_stat["mtime"].timestamp()) <= local_stat.st_mtime
+        elif filepath.protocol == "hf":
+            return False
+        else:
+            return cloud_stat["size"] == local_stat.st_size
+    except (KeyError, AttributeError):
+        return False
+
+
 def store_file_or_folder(
     local_path: UPathStr, storage_path: UPath, print_progress: bool = True, **kwargs
 ) -> None:
@@ -212,3 +317,61 @@ def delete_storage(
     else:
         return "did-not-delete"
     return None
+
+
+def _delete_storage_one_by_one(storagepaths: list[UPath]) -> dict[str, Exception]:
+    failed = {}
+    for storagepath in storagepaths:
+        try:
+            delete_storage(storagepath, raise_file_not_found_error=False)
+        except Exception as e:
+            failed[str(storagepath)] = e
+    return failed
+
+
+def _delete_storage_batch(
+    fs: fsspec.AbstractFileSystem, storagepaths: list[UPath]
+) -> dict[str, Exception]:
+    try:
+        fs.rm([storagepath.path for storagepath in storagepaths], recursive=True)
+    except Exception:
+        # e.g., a path doesn't exist, delete one by one to find the failures
+        return _delete_storage_one_by_one(storagepaths)
+    return {}
+
+
+def delete_storage_paths(
+    storagepaths: list[UPath], max_workers: int = DELETE_MAX_WORKERS
+) -> dict[str, Exception]:
+    """Delete many files and folders in storage.
+
+    Local paths are deleted in parallel. Cloud paths are grouped by filesystem
+    and deleted in batches with a single `fs.rm()` call per batch.
+
+    Returns the paths that couldn't be deleted with their errors. Paths that
+    don't exist aren't considered failures.
+    """
+    local_paths: list[UPath] = []
+    by_fs: dict[int, list[UPath]] = {}
+    for storagepath in storagepaths:
+        if isinstance(storagepath, LocalPathClasses) or not isinstance(
+            storagepath, UPath
+        ):
+            local_paths.append(storagepath)
+        else:
+            by_fs.setdefault(id(storagepath.fs), []).append(storagepath)
+
+    failed: dict[str, Exception] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_delete_storage_one_by_one, [local_path])
+            for local_path in local_paths
+        ]
+        for fs_paths in by_fs.values():
+            fs = fs_paths[0].fs
+            for i in range(0, len(fs_paths), DELETE_BATCH_SIZE):
+                batch = fs_paths[i : i + DELETE_BATCH_SIZE]
+                futures.append(executor.submit(_delete_storage_batch, fs, batch))
+        for future in as_completed(futures):
+            failed.update(future.result())
+    return failed
@@ -6,6 +6,14 @@ class AnnotationSettings:
 
     The number is calculated per feature for labels, and per schema for features.
     """
+    cache_registry_values: bool = False
+    """Cache field values & synonyms of registries in memory during validation (default `False`).
+
+    If `True`, :meth:`~lamindb.models.CanCurate.inspect` and :meth:`~lamindb.models.CanCurate.validate`
+    load the values of a field of a registry once and look up subsequent calls in memory.
+
+    The cache is cleared whenever records of the registry are saved or deleted in this process.
+    """
 
 
 annotation_settings = AnnotationSettings()
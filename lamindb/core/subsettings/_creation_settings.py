@@ -13,6 +13,17 @@ class CreationSettings:
 
     It speeds up file creation by about a factor 100.
     """
+    artifact_upload_max_workers: int = 8
+    """Maximal number of concurrent uploads when saving many artifacts with :func:`~lamindb.save` (default `8`).
+
+    Set to `1` to upload artifacts one after another.
+    """
+    artifact_hash_max_workers: int | None = None
+    """Maximal number of threads hashing files in :meth:`~lamindb.Artifact.from_dir` (default `None`).
+
+    If `None`, uses 8 threads for directories of at least 64 MB and hashes smaller
+    directories one file after another. Set to `1` to always hash files one after another.
+    """
     artifact_silence_missing_run_warning: bool = False
     """Silence warning about missing run & transform during artifact creation (default `False`)."""
     _artifact_use_virtual_keys: bool = True
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, TypeVar
 
-from anndata import AnnData
 from lamindb_setup.types import UPathStr
 
 from lamindb.base.types import (
@@ -16,4 +15,16 @@ from lamindb.base.types import (
 MuData = TypeVar("MuData")
 SpatialData = TypeVar("SpatialData")
 
-ScverseDataStructures = AnnData | MuData | SpatialData
+if TYPE_CHECKING:
+    from anndata import AnnData
+
+    ScverseDataStructures = AnnData | MuData | SpatialData
+
+
+def __getattr__(name: str):
+    # avoid importing anndata on import of lamindb
+    if name == "ScverseDataStructures":
+        from anndata import AnnData
+
+        return AnnData | MuData | SpatialData
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import copy
 import re
+from collections import defaultdict
 from typing import TYPE_CHECKING, Any, Callable
 
 import lamindb_setup as ln_setup
@@ -1893,6 +1894,40 @@ def get_current_filter_kwargs(
     return filter_kwargs
 
 
+def save_artifact_schemas(artifact: Artifact, schemas_by_slot: dict[str, Schema]):
+    """Save the schemas of slots and link them to the artifact in bulk."""
+    from ..models.save import bulk_create
+    from ..models.schema import ArtifactSchema
+
+    if not schemas_by_slot:
+        return None
+    for schema in schemas_by_slot.values():
+        # schemas that were returned by hash already exist
+        if schema._state.adding:
+            schema.save()
+    links_by_slot = {
+        link.slot: link
+        for link in ArtifactSchema.objects.filter(
+            artifact=artifact, slot__in=list(schemas_by_slot)
+        )
+    }
+    new_links = []
+    updated_links = []
+    for slot, schema in schemas_by_slot.items():
+        link = links_by_slot.get(slot)
+        if link is None:
+            new_links.append(
+                ArtifactSchema(artifact=artifact, slot=slot, schema=schema)
+            )
+        elif link.schema_id != schema.id:
+            link.schema = schema
+            updated_links.append(link)
+    if new_links:
+        bulk_create(new_links)
+    if updated_links:
+        ArtifactSchema.objects.bulk_update(updated_links, ["schema"])
+
+
 def annotate_artifact(
     artifact: Artifact,
     *,
@@ -1900,13 +1935,14 @@ def annotate_artifact(
     cat_vectors: dict[str, CatVector] | None = None,
 ) -> Artifact:
     from .. import settings
-    from ..models.artifact import add_labels
-    from ..models.schema import ArtifactSchema
+    from ..models.artifact import get_features_labels
 
     if cat_vectors is None:
         cat_vectors = {}
 
-    # annotate with labels
+    # annotate with labels, gather the links of all features to save them in
+    # one bulk insert per link model
+    features_labels: dict[str, list] = defaultdict(list)
     for key, cat_vector in cat_vectors.items():
         if (
             cat_vector._registry == Feature
@@ -1920,14 +1956,18 @@ def annotate_artifact(
                 f"not annotating with {len(cat_vector.records)} labels for feature {key} as it exceeds {settings.annotation.n_max_records} (ln.settings.annotation.n_max_records)"
             )
             continue
-        add_labels(
-            artifact,
-            records=cat_vector.records,
-            feature=cat_vector.feature,
-            from_curator=True,
-        )
+        records = list(cat_vector.records)
+        if len(records) == 0:
+            continue
+        for registry_name, links in get_features_labels(
+            artifact, records, cat_vector.feature, from_curator=True
+        ).items():
+            features_labels[registry_name] += links
+    if features_labels:
+        artifact.features._add_label_feature_links(features_labels)
 
     # annotate with inferred schemas aka feature sets
+    schemas_by_slot: dict[str, Schema] = {}
     if (
         artifact.otype == "DataFrame" and getattr(curator, "_schema", None) is None
     ):  # Prevent overwriting user-defined schemas that contain slots
@@ -1956,12 +1996,7 @@ def annotate_artifact(
                     else parse_cat_dtype(artifact.schema.itype, is_itype=True)["field"]
                 )
                 feature_set = Schema(itype=itype, n_members=len(features))
-
-            ArtifactSchema.objects.update_or_create(
-                artifact=artifact,
-                slot="columns",
-                defaults={"schema": feature_set.save()},
-            )
+            schemas_by_slot["columns"] = feature_set
 
     else:
         for slot, slot_curator in curator._slots.items():
@@ -2002,9 +2037,8 @@ def annotate_artifact(
                     )["field"]
                 )
                 feature_set = Schema(itype=itype, n_members=len(features))
-            ArtifactSchema.objects.update_or_create(
-                artifact=artifact, slot=slot, defaults={"schema": feature_set.save()}
-            )
+            schemas_by_slot[slot] = feature_set
+    save_artifact_schemas(artifact, schemas_by_slot)
 
     slug = ln_setup.settings.instance.slug
     if ln_setup.settings.instance.is_remote:  # pdagma: no cover
@@ -16,11 +16,19 @@ Modules
    lightning
 """
 
-from lamindb.core.storage import save_tiledbsoma_experiment
-
 from ._croissant import curate_from_croissant
 from ._vitessce import save_vitessce_config
 
+
+def __getattr__(name: str):
+    # imports tiledbsoma & anndata
+    if name == "save_tiledbsoma_experiment":
+        from lamindb.core.storage import save_tiledbsoma_experiment
+
+        return save_tiledbsoma_experiment
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "lightning",
     "save_tiledbsoma_experiment",
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import NamedTuple
+
+from django.db import connections
+from lamindb_setup import settings as setup_settings
+
+# seconds after which the metadata of a connected instance is resolved again
+INSTANCE_METADATA_TTL = 3600
+
+
+class ConnectedInstance(NamedTuple):
+    using: str | None  # `None` if the instance is the current instance
+    modules: set[str]
+    registries: set[str]  # the registries and module namespaces of `DB` objects
+    connected_at: float
+    current_instance: str  # the slug of the current instance when connecting
+
+
+class InstanceConnections:
+    """Process-wide registry of the connections to other instances.
+
+    Resolving an instance may call the hub and writes cache files, so the
+    connection alias and the modules of an instance are cached for `ttl`
+    seconds. Aliases that already have Django connection settings are reused
+    without resolving the instance again. The database connections themselves
+    are persistent Django connections with health checks, see
+    `add_db_connection()`.
+    """
+
+    def __init__(self, ttl: float = INSTANCE_METADATA_TTL):
+        self.ttl = ttl
+        self._instances: dict[str, ConnectedInstance] = {}
+        self._lock = threading.Lock()
+        self.n_connects = 0
+        self.n_reuses: dict[str, int] = {}
+
+    def get(self, instance: str) -> ConnectedInstance | None:
+        """The cached connection of an instance, `None` if missing or expired."""
+        connected = self._instances.get(instance)
+        if connected is None:
+            return None
+        if (
+            time.monotonic() - connected.connected_at > self.ttl
+            or connected.current_instance != setup_settings.instance.slug
+        ):
+            with self._lock:
+                self._instances.pop(instance, None)
+            return None
+        return connected
+
+    def connect(self, instance: str) -> ConnectedInstance:
+        """Connect to an instance or reuse its connection."""
+        if (connected := self.get(instance)) is not None:
+            with self._lock:
+                self.n_reuses[instance] = self.n_reuses.get(instance, 0) + 1
+            return connected
+
+        if instance in connections.settings:
+            # the connection was added before, e.g., before the metadata expired
+            # or the instance was closed, reuse it without resolving it again
+            from ._relations import _load_schema_modules
+
+            using, modules = instance, _load_schema_modules(instance)
+        else:
+            from .sqlrecord import connect_instance_db
+
+            using, modules = connect_instance_db(instance)
+        connected = ConnectedInstance(
+            using=using,
+            modules=set(modules),
+            registries=_available_registries(modules),
+            connected_at=time.monotonic(),
+            current_instance=setup_settings.instance.slug,
+        )
+        with self._lock:
+            self._instances[instance] = connected
+            self.n_connects += 1
+        return connected
+
+    def close(self, instance: str | None = None) -> None:
+        """Close the connection to an instance or all instances."""
+        with self._lock:
+            if instance is None:
+                instances = list(self._instances)
+            else:
+                instances = [instance]
+            closed = [self._instances.pop(i, None) for i in instances]
+        for connected in closed:
+            # keeps the connection settings, other `DB` objects, query sets and
+            # records of the instance reconnect on their next query
+            if connected is not None and connected.using is not None:
+                connections[connected.using].close()
+
+    def stats(self) -> dict[str, int]:
+        """Counters of connections and their reuses."""
+        return {
+            "connected": len(self._instances),
+            "connects": self.n_connects,
+            "reuses": sum(self.n_reuses.values()),
+        }
+
+
+def _available_registries(modules: list[str] | set[str]) -> set[str]:
+    import lamindb
+
+    registries = {
+        name
+        for name in lamindb.__all__
+        if hasattr(getattr(lamindb, name, None), "connect")
+    }
+    return registries | ({"bionty", "wetlab"} & set(modules))
+
+
+instance_connections = InstanceConnections()
+
+
+def warmup_connections(*instances: str) -> None:
+    """Connect to instances ahead of querying them.
+
+    Resolves the metadata of the instances and opens their database
+    connections so that the first query doesn't pay for it.
+
+    Args:
+        instances: Instance identifiers of form "account_handle/instance_name".
+
+    Examples:
+
+        ::
+
+            from lamindb.core import warmup_connections
+
+            warmup_connections("laminlabs/cellxgene", "laminlabs/lamindata")
+    """
+    for instance in instances:
+        connected = instance_connections.connect(instance)
+        if connected.using is not None:
+            connections[connected.using].ensure_connection()
+
+
+def close_connections(*instances: str) -> None:
+    """Close the connections to instances.
+
+    Args:
+        instances: Instance identifiers of form "account_handle/instance_name".
+            Closes the connections to all instances if not passed.
+    """
+    if not instances:
+        instance_connections.close()
+    for instance in instances:
+        instance_connections.close(instance)
+
+
+def connection_stats() -> dict[str, int]:
+    """Counters of the connections to other instances.
+
+    Returns a dictionary with the number of `connected` instances, the number
+    of times an instance was resolved (`connects`) and the number of times a
+    connection was reused (`reuses`).
+    """
+    return instance_connections.stats()
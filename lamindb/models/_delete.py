@@ -0,0 +1,372 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db import models, transaction
+from django.db.models import Q
+from django.db.models.functions import Substr
+from lamin_utils import colors, logger
+from lamindb_setup import settings as setup_settings
+
+from ._is_versioned import IsVersioned
+from .sqlrecord import check_storage_is_managed
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from lamindb_setup.core.upath import UPath
+
+    from .artifact import Artifact
+    from .query_set import BasicQuerySet
+    from .sqlrecord import Registry, SQLRecord
+
+# the number of ids per `__in` query, keeps them below the limits for query
+# parameters of SQLite and Postgres
+DELETE_BATCH_SIZE = 5000
+
+TRASH_BRANCH_ID = -1
+
+
+def _batches(values: list) -> Iterable[list]:
+    for i in range(0, len(values), DELETE_BATCH_SIZE):
+        yield values[i : i + DELETE_BATCH_SIZE]
+
+
+def _versions(registry: Registry, db: str, stem_uids: list[str]) -> BasicQuerySet:
+    """The records of version families across all branches."""
+    return (
+        registry.objects.using(db)
+        .annotate(uid_stem=Substr("uid", 1, registry._len_stem_uid))
+        .filter(uid_stem__in=stem_uids)
+    )
+
+
+def _promote_latest_versions(
+    registry: Registry, records: list[SQLRecord], db: str
+) -> int:
+    """Make the newest remaining version of each version family the latest version.
+
+    Like `delete_record()` for many records: versions in the trash or among the
+    trashed records aren't candidates for the new latest version.
+    """
+    trashed_ids = {record.id for record in records}
+    latest_by_stem_uid = {
+        record.stem_uid: record
+        for record in records
+        if record.is_latest and not getattr(record, "_overwrite_versions", False)
+    }
+    new_latest_ids: list[int] = []
+    old_latest_ids: list[int] = []
+    for stem_uids in _batches(list(latest_by_stem_uid)):
+        candidates = (
+            registry.objects.using(db)
+            .annotate(uid_stem=Substr("uid", 1, registry._len_stem_uid))
+            .filter(uid_stem__in=stem_uids, is_latest=False)
+            .exclude(branch_id=TRASH_BRANCH_ID)
+            .order_by("-created_at")
+            .values_list("id", "uid_stem")
+        )
+        promoted: set[str] = set()
+        for id, stem_uid in candidates:
+            if id in trashed_ids or stem_uid in promoted:
+                continue
+            promoted.add(stem_uid)
+            new_latest_ids.append(id)
+            old_latest_ids.append(latest_by_stem_uid[stem_uid].id)
+    # unset the old latest versions first to never have two latest versions
+    for ids in _batches(old_latest_ids):
+        registry.objects.using(db).filter(id__in=ids).update(is_latest=False)
+    for ids in _batches(new_latest_ids):
+        registry.objects.using(db).filter(id__in=ids).update(is_latest=True)
+    return len(new_latest_ids)
+
+
+def _move_to_trash(registry: Registry, records: list[SQLRecord], db: str) -> None:
+    with transaction.atomic(using=db):
+        n_promoted = 0
+        if issubclass(registry, IsVersioned):
+            n_promoted = _promote_latest_versions(registry, records, db)
+        for ids in _batches([record.id for record in records]):
+            registry.objects.using(db).filter(id__in=ids).update(
+                branch_id=TRASH_BRANCH_ID
+            )
+    logger.important(f"moved {len(records)} {registry.__name__} records to trash")
+    if n_promoted:
+        logger.important_hint(f"set a new latest version for {n_promoted} records")
+
+
+def _plan_storage_deletion(
+    artifacts: list[Artifact],
+    db: str,
+    storage: bool | None,
+    interactive: bool,
+    using_key: str | None,
+) -> tuple[list[Artifact], list[UPath]]:
+    """The artifacts to delete and the paths to delete in storage.
+
+    Follows `delete_permanently()`: deleting the latest version of an artifact
+    with `overwrite_versions=True` deletes all its versions and their store,
+    deleting a previous version keeps the store.
+    """
+    from lamindb.core.storage.paths import filepaths_cache_keys_from_artifacts
+
+    from .artifact import Artifact
+
+    stem_uids = [
+        artifact.stem_uid
+        for artifact in artifacts
+        if artifact._overwrite_versions and artifact.is_latest
+    ]
+    other_versions: list[Artifact] = []
+    if stem_uids:
+        logger.important(
+            f"deleting all versions of {len(stem_uids)} artifacts because they all share the same store"
+        )
+        ids = {artifact.id for artifact in artifacts}
+        for batch in _batches(stem_uids):
+            other_versions += [
+                version
+                for version in _versions(Artifact, db, batch)
+                if version.id not in ids
+            ]
+    try:
+        paths = [
+            path
+            for path, _ in filepaths_cache_keys_from_artifacts(artifacts, using_key)
+        ]
+    except OSError:
+        # we can still delete the records
+        logger.warning("Could not get paths")
+        return artifacts + other_versions, []
+
+    delete_paths: dict[str, UPath] = {}
+    keep_paths: dict[str, UPath] = {}
+    semantic_paths: dict[str, UPath] = {}
+    ignores_storage = False
+    for artifact, path in zip(artifacts, paths):
+        # by default do not delete storage if deleting only a previous version
+        # and the underlying store is mutable
+        if artifact._overwrite_versions and not artifact.is_latest:
+            target = keep_paths
+            ignores_storage = bool(storage)
+        elif artifact.key is None or (
+            artifact._key_is_virtual and artifact._real_key is None
+        ):
+            # do not ask for confirmation also if storage is None
+            target = delete_paths if storage is None or storage else keep_paths
+        elif storage is None:
+            target = semantic_paths
+        else:
+            target = delete_paths if storage else keep_paths
+        target[str(path)] = path
+    if ignores_storage:
+        logger.warning(
+            "storage argument is ignored; can't delete store of a previous version if overwrite_versions is True"
+        )
+    if semantic_paths:
+        # the wording here is critical to avoid accidental deletions
+        message = (
+            f"{len(semantic_paths)} artifacts have semantic storage keys, e.g., "
+            f"{next(iter(semantic_paths))}."
+        )
+        if not interactive:
+            raise ValueError(
+                f"{message} Pass `storage=True` or `storage=False` to decide whether "
+                "to delete their data in storage."
+            )
+        response = input(
+            f"{message} Do you ALSO want to delete their data in storage? (y/n) You can't undo"
+            " this action."
+        )
+        if response == "y":
+            delete_paths.update(semantic_paths)
+        else:
+            keep_paths.update(semantic_paths)
+    # a store shared by versions that are kept and deleted is deleted
+    for path in delete_paths:
+        keep_paths.pop(path, None)
+    if keep_paths:
+        logger.important(
+            f"{len(keep_paths)} files/folders remain in storage, e.g., here: "
+            f"{next(iter(keep_paths))}"
+        )
+    return artifacts + other_versions, list(delete_paths.values())
+
+
+def _delete_rows(registry: Registry, db: str, ids: list[int]) -> None:
+    for batch in _batches(ids):
+        # Django's delete, which cascades, rather than `BasicQuerySet.delete()`
+        models.QuerySet.delete(registry.objects.using(db).filter(id__in=batch))
+
+
+def _delete_run_artifacts(
+    run_ids: list[int], db: str, interactive: bool, using_key: str | None
+) -> None:
+    """Like `delete_run_artifacts()` for many runs."""
+    from .artifact import Artifact
+    from .run import Run
+
+    artifact_ids: set[int] = set()
+    for batch in _batches(run_ids):
+        runs = Run.objects.using(db).filter(id__in=batch)
+        for environment_id, report_id in runs.values_list(
+            "environment_id", "report_id"
+        ):
+            artifact_ids.update({environment_id, report_id})
+        runs.update(environment=None, report=None)
+    artifact_ids.discard(None)  # type: ignore
+    # only delete artifacts that aren't attached to other runs
+    in_use: set[int] = set()
+    for batch in _batches(list(artifact_ids)):
+        for environment_id, report_id in (
+            Run.objects.using(db)
+            .filter(Q(environment_id__in=batch) | Q(report_id__in=batch))
+            .values_list("environment_id", "report_id")
+        ):
+            in_use.update({environment_id, report_id})
+    for batch in _batches(list(artifact_ids - in_use)):
+        delete_records(
+            Artifact.objects.using(db).filter(id__in=batch),
+            permanent=True,
+            interactive=interactive,
+            using_key=using_key,
+        )
+
+
+def _delete_permanently(
+    registry: Registry,
+    records: list[SQLRecord],
+    db: str,
+    storage: bool | None,
+    interactive: bool,
+    using_key: str | None,
+) -> None:
+    from lamindb.core.storage.paths import delete_storage_paths
+
+    from .project import TransformProject
+    from .run import Run
+
+    name = registry.__name__
+    paths: list[UPath] = []
+    if name == "Artifact":
+        records, paths = _plan_storage_deletion(
+            records,  # type: ignore
+            db,
+            storage,
+            interactive,
+            using_key,
+        )
+    ids = [record.id for record in records]
+    if name == "Run":
+        _delete_run_artifacts(ids, db, interactive, using_key)
+    elif name == "Transform":
+        run_ids = []
+        for batch in _batches(ids):
+            run_ids += list(
+                Run.objects.using(db)
+                .filter(transform_id__in=batch)
+                .values_list("id", flat=True)
+            )
+        _delete_run_artifacts(run_ids, db, interactive, using_key)
+        # CASCADE doesn't do the job because run_id might be protected through
+        # run__transform, hence, proactively delete the label links
+        for batch in _batches(ids):
+            models.QuerySet.delete(
+                TransformProject.objects.using(db).filter(transform_id__in=batch)
+            )
+    # only delete in storage if DB delete is successful
+    # DB delete might error because of a foreign key constraint violated etc.
+    n_promoted = 0
+    with transaction.atomic(using=db):
+        if issubclass(registry, IsVersioned):
+            # like `delete_record()`, records in the trash are no latest versions
+            n_promoted = _promote_latest_versions(
+                registry,
+                [record for record in records if record.branch_id > TRASH_BRANCH_ID],
+                db,
+            )
+        _delete_rows(registry, db, ids)
+    logger.important(f"deleted {len(ids)} {name} records")
+    if n_promoted:
+        logger.important_hint(f"set a new latest version for {n_promoted} records")
+    if not paths:
+        return
+    failed = delete_storage_paths(paths)
+    n_deleted = len(paths) - len(failed)
+    if n_deleted:
+        logger.success(f"deleted {n_deleted} files/folders in storage")
+    if failed:
+        failures = "\n".join(
+            f"    {colors.yellow(path)}: {error}" for path, error in failed.items()
+        )
+        logger.warning(
+            f"could not delete {len(failed)} files/folders in storage:\n{failures}"
+        )
+
+
+def delete_records(
+    queryset: BasicQuerySet,
+    permanent: bool | None = None,
+    storage: bool | None = None,
+    interactive: bool = True,
+    using_key: str | None = None,
+) -> None:
+    """Trash or permanently delete the records of a query set in bulk.
+
+    Records that aren't in the trash are moved there with a single update unless
+    `permanent=True`. Records in the trash are deleted permanently with set-based
+    queries, the data of artifacts is deleted in storage afterwards.
+
+    Args:
+        queryset: Artifacts, collections, runs or transforms.
+        permanent: See `BasicQuerySet.delete()`.
+        storage: See `Artifact.delete()`.
+        interactive: Whether to prompt for confirmations. If `False`, raises
+            instead of prompting.
+        using_key: The database to look up storage locations of artifacts.
+    """
+    registry = queryset.model
+    db = queryset.db
+    records = list(queryset)
+    if not records:
+        return None
+    name = registry.__name__
+    if name == "Artifact" and (storage or storage is None):
+        # this first check means an invalid delete fails fast rather than cascading
+        # through database and storage permission errors
+        from .storage import Storage
+
+        storage_ids = {record.storage_id for record in records}
+        unmanaged = (
+            Storage.objects.using(db)
+            .filter(id__in=storage_ids)
+            .exclude(instance_uid=setup_settings.instance.uid)
+            .first()
+        )
+        if unmanaged is not None:
+            check_storage_is_managed(unmanaged)
+
+    if permanent is True:
+        to_trash, to_delete = [], records
+    else:
+        to_trash = [r for r in records if r.branch_id > TRASH_BRANCH_ID]
+        to_delete = [r for r in records if r.branch_id <= TRASH_BRANCH_ID]
+        if permanent is False:
+            to_delete = []
+        elif to_delete:
+            message = f"{len(to_delete)} {name} records are already in trash!"
+            if not interactive:
+                raise ValueError(
+                    f"{message} Pass `permanent=True` to delete them from your database."
+                )
+            response = input(
+                f"{message} Are you sure you want to delete them from your"
+                " database? You can't undo this action. (y/n) "
+            )
+            if response != "y":
+                to_delete = []
+    if to_trash:
+        _move_to_trash(registry, to_trash, db)
+    if to_delete:
+        _delete_permanently(registry, to_delete, db, storage, interactive, using_key)
+    return None
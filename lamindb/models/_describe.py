@@ -4,7 +4,6 @@ import re
 from types import SimpleNamespace
 from typing import TYPE_CHECKING
 
-from django.db import connections
 from lamin_utils import colors, logger
 from rich.table import Column, Table
 from rich.text import Text
@@ -590,11 +589,9 @@ def describe_sqlite(record):
 
 def describe_postgres_sqlite(record, return_str: bool = False) -> str | None:
     from ._describe import format_rich_tree
+    from ._django import supports_json_aggregation
 
-    if (
-        not record._state.adding
-        and connections[record._state.db].vendor == "postgresql"
-    ):
+    if not record._state.adding and supports_json_aggregation(record._state.db):
         tree = describe_postgres(record)
     else:
         tree = describe_sqlite(record)
@@ -3,8 +3,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from django.contrib.postgres.aggregates import ArrayAgg
-from django.db import connection
-from django.db.models import CharField, F, OuterRef, Q, Subquery
+from django.db import connections
+from django.db.models import Aggregate, CharField, F, JSONField, OuterRef, Q, Subquery
 from django.db.models.fields.related import ForeignKey, ManyToManyField
 from django.db.models.fields.reverse_related import ManyToManyRel, ManyToOneRel
 from django.db.models.functions import JSONObject
@@ -62,6 +62,31 @@ def patch_many_to_many_descriptor() -> None:
     ManyToManyDescriptor.__get__ = patched_get
 
 
+class JSONGroupArray(Aggregate):
+    """SQLite counterpart of `ArrayAgg` for JSON values."""
+
+    function = "JSON_GROUP_ARRAY"
+    allow_distinct = True
+    output_field = JSONField()
+
+
+def supports_json_aggregation(using: str | None) -> bool:
+    """Whether related data can be aggregated into JSON in a single query."""
+    db_connection = connections[using or "default"]
+    if db_connection.vendor == "postgresql":
+        return True
+    return (
+        db_connection.vendor == "sqlite" and db_connection.features.supports_json_field
+    )
+
+
+def json_array_agg(expression, using: str | None, **extra) -> Aggregate:
+    """Aggregate JSON values into an array on Postgres and SQLite."""
+    if connections[using or "default"].vendor == "postgresql":
+        return ArrayAgg(expression, **extra)
+    return JSONGroupArray(expression, **extra)
+
+
 def get_related_model(model, field_name):
     try:
         field = model._meta.get_field(field_name)
@@ -128,9 +153,6 @@ def get_artifact_or_run_with_related(
         )
     )
 
-    # Clear previous queries
-    connection.queries_log.clear()
-
     annotations = {}
 
     if include_fk:
@@ -209,7 +231,7 @@ def get_artifact_or_run_with_related(
                 )
             )
             .values(entity_field_name)
-            .annotate(json_agg=ArrayAgg("data"))
+            .annotate(json_agg=json_array_agg("data", record._state.db))
             .values("json_agg")
         )
 
@@ -224,7 +246,7 @@ def get_artifact_or_run_with_related(
                 )
             )
             .values(entity_field_name)
-            .annotate(json_agg=ArrayAgg("data"))
+            .annotate(json_agg=json_array_agg("data", record._state.db))
             .values("json_agg")
         )
 
@@ -301,9 +323,6 @@ def get_collection_with_related(
         if f.is_relation and f.related_model.__get_module_name__() in schema_modules
     ]
 
-    # Clear previous queries
-    connection.queries_log.clear()
-
     annotations = {}
 
     if include_fk:
@@ -373,8 +392,9 @@ def get_schema_m2m_relations(artifact: Artifact, slot_schema: dict, limit: int =
             )[:limit]
         )
 
-        annotations[f"m2mfield_{name}"] = ArrayAgg(
+        annotations[f"m2mfield_{name}"] = json_array_agg(
             JSONObject(id=F(f"{name}__id"), name=F(f"{name}__{name_field}")),
+            artifact._state.db,
             filter=Q(
                 **{
                     f"{name}__id__in": limited_related,
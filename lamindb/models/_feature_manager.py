@@ -1,7 +1,7 @@
 # ruff: noqa: TC004
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import Counter, defaultdict
 from collections.abc import Iterable
 from datetime import date, datetime
 from itertools import compress
@@ -42,7 +42,7 @@ from ._describe import (
     describe_header,
     format_rich_tree,
 )
-from ._django import get_artifact_or_run_with_related
+from ._django import get_artifact_or_run_with_related, supports_json_aggregation
 from ._label_manager import _get_labels
 from ._relations import (
     dict_related_model_to_related_name,
@@ -113,13 +113,19 @@ def get_schema_links(host: Artifact | Collection) -> BasicQuerySet:
     return links_schema
 
 
-def get_link_attr(link: IsLink | type[IsLink], data: Artifact | Collection) -> str:
+def get_link_attr(
+    link: IsLink | type[IsLink],
+    data: Artifact | Collection | type[Artifact | Collection],
+) -> str:
     link_model_name = link.__class__.__name__
     if link_model_name in {"Registry", "ModelBase"}:  # we passed the type of the link
         link_model_name = link.__name__  # type: ignore
     if link_model_name.startswith("Record") or link_model_name == "ArtifactArtifact":
         return "value"
-    return link_model_name.replace(data.__class__.__name__, "").lower()
+    data_model_name = (
+        data.__name__ if isinstance(data, type) else data.__class__.__name__
+    )
+    return link_model_name.replace(data_model_name, "").lower()
 
 
 def strip_cat(feature_dtype: str) -> str:
@@ -402,7 +408,7 @@ def get_features_data(
     schema_data: dict[str, tuple[str, list[str]]] = {}
     feature_data: dict[str, tuple[str, list[str]]] = {}
     if not to_dict and isinstance(self, Artifact):
-        if self.id is not None and connections[self._state.db].vendor == "postgresql":
+        if self.id is not None and supports_json_aggregation(self._state.db):
             if not related_data:
                 artifact_meta = get_artifact_or_run_with_related(
                     self,
@@ -460,7 +466,7 @@ def get_features_data(
     # categorical feature values
     # Get the categorical data using the appropriate method
     # e.g. categoricals = {('tissue', 'cat[bionty.Tissue.ontology_id]'): {'brain'}, ('cell_type', 'cat[bionty.CellType]'): {'neuron'}}
-    if not self._state.adding and connections[self._state.db].vendor == "postgresql":
+    if not self._state.adding and supports_json_aggregation(self._state.db):
         categoricals = get_categoricals_postgres(
             self,
             related_data=related_data,
@@ -884,6 +890,223 @@ def filter_with_features(
     return qs
 
 
+def _is_missing(value: Any) -> bool:
+    return value is None or (pd.api.types.is_scalar(value) and pd.isna(value))
+
+
+def _check_and_convert_value(feature: Feature, value: Any) -> Any:
+    """Check a value against the dtype of a feature and convert it for storage."""
+    from ..base.dtypes import is_iterable_of_sqlrecord
+
+    inferred_type, converted_value, _ = infer_feature_type_convert_json(
+        feature.name,
+        value,
+        mute=True,
+    )
+    dtype_str = feature._dtype_str
+    if dtype_str == "num" or dtype_str == "list[num]":
+        if not ("int" in inferred_type or "float" in inferred_type):
+            raise TypeError(
+                f"Value for feature '{feature.name}' with dtype {dtype_str} must be a number, but is {value} with dtype {inferred_type}"
+            )
+    elif dtype_str.startswith("cat"):
+        if inferred_type != "?":
+            if not (
+                inferred_type.startswith("cat")
+                or inferred_type == "list[cat ? str]"
+                or isinstance(value, SQLRecord)
+                or is_iterable_of_sqlrecord(value)
+            ):
+                raise TypeError(
+                    f"Value for feature '{feature.name}' with dtype '{dtype_str}' must be a string or record, but is {value} with dtype {inferred_type}"
+                )
+    elif (
+        (dtype_str == "str" and inferred_type != "cat ? str")
+        or (dtype_str == "list[str]" and inferred_type != "list[cat ? str]")
+        or (
+            dtype_str.startswith("list[cat")
+            and not inferred_type.startswith("list[cat")
+        )
+        or (
+            dtype_str not in {"str", "list[str]"}
+            and not dtype_str.startswith("list[cat")
+            and dtype_str != inferred_type
+        )
+    ):
+        raise ValidationError(
+            f"Expected dtype for '{feature.name}' is '{dtype_str}', got '{inferred_type}'"
+        )
+    return converted_value
+
+
+def _label_records_from_value(value: SQLRecord | Iterable[SQLRecord]) -> list:
+    label_records = [value] if isinstance(value, SQLRecord) else list(value)
+    for record in label_records:
+        if record._state.adding:
+            raise ValidationError(f"Please save {record} before annotation.")
+    return label_records
+
+
+def _get_cat_dtype_result(feature: Feature) -> dict[str, Any]:
+    if feature._dtype_str == "cat":
+        feature._dtype_str = feature._dtype_str + "[ULabel]"
+        feature.save()
+        return {
+            "registry_str": "ULabel",
+            "registry": ULabel,
+            "field_str": "name",
+            "field": ULabel.name,
+        }
+    return parse_dtype(feature._dtype_str)[0]
+
+
+def _get_label_records_by_value(
+    result: dict[str, Any], values: list
+) -> tuple[dict[Any, list[SQLRecord]], list]:
+    """Look up label records for values of a categorical dtype.
+
+    Returns the label records by value and the values that could not be validated.
+    """
+    from .can_curate import CanCurate
+
+    registry = result["registry"]
+    field_str = result["field_str"]
+    values = list(dict.fromkeys(values))
+    not_validated = []
+    if issubclass(registry, CanCurate):
+        validated = registry.validate(values, field=result["field"], mute=True)
+        values_array = np.array(values)
+        not_validated = values_array[~validated].tolist()
+        label_records = registry.from_values(
+            values_array[validated], field=result["field"], mute=True
+        )
+    else:
+        label_records = registry.filter(**{f"{field_str}__in": values})
+        if len(label_records) != len(values):
+            raise ValidationError(
+                f"Some of these values for {result['registry_str']} do not exist: {values}"
+            )
+    label_records_by_value = defaultdict(list)
+    for label_record in label_records:
+        label_records_by_value[getattr(label_record, field_str)].append(label_record)
+    return label_records_by_value, not_validated
+
+
+def _raise_not_validated_values(
+    not_validated_values: dict[tuple[str, str], list[str]],
+) -> None:
+    """Raise for values by (registry_str, field_str) that aren't in their registry."""
+    hint = ""
+    n_fields = Counter(registry_str for registry_str, _ in not_validated_values)
+    summary = {}
+    for (registry_str, field), values_list in not_validated_values.items():
+        key_str = "ln.Record" if registry_str == "Record" else registry_str
+        create_true = ", create=True" if "bionty." not in registry_str else ""
+        hint += f"  records = {key_str}.from_values({values_list}, field='{field}'{create_true}).save()\n"
+        # values of several fields of a registry are listed separately
+        summary_key = (
+            registry_str if n_fields[registry_str] == 1 else f"{registry_str}.{field}"
+        )
+        summary[summary_key] = (field, values_list)
+    msg = (
+        f"These values could not be validated: {summary}\n"
+        f"Here is how to create records for them:\n\n{hint}"
+    )
+    raise ValidationError(msg)
+
+
+def _add_label_feature_links_bulk(
+    host_class: type[Artifact | Run | Record],
+    features_labels: dict[str, list[tuple[int, Feature, SQLRecord]]],
+) -> None:
+    """Link labels to hosts, `features_labels` maps registries to (host_id, feature, label)."""
+    host_name = host_class.__name__.lower()
+    host_is_record = host_name == "record"
+    related_names = dict_related_model_to_related_name(host_class)
+    if host_is_record:
+        related_names["Record"] = "linked_records"
+        related_names["Project"] = "linked_projects"
+        related_names["Artifact"] = "linked_artifacts"
+        related_names["Collection"] = "linked_collections"
+        related_names["Run"] = "linked_runs"
+    else:
+        related_names["Run"] = "runs"
+    for class_name, registry_features_labels in features_labels.items():
+        if not host_is_record and class_name == "Collection":
+            continue
+        related_name = related_names[class_name]  # e.g., "ulabels"
+        IsLink = getattr(host_class, related_name).through
+        if host_is_record or class_name == "Artifact":
+            field_name = "value_id"
+        else:
+            field_name = f"{get_link_attr(IsLink, host_class)}_id"  # e.g., ulabel_id
+        links = [
+            IsLink(
+                **{
+                    f"{host_name}_id": host_id,
+                    "feature_id": feature.id,
+                    field_name: label.id,
+                }
+            )
+            for (host_id, feature, label) in registry_features_labels
+        ]
+        # a link might already exist
+        try:
+            save(links, ignore_conflicts=False)
+        except Exception:
+            save(links, ignore_conflicts=True)
+
+
+def _get_or_create_json_value_ids(
+    feature: Feature, values_by_hash: dict[str, Any]
+) -> dict[str, int]:
+    """Get or create `JsonValue` records of a feature, returns ids by hash."""
+    hashes = list(values_by_hash)
+    json_value_ids = {}
+    # chunked to stay below the maximal number of query parameters
+    for i in range(0, len(hashes), 999):
+        json_value_ids.update(
+            JsonValue.filter(feature=feature, hash__in=hashes[i : i + 999]).values_list(
+                "hash", "id"
+            )
+        )
+    missing_hashes = [hash for hash in hashes if hash not in json_value_ids]
+    if missing_hashes:
+        save(
+            [
+                JsonValue(feature=feature, value=values_by_hash[hash], hash=hash)
+                for hash in missing_hashes
+            ],
+            ignore_conflicts=True,
+        )
+        # bulk_create with ignore_conflicts doesn't set primary keys
+        for i in range(0, len(missing_hashes), 999):
+            json_value_ids.update(
+                JsonValue.filter(
+                    feature=feature, hash__in=missing_hashes[i : i + 999]
+                ).values_list("hash", "id")
+            )
+    return json_value_ids
+
+
+def _check_no_external_schema(artifacts: list[Artifact]) -> None:
+    schema_ids = {
+        artifact.schema_id for artifact in artifacts if artifact.schema_id is not None
+    }
+    if not schema_ids:
+        return None
+    has_external_schema = any(
+        artifact.otype is None and artifact.schema_id is not None
+        for artifact in artifacts
+    ) or (
+        Schema.components.through.filter(
+            composite_id__in=schema_ids, slot="__external__"
+        ).exists()
+    )
+    if has_external_schema:
+        raise ValueError("Cannot add values if artifact has external schema.")
+
+
 class FeatureManager:
     """Feature manager."""
 
@@ -1028,55 +1251,16 @@ class FeatureManager:
         self,
         features_labels,
     ):
-        host_name = self._host.__class__.__name__.lower()
-        host_is_record = host_name == "record"
-        related_names = dict_related_model_to_related_name(self._host.__class__)
-        if host_is_record:
-            related_names["Record"] = "linked_records"
-            related_names["Project"] = "linked_projects"
-            related_names["Artifact"] = "linked_artifacts"
-            related_names["Collection"] = "linked_collections"
-            related_names["Run"] = "linked_runs"
-        else:
-            related_names["Run"] = "runs"
-        for class_name, registry_features_labels in features_labels.items():
-            if not host_is_record and class_name == "Collection":
-                continue
-            related_name = related_names[class_name]  # e.g., "ulabels"
-            IsLink = getattr(self._host, related_name).through
-            if host_is_record or class_name == "Artifact":
-                field_name = "value_id"
-            else:
-                field_name = (
-                    f"{get_link_attr(IsLink, self._host)}_id"  # e.g., ulabel_id
-                )
-            if host_name == "artifact":
-                links = [
-                    IsLink(
-                        **{
-                            "artifact_id": self._host.id,
-                            "feature_id": feature.id,
-                            field_name: label.id,
-                        }
-                    )
+        _add_label_feature_links_bulk(
+            self._host.__class__,
+            {
+                class_name: [
+                    (self._host.id, feature, label)
                     for (feature, label) in registry_features_labels
                 ]
-            else:  # Run
-                links = [
-                    IsLink(
-                        **{
-                            f"{host_name}_id": self._host.id,
-                            "feature_id": feature.id,
-                            field_name: label.id,
-                        }
-                    )
-                    for (feature, label) in registry_features_labels
-                ]
-            # a link might already exist
-            try:
-                save(links, ignore_conflicts=False)
-            except Exception:
-                save(links, ignore_conflicts=True)
+                for class_name, registry_features_labels in features_labels.items()
+            },
+        )
 
     def _get_feature_records(self, dictionary, feature_field):
         from ..core._functions import get_current_tracked_run
@@ -1158,55 +1342,19 @@ class FeatureManager:
 
     def _add_values(self, feature_records, dictionary):
         from ..base.dtypes import is_iterable_of_sqlrecord
-        from .can_curate import CanCurate
         from .record import RecordJson
 
         host_is_record = self._host.__class__.__name__ == "Record"
         features_labels = defaultdict(list)
         feature_json_values = []
-        not_validated_values: dict[str, tuple[str, list[str]]] = {}
+        # values of categorical features grouped by (registry_str, field_str)
+        values_by_registry: dict[tuple[str, str], dict[str, Any]] = {}
         for feature in feature_records:
             value = dictionary[feature.name]
             if value is None:
                 continue
-            inferred_type, converted_value, _ = infer_feature_type_convert_json(
-                feature.name,
-                value,
-                mute=True,
-            )
+            converted_value = _check_and_convert_value(feature, value)
             dtype_str = feature._dtype_str
-            if dtype_str == "num" or dtype_str == "list[num]":
-                if not ("int" in inferred_type or "float" in inferred_type):
-                    raise TypeError(
-                        f"Value for feature '{feature.name}' with dtype {dtype_str} must be a number, but is {value} with dtype {inferred_type}"
-                    )
-            elif dtype_str.startswith("cat"):
-                if inferred_type != "?":
-                    if not (
-                        inferred_type.startswith("cat")
-                        or inferred_type == "list[cat ? str]"
-                        or isinstance(value, SQLRecord)
-                        or is_iterable_of_sqlrecord(value)
-                    ):
-                        raise TypeError(
-                            f"Value for feature '{feature.name}' with dtype '{dtype_str}' must be a string or record, but is {value} with dtype {inferred_type}"
-                        )
-            elif (
-                (dtype_str == "str" and inferred_type != "cat ? str")
-                or (dtype_str == "list[str]" and inferred_type != "list[cat ? str]")
-                or (
-                    dtype_str.startswith("list[cat")
-                    and not inferred_type.startswith("list[cat")
-                )
-                or (
-                    dtype_str not in {"str", "list[str]"}
-                    and not dtype_str.startswith("list[cat")
-                    and dtype_str != inferred_type
-                )
-            ):
-                raise ValidationError(
-                    f"Expected dtype for '{feature.name}' is '{dtype_str}', got '{inferred_type}'"
-                )
             if not (dtype_str.startswith("cat") or dtype_str.startswith("list[cat")):
                 filter_kwargs = {"feature": feature, "value": converted_value}
                 if host_is_record:
@@ -1215,73 +1363,34 @@ class FeatureManager:
                 else:
                     feature_value, _ = JsonValue.get_or_create(**filter_kwargs)
                 feature_json_values.append(feature_value)
+            elif isinstance(value, SQLRecord) or is_iterable_of_sqlrecord(value):
+                for record in _label_records_from_value(value):
+                    features_labels[record.__class__.__get_name_with_module__()].append(
+                        (feature, record)
+                    )
             else:
-                if isinstance(value, SQLRecord) or is_iterable_of_sqlrecord(value):
-                    if isinstance(value, SQLRecord):
-                        label_records = [value]
-                    else:
-                        label_records = value  # type: ignore
-                    for record in label_records:
-                        if record._state.adding:
-                            raise ValidationError(
-                                f"Please save {record} before annotation."
-                            )
-                        features_labels[
-                            record.__class__.__get_name_with_module__()
-                        ].append((feature, record))
-                else:
-                    if isinstance(value, str):
-                        values = [value]  # type: ignore
-                    else:
-                        values = value  # type: ignore
-                    if feature._dtype_str == "cat":
-                        new_dtype_str = feature._dtype_str + "[ULabel]"
-                        feature._dtype_str = new_dtype_str
-                        feature.save()
-                        result = {
-                            "registry_str": "ULabel",
-                            "registry": ULabel,
-                            "field": ULabel.name,
-                        }
-                    else:
-                        result = parse_dtype(feature._dtype_str)[0]
-                    if issubclass(result["registry"], CanCurate):  # type: ignore
-                        validated = result["registry"].validate(  # type: ignore
-                            values, field=result["field"], mute=True
-                        )
-                        values_array = np.array(values)
-                        validated_values = values_array[validated]
-                        key = result["registry_str"]
-                        if validated.sum() != len(values):
-                            not_validated_values[result["registry_str"]] = (  # type: ignore
-                                result["field_str"],
-                                values_array[~validated].tolist(),
-                            )
-                        label_records = result["registry"].from_values(  # type: ignore
-                            validated_values, field=result["field"], mute=True
-                        )
-                    else:
-                        label_records = result["registry"].filter(  # type: ignore
-                            **{f"{result['field_str']}__in": values}
-                        )
-                        if len(label_records) != len(values):
-                            raise ValidationError(
-                                f"Some of these values for {result['registry_str']} do not exist: {values}"
-                            )
-                    features_labels[result["registry_str"]] += [  # type: ignore
-                        (feature, label_record) for label_record in label_records
-                    ]
-        if not_validated_values:
-            hint = ""
-            for key, (field, values_list) in not_validated_values.items():
-                key_str = "ln.Record" if key == "Record" else key
-                create_true = ", create=True" if "bionty." not in key else ""
-                hint += f"  records = {key_str}.from_values({values_list}, field='{field}'{create_true}).save()\n"
-            msg = (
-                f"These values could not be validated: {dict(not_validated_values)}\n"
-                f"Here is how to create records for them:\n\n{hint}"
+                result = _get_cat_dtype_result(feature)
+                values = [value] if isinstance(value, str) else value
+                registry_values = values_by_registry.setdefault(
+                    (result["registry_str"], result["field_str"]),
+                    {"result": result, "values": []},
+                )
+                registry_values["values"] += [(feature, v) for v in values]
+        not_validated_values: dict[tuple[str, str], list[str]] = {}
+        for (registry_str, field_str), registry_values in values_by_registry.items():
+            label_records, not_validated = _get_label_records_by_value(
+                registry_values["result"],
+                [v for _, v in registry_values["values"]],
             )
-            raise ValidationError(msg)
+            if not_validated:
+                not_validated_values[(registry_str, field_str)] = not_validated
+            features_labels[registry_str] += [
+                (feature, label_record)
+                for feature, v in dict.fromkeys(registry_values["values"])
+                for label_record in label_records.get(v, [])
+            ]
+        if not_validated_values:
+            _raise_not_validated_values(not_validated_values)
         if features_labels:
             self._add_label_feature_links(features_labels)
         if feature_json_values and host_is_record:
@@ -1304,6 +1413,154 @@ class FeatureManager:
             # a link might already exist, hence ignore_conflicts is needed
             save(links, ignore_conflicts=True)
 
+    @staticmethod
+    def add_values_bulk(
+        values: pd.DataFrame,
+        feature_field: FieldAttr = Feature.name,
+    ) -> None:
+        """Add values for features to many artifacts, runs or records at once.
+
+        Unlike calling :meth:`~lamindb.models.FeatureManager.add_values` in a loop,
+        this looks up feature values with a few queries per feature and per label registry
+        and creates all missing values and links in bulk.
+
+        Args:
+            values: A `DataFrame` indexed by saved artifacts, runs, or records of the same registry
+                with one column per feature. Missing values (`None`, `NaN`) are skipped.
+            feature_field: The field of a registry to map the columns of `values`.
+
+        Called by :meth:`~lamindb.models.BasicQuerySet.add_feature_values`::
+
+            df = pd.DataFrame(
+                {"species": ["human", "mouse"], "temperature": [27.6, 25.0]},
+                index=[artifact1, artifact2],
+            )
+            ln.Artifact.filter(id__in=[artifact1.id, artifact2.id]).add_feature_values(df)
+        """
+        from ..base.dtypes import is_iterable_of_sqlrecord
+        from .record import Record, RecordJson
+
+        hosts = list(values.index)
+        if len(hosts) == 0:
+            return None
+        host_class = hosts[0].__class__
+        host_name = host_class.__name__
+        if host_name not in {"Artifact", "Run", "Record"} or any(
+            host.__class__ is not host_class for host in hosts
+        ):
+            raise ValueError(
+                "values must be indexed by artifacts, runs, or records of a single registry"
+            )
+        for host in hosts:
+            if host._state.adding:
+                raise ValidationError(f"Please save {host} before annotation.")
+        if len({host.id for host in hosts}) != len(hosts):
+            raise ValueError("values must not be indexed by the same record twice")
+        keys = values.columns.tolist()
+        # deal with other cases later
+        assert all(isinstance(key, str) for key in keys)  # noqa: S101
+        if host_name == "Artifact":
+            _check_no_external_schema(hosts)
+        elif host_name == "Record":
+            type_ids = {host.type_id for host in hosts if host.type_id is not None}
+            if Record.filter(id__in=type_ids, schema__isnull=False).exists():
+                raise ValueError(
+                    "Cannot add values in bulk to records whose type has a schema, use `record.features.add_values()`."
+                )
+        dictionary = {
+            key: next((v for v in values[key].tolist() if not _is_missing(v)), None)
+            for key in keys
+        }
+        feature_records = FeatureManager(hosts[0])._get_feature_records(
+            dictionary, feature_field
+        )
+
+        # registry_str -> list of (host_id, feature, label record)
+        features_labels: dict[str, list] = defaultdict(list)
+        # feature id -> list of (host_id, converted value)
+        json_values: dict[int, list] = defaultdict(list)
+        # values of categorical features grouped by (registry_str, field_str)
+        values_by_registry: dict[tuple[str, str], dict[str, Any]] = {}
+        features_by_id = {feature.id: feature for feature in feature_records}
+        for feature in feature_records:
+            dtype_str = feature._dtype_str
+            is_cat = dtype_str.startswith("cat") or dtype_str.startswith("list[cat")
+            result = None
+            # tolist() converts numpy scalars into python objects
+            for host, value in zip(hosts, values[feature.name].tolist()):
+                if _is_missing(value):
+                    continue
+                converted_value = _check_and_convert_value(feature, value)
+                if not is_cat:
+                    json_values[feature.id].append((host.id, converted_value))
+                elif isinstance(value, SQLRecord) or is_iterable_of_sqlrecord(value):
+                    for record in _label_records_from_value(value):
+                        features_labels[
+                            record.__class__.__get_name_with_module__()
+                        ].append((host.id, feature, record))
+                else:
+                    if result is None:
+                        result = _get_cat_dtype_result(feature)
+                    registry_values = values_by_registry.setdefault(
+                        (result["registry_str"], result["field_str"]),
+                        {"result": result, "values": []},
+                    )
+                    registry_values["values"] += [
+                        (host.id, feature, v)
+                        for v in ([value] if isinstance(value, str) else value)
+                    ]
+
+        # validate & look up labels once per registry & field
+        not_validated_values: dict[tuple[str, str], list[str]] = {}
+        for (registry_str, field_str), registry_values in values_by_registry.items():
+            label_records, not_validated = _get_label_records_by_value(
+                registry_values["result"],
+                [v for _, _, v in registry_values["values"]],
+            )
+            if not_validated:
+                not_validated_values[(registry_str, field_str)] = not_validated
+            features_labels[registry_str] += [
+                (host_id, feature, label_record)
+                for host_id, feature, v in dict.fromkeys(registry_values["values"])
+                for label_record in label_records.get(v, [])
+            ]
+        if not_validated_values:
+            _raise_not_validated_values(not_validated_values)
+
+        if features_labels:
+            _add_label_feature_links_bulk(host_class, features_labels)
+        if json_values and host_name == "Record":
+            save(
+                [
+                    RecordJson(
+                        record_id=host_id,
+                        feature=features_by_id[feature_id],
+                        value=value,
+                    )
+                    for feature_id, host_values in json_values.items()
+                    for host_id, value in host_values
+                ]
+            )
+        elif json_values:
+            links = []
+            for feature_id, host_values in json_values.items():
+                hashes = [JsonValue._hash_value(value) for _, value in host_values]
+                json_value_ids = _get_or_create_json_value_ids(
+                    features_by_id[feature_id],
+                    dict(zip(hashes, (value for _, value in host_values))),
+                )
+                links += [
+                    host_class.json_values.through(
+                        **{
+                            f"{host_name.lower()}_id": host_id,
+                            "jsonvalue_id": json_value_ids[hash],
+                        }
+                    )
+                    for (host_id, _), hash in zip(host_values, hashes)
+                ]
+            # a link might already exist, hence ignore_conflicts is needed
+            save(links, ignore_conflicts=True)
+
     def set_values(
         self,
         values: dict[str, str | int | float | bool],
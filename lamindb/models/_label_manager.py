@@ -3,7 +3,6 @@ from __future__ import annotations
 from collections import defaultdict
 from typing import TYPE_CHECKING
 
-from django.db import connections
 from rich.table import Column, Table
 from rich.text import Text
 from rich.tree import Tree
@@ -24,7 +23,11 @@ from ._describe import (
     VALUES_WIDTH,
     format_rich_tree,
 )
-from ._django import get_artifact_or_run_with_related, get_related_model
+from ._django import (
+    get_artifact_or_run_with_related,
+    get_related_model,
+    supports_json_aggregation,
+)
 from ._relations import dict_related_model_to_related_name
 
 if TYPE_CHECKING:
@@ -80,10 +83,7 @@ def describe_labels(
     """Describe labels."""
     labels_data = related_data.get("m2m") if related_data is not None else None
     if labels_data is None:
-        if (
-            not self._state.adding
-            and connections[self._state.db].vendor == "postgresql"
-        ):
+        if not self._state.adding and supports_json_aggregation(self._state.db):
             labels_data = _get_labels_postgres(self, labels_data)
         if not labels_data:
             labels_data = _get_labels(self, instance=self._state.db)
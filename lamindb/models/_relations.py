@@ -12,6 +12,8 @@ from lamindb_setup.core._settings_store import instance_settings_file
 
 from lamindb.models.sqlrecord import IsLink
 
+from ._connections import instance_connections
+
 if TYPE_CHECKING:
     from lamindb.models.sqlrecord import Registry, SQLRecord
 
@@ -21,6 +23,18 @@ def get_schema_modules(instance: str | None) -> set[str]:
         schema_modules = set(ln_setup.settings.instance.modules)
         schema_modules.add("core")
         return schema_modules
+    if (connected := instance_connections.get(instance)) is not None:
+        modules = connected.modules
+    else:
+        modules = _load_schema_modules(instance)
+    shared_schema_modules = set(ln_setup.settings.instance.modules).intersection(
+        modules
+    )
+    shared_schema_modules.add("core")
+    return shared_schema_modules
+
+
+def _load_schema_modules(instance: str) -> set[str]:
     owner, name = get_owner_name_from_identifier(instance)
     settings_file = instance_settings_file(name, owner)
     if settings_file.exists():
@@ -33,11 +47,7 @@ def get_schema_modules(instance: str | None) -> set[str]:
             modules = set(cache_filepath.read_text().split("\n")[1].split(","))
         else:
             raise ValueError(f"Instance {instance} not found")
-    shared_schema_modules = set(ln_setup.settings.instance.modules).intersection(
-        modules
-    )
-    shared_schema_modules.add("core")
-    return shared_schema_modules
+    return modules
 
 
 # this function here should likely be renamed
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db import connections
+from django.db.models.expressions import RawSQL
+from lamin_utils import logger
+
+if TYPE_CHECKING:
+    from .sqlrecord import SQLRecord
+
+# trigrams can only match strings of at least 3 characters
+MIN_SEARCH_INDEX_STRING_LENGTH = 3
+
+# the indexed columns of the FTS5 tables of a database, see _sqlite_search_indexes()
+_search_indexes_cache: dict[tuple[str, str], dict[str, set[str]]] = {}
+
+
+def _default_search_fields(registry: type[SQLRecord]) -> list[str]:
+    return [
+        field.name
+        for field in registry._meta.fields
+        if field.get_internal_type() in {"CharField", "TextField"}
+    ]
+
+
+def _fts_table(registry: type[SQLRecord]) -> str:
+    return f"{registry._meta.db_table}_search"
+
+
+def _columns(registry: type[SQLRecord], fields: list[str]) -> list[str]:
+    return [registry._meta.get_field(field).column for field in fields]
+
+
+def _cache_key(using: str | None) -> tuple[str, str]:
+    alias = using or "default"
+    # the default alias points to another database after switching instances
+    return alias, str(connections[alias].settings_dict["NAME"])
+
+
+def clear_search_index_cache(using: str | None = None) -> None:
+    _search_indexes_cache.pop(_cache_key(using), None)
+
+
+def create_search_index(
+    registry: type[SQLRecord],
+    fields: list[str] | None = None,
+    *,
+    using: str | None = None,
+) -> None:
+    """Create a full-text index to speed up `.search()` of a registry.
+
+    On SQLite, this creates an FTS5 table with a trigram tokenizer that is kept
+    in sync with the registry through triggers. On Postgres, this creates
+    `pg_trgm` indexes on the fields.
+
+    The ranking of search results doesn't change, the index is only used to
+    find the candidate records.
+
+    Args:
+        registry: The registry to index, e.g., `ln.Record` or `bt.CellType`.
+        fields: The string fields to index. Defaults to all string fields,
+            which is what `.search()` searches by default.
+        using: The database alias, defaults to the current instance.
+
+    Examples:
+
+        ::
+
+            from lamindb.core import create_search_index
+
+            create_search_index(ln.Record, ["name", "description"])
+            ln.Record.search("T cell")
+    """
+    if fields is None:
+        fields = _default_search_fields(registry)
+    columns = _columns(registry, fields)
+    connection = connections[using or "default"]
+    table = registry._meta.db_table
+    quote = connection.ops.quote_name
+    if connection.vendor == "sqlite":
+        fts_table = _fts_table(registry)
+        pk = registry._meta.pk.column
+        column_list = ", ".join(quote(column) for column in columns)
+        new_values = ", ".join(f"new.{quote(column)}" for column in columns)
+        old_values = ", ".join(f"old.{quote(column)}" for column in columns)
+        statements = [
+            f"CREATE VIRTUAL TABLE {quote(fts_table)} USING fts5("
+            f"{column_list}, content={quote(table)}, content_rowid={quote(pk)}, "
+            "tokenize='trigram')",
+            f"CREATE TRIGGER IF NOT EXISTS {quote(fts_table + '_ai')} "
+            f"AFTER INSERT ON {quote(table)} BEGIN "
+            f"INSERT INTO {quote(fts_table)}(rowid, {column_list}) "
+            f"VALUES (new.{quote(pk)}, {new_values}); END",
+            f"CREATE TRIGGER IF NOT EXISTS {quote(fts_table + '_ad')} "
+            f"AFTER DELETE ON {quote(table)} BEGIN "
+            f"INSERT INTO {quote(fts_table)}({quote(fts_table)}, rowid, {column_list}) "
+            f"VALUES ('delete', old.{quote(pk)}, {old_values}); END",
+            f"CREATE TRIGGER IF NOT EXISTS {quote(fts_table + '_au')} "
+            f"AFTER UPDATE ON {quote(table)} BEGIN "
+            f"INSERT INTO {quote(fts_table)}({quote(fts_table)}, rowid, {column_list}) "
+            f"VALUES ('delete', old.{quote(pk)}, {old_values}); "
+            f"INSERT INTO {quote(fts_table)}(rowid, {column_list}) "
+            f"VALUES (new.{quote(pk)}, {new_values}); END",
+            f"INSERT INTO {quote(fts_table)}({quote(fts_table)}) VALUES ('rebuild')",
+        ]
+        # the triggers refer to the columns of the previous index
+        drop_search_index(registry, using=using)
+    elif connection.vendor == "postgresql":
+        statements = ["CREATE EXTENSION IF NOT EXISTS pg_trgm"]
+        for column in columns:
+            # the expression matches the SQL of Django's icontains lookup
+            statements.append(
+                f"CREATE INDEX IF NOT EXISTS {quote(f'{table}_{column}_trgm')} "
+                f"ON {quote(table)} USING gin "
+                f"(UPPER({quote(column)}::text) gin_trgm_ops)"
+            )
+    else:
+        raise NotImplementedError(
+            f"Search indexes aren't supported for {connection.vendor}."
+        )
+    with connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+    clear_search_index_cache(using)
+    logger.important(f"created search index for {registry.__name__}: {fields}")
+
+
+def drop_search_index(
+    registry: type[SQLRecord],
+    *,
+    using: str | None = None,
+) -> None:
+    """Drop the full-text index of a registry.
+
+    Args:
+        registry: The registry, e.g., `ln.Record` or `bt.CellType`.
+        using: The database alias, defaults to the current instance.
+    """
+    connection = connections[using or "default"]
+    quote = connection.ops.quote_name
+    table = registry._meta.db_table
+    if connection.vendor == "sqlite":
+        fts_table = _fts_table(registry)
+        statements = [
+            f"DROP TRIGGER IF EXISTS {quote(fts_table + suffix)}"
+            for suffix in ("_ai", "_ad", "_au")
+        ]
+        statements.append(f"DROP TABLE IF EXISTS {quote(fts_table)}")
+    elif connection.vendor == "postgresql":
+        statements = [
+            f"DROP INDEX IF EXISTS {quote(f'{table}_{column}_trgm')}"
+            for column in _columns(registry, _default_search_fields(registry))
+        ]
+    else:
+        return None
+    with connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+    clear_search_index_cache(using)
+
+
+def _sqlite_search_indexes(using: str | None) -> dict[str, set[str]]:
+    """The indexed columns by FTS5 table, cached per database.
+
+    Tables whose triggers are missing aren't included, schema migrations that
+    rebuild a table drop its triggers.
+    """
+    key = _cache_key(using)
+    if (indexes := _search_indexes_cache.get(key)) is not None:
+        return indexes
+    connection = connections[key[0]]
+    indexes = {}
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE name LIKE %s ESCAPE '\\'"
+            " OR name LIKE %s ESCAPE '\\'",
+            ["%\\_search", "%\\_search\\_au"],
+        )
+        names = {row[0] for row in cursor.fetchall()}
+        for fts_table in names:
+            if f"{fts_table}_au" not in names:
+                continue
+            cursor.execute(f"PRAGMA table_info({connection.ops.quote_name(fts_table)})")
+            indexes[fts_table] = {row[1] for row in cursor.fetchall()}
+    _search_indexes_cache[key] = indexes
+    return indexes
+
+
+def search_index_candidates(
+    registry: type[SQLRecord],
+    fields: list[str],
+    string: str,
+    using: str | None,
+) -> RawSQL | None:
+    """Subquery of the primary keys of records that contain `string` in `fields`.
+
+    Returns `None` if there is no usable index, the matches are a superset of a
+    case-insensitive contains filter.
+    """
+    if len(string) < MIN_SEARCH_INDEX_STRING_LENGTH:
+        return None
+    connection = connections[using or "default"]
+    if connection.vendor != "sqlite":
+        return None
+    try:
+        columns = _columns(registry, fields)
+    except Exception:
+        return None
+    fts_table = _fts_table(registry)
+    indexes = _sqlite_search_indexes(using)
+    if fts_table not in indexes or not set(columns).issubset(indexes[fts_table]):
+        return None
+    quote = connection.ops.quote_name
+    column_filter = " ".join(quote(column) for column in columns)
+    phrase = string.replace('"', '""')
+    # the query string is passed as a parameter
+    return RawSQL(  # noqa: S611
+        f"SELECT rowid FROM {quote(fts_table)} WHERE {quote(fts_table)} MATCH %s",
+        [f'{{{column_filter}}} : "{phrase}"'],
+    )
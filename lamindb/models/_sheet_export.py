@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pandas as pd
+from django.db.models import Q
+
+from .feature import parse_dtype
+from .query_set import (
+    cast_numeric_feature_columns,
+    convert_feature_columns,
+    encode_lamindb_fields_as_columns,
+    get_basic_field_names,
+    get_default_branch_ids,
+    get_feature_annotate_kwargs,
+    reorder_subset_columns_in_df,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from .feature import Feature
+    from .query_set import QuerySet
+    from .sqlrecord import Registry
+
+# the number of records per page, keeps the ids of a page below the limits
+# for query parameters of SQLite and Postgres
+EXPORT_PAGE_SIZE = 5000
+
+
+class LinkValues:
+    """Feature values of records in one link model, e.g., `RecordULabel`."""
+
+    def __init__(self, registry: Registry, link_attr: str, fields: list[str]):
+        relation = registry._meta.get_field(link_attr)
+        self.link_model = relation.related_model
+        self.record_id = f"{relation.field.name}_id"
+        self.fields = fields
+        # see get_feature_annotate_kwargs()
+        self.filter_branch = link_attr not in {"values_user", "links_user"}
+
+    def to_dataframe(
+        self, db: str, record_ids: list[int], feature_ids: list[int] | None
+    ) -> pd.DataFrame:
+        links = self.link_model.objects.using(db).filter(
+            **{f"{self.record_id}__in": record_ids}
+        )
+        if feature_ids is not None:
+            links = links.filter(feature_id__in=feature_ids)
+        value_fields = [f"value__{field}" for field in self.fields]
+        columns = ["id", "feature", *self.fields]
+        if self.filter_branch:
+            value_fields.append("value__branch_id")
+            columns.append("branch_id")
+        df = pd.DataFrame(
+            links.values_list(self.record_id, "feature__name", *value_fields),
+            columns=columns,
+        )
+        if self.filter_branch:
+            # values in the trash or archive are missing
+            df.loc[~df["branch_id"].isin(get_default_branch_ids()), self.fields] = None
+        return df
+
+
+def _link_values(
+    registry: Registry, annotate_kwargs: dict[str, object]
+) -> dict[str, LinkValues]:
+    """The link models and value fields that the annotation of features uses."""
+    fields_by_link_attr: dict[str, list[str]] = {}
+    for key in annotate_kwargs:
+        link_attr, path = key.split("__", 1)
+        fields = fields_by_link_attr.setdefault(link_attr, [])
+        if path.startswith("value__"):
+            fields.append(path.removeprefix("value__"))
+    # JSON values are queried separately
+    fields_by_link_attr.pop("values_json")
+    return {
+        link_attr: LinkValues(registry, link_attr, fields)
+        for link_attr, fields in fields_by_link_attr.items()
+    }
+
+
+def _pivot_page(
+    page: pd.DataFrame,
+    db: str,
+    json_values: pd.DataFrame,
+    link_values: dict[str, LinkValues],
+    features: list[Feature],
+    feature_ids: list[int] | None,
+) -> pd.DataFrame:
+    """Pivot the feature values of a page of records into columns of sets."""
+    record_ids = page.index.tolist()
+    if not json_values.empty:
+        # sets for scalar values, the first value for dicts and lists
+        is_dict_or_list = json_values["value"].map(
+            lambda x: isinstance(x, (dict, list))
+        )
+        grouped = [
+            json_values[~is_dict_or_list].groupby(["id", "feature"])["value"].agg(set),
+            json_values[is_dict_or_list]
+            .groupby(["id", "feature"])["value"]
+            .agg("first"),
+        ]
+        page = page.join(pd.concat(grouped).unstack())
+    for values in link_values.values():
+        df = values.to_dataframe(db, record_ids, feature_ids)
+        if df.empty:
+            continue
+        feature_names = set(df["feature"])
+        for feature in features:
+            if feature.name not in feature_names or feature.name in page.columns:
+                continue
+            field = parse_dtype(feature._dtype_str)[0]["field_str"]
+            mask = (df["feature"] == feature.name) & df[field].notna()
+            page[feature.name] = page.index.map(df[mask].groupby("id")[field].agg(set))
+    return page
+
+
+def _iter_pages(
+    qs: QuerySet, field_names: list[str], page_size: int
+) -> Iterator[pd.DataFrame]:
+    """Pages of the basic fields of records ordered by id, without `OFFSET`."""
+    last_id = None
+    while True:
+        page_qs = qs.order_by("id")
+        if last_id is not None:
+            page_qs = page_qs.filter(Q(id__gt=last_id))
+        page = pd.DataFrame(
+            page_qs.values_list(*field_names)[:page_size], columns=field_names
+        ).set_index("id")
+        if page.empty:
+            break
+        yield page
+        last_id = page.index[-1]
+        if len(page) < page_size:
+            break
+
+
+def sheet_to_dataframe(
+    qs: QuerySet,
+    columns: list[str] | None = None,
+    page_size: int = EXPORT_PAGE_SIZE,
+) -> pd.DataFrame:
+    """Export records with their feature values, one page of records at a time.
+
+    Returns the same dataframe as `qs.to_dataframe(features="queryset",
+    order_by="id", limit=None)` but queries each link model separately instead
+    of joining all of them and pivots the values per page of records.
+
+    Args:
+        qs: The records to export.
+        columns: Restrict the exported features to these names, other link
+            models aren't queried.
+        page_size: The number of records per page.
+    """
+    registry = qs.model
+    db = qs.db
+    field_names = get_basic_field_names(qs, [], "queryset")
+    features = "queryset" if columns is None else list(columns)
+    annotate_kwargs, feature_qs, _ = get_feature_annotate_kwargs(registry, features, qs)
+    features = list(feature_qs)
+    feature_ids = None if columns is None else [feature.id for feature in features]
+    link_values = _link_values(registry, annotate_kwargs)
+    json_relation = registry._meta.get_field("values_json")
+    json_model = json_relation.related_model
+    json_record_id = f"{json_relation.field.name}_id"
+
+    # avoid conflicts of the basic fields and feature names
+    fields_map = encode_lamindb_fields_as_columns(registry, field_names)
+    fields_map.pop("id")  # type: ignore
+    pages = []
+    for page in _iter_pages(qs, field_names, page_size):
+        json_links = json_model.objects.using(db).filter(
+            **{f"{json_record_id}__in": page.index.tolist()}
+        )
+        if feature_ids is not None:
+            json_links = json_links.filter(feature_id__in=feature_ids)
+        json_values = pd.DataFrame(
+            json_links.values_list(json_record_id, "feature__name", "value"),
+            columns=["id", "feature", "value"],
+        )
+        pages.append(
+            _pivot_page(
+                page.rename(columns=fields_map),
+                db,
+                json_values,
+                link_values,
+                features,
+                feature_ids,
+            )
+        )
+    if not pages:
+        return pd.DataFrame({}, columns=field_names)
+    df = pd.concat(pages) if len(pages) > 1 else pages[0]
+    df = convert_feature_columns(df, features)
+    df = reorder_subset_columns_in_df(
+        df, [feature.name for feature in features], position=len(field_names) - 1
+    )
+    # restore field names that don't conflict with feature names
+    decode_map = {
+        encoded: original
+        for original, encoded in fields_map.items()  # type: ignore
+        if original not in df.columns
+    }
+    df = df.rename(columns=decode_map)
+    return cast_numeric_feature_columns(df, features)
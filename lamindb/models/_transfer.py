@@ -0,0 +1,421 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from copy import copy
+from typing import TYPE_CHECKING
+
+import lamindb_setup as ln_setup
+from django.db.models import ForeignKey, ManyToManyField
+from lamin_utils import logger
+
+from ._is_versioned import IsVersioned
+from ._relations import dict_related_model_to_related_name
+from .save import bulk_create
+from .sqlrecord import REGISTRY_UNIQUE_FIELD, get_transfer_run
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .query_set import QuerySet
+    from .sqlrecord import Registry, SQLRecord
+
+# the number of values per `__in` query, keeps them below the limits for query
+# parameters of SQLite and Postgres
+TRANSFER_BATCH_SIZE = 5000
+
+# foreign keys that are set to the current user and the transfer run
+# or, for branches, kept as is, see transfer_to_default_db()
+NON_TRANSFERRED_FKS = {"created_by", "run", "transform", "branch"}
+
+# the fields of link models that are set by their defaults on creation
+LINK_DEFAULT_FIELDS = {"created_at", "created_by", "run"}
+
+# a schema with the same hash is the same schema, see Schema.from_values()
+SECONDARY_MATCH_FIELDS = {"Schema": "hash"}
+
+# registries that are linked to the project of the current run context, see
+# SQLRecord.save()
+PROJECT_REGISTRIES = {
+    "Artifact",
+    "Transform",
+    "Run",
+    "ULabel",
+    "Feature",
+    "Schema",
+    "Collection",
+    "Reference",
+}
+
+
+def _batches(values: list) -> Iterable[list]:
+    for i in range(0, len(values), TRANSFER_BATCH_SIZE):
+        yield values[i : i + TRANSFER_BATCH_SIZE]
+
+
+def _through_fields(registry: Registry, related_name: str) -> tuple[Registry, str, str]:
+    """The link model of a many-to-many relation and its source & target fields."""
+    field = registry._meta.get_field(related_name)
+    if isinstance(field, ManyToManyField):
+        return (
+            field.remote_field.through,
+            field.m2m_field_name(),
+            field.m2m_reverse_field_name(),
+        )
+    return (
+        field.through,
+        field.field.m2m_reverse_field_name(),
+        field.field.m2m_field_name(),
+    )
+
+
+def create_links(through: Registry, source_field: str, links: list[SQLRecord]) -> None:
+    """Create link records that don't exist yet.
+
+    Link records with a `NULL` feature don't violate unique constraints, hence,
+    existing links are looked up analogous to `.add()` of a many-to-many relation.
+    """
+    fields = [
+        field.attname
+        for field in through._meta.concrete_fields
+        if isinstance(field, ForeignKey) and field.name not in LINK_DEFAULT_FIELDS
+    ]
+    source_ids = list({getattr(link, f"{source_field}_id") for link in links})
+    existing = set()
+    for batch in _batches(source_ids):
+        existing.update(
+            through.objects.filter(**{f"{source_field}_id__in": batch}).values_list(
+                *fields
+            )
+        )
+    bulk_create(
+        [
+            link
+            for link in links
+            if tuple(getattr(link, field) for field in fields) not in existing
+        ],
+        ignore_conflicts=True,
+    )
+
+
+class BulkTransfer:
+    """Transfers records from another instance to the current instance in bulk.
+
+    Existing records are looked up with batched `__in` queries, foreign keys
+    are remapped through dictionaries of ids and missing records are created
+    with `bulk_create()`, the records that foreign keys point to first.
+
+    Args:
+        db: The database alias of the source instance.
+        transfer_logs: The `mapped` and `transferred` records and the transfer
+            run, see `transfer_to_default_db()`.
+    """
+
+    def __init__(self, db: str, transfer_logs: dict):
+        self.db = db
+        self.transfer_logs = transfer_logs
+        # maps the ids of source records to the ids of records in the current instance
+        self.id_maps: dict[Registry, dict[int, int]] = defaultdict(dict)
+
+    def _fetch(self, registry: Registry, ids: Iterable[int]) -> list[SQLRecord]:
+        ids = [i for i in ids if i not in self.id_maps[registry]]
+        records = []
+        for batch in _batches(ids):
+            records += list(registry.objects.using(self.db).filter(id__in=batch))
+        return records
+
+    def _existing(self, registry: Registry, field: str, values: list) -> dict:
+        existing = {}
+        for batch in _batches(list(set(values))):
+            existing.update(
+                registry.objects.filter(**{f"{field}__in": batch}).values_list(
+                    field, "id"
+                )
+            )
+        return existing
+
+    def _map_foreign_keys(
+        self, registry: Registry, records: list[SQLRecord], exclude: set[str]
+    ) -> None:
+        """Transfer the records that foreign keys point to."""
+        for field in registry._meta.fields:
+            # the space is the space of the current context, see _target_id()
+            if not isinstance(field, ForeignKey) or field.name in exclude | {"space"}:
+                continue
+            ids = {getattr(record, field.attname) for record in records}
+            ids.discard(None)
+            if not ids:
+                continue
+            related_model = field.related_model
+            match_field = REGISTRY_UNIQUE_FIELD.get(
+                related_model.__name__.lower(), "uid"
+            )
+            self.records(
+                related_model, self._fetch(related_model, ids), fields=(match_field,)
+            )
+
+    def _target_id(self, field: ForeignKey, source_id: int | None) -> int | None:
+        if source_id is None:
+            return None
+        if field.name == "space":
+            from lamindb import context
+
+            # the default space has id=1
+            return 1 if context.space is None else context.space.id
+        return self.id_maps[field.related_model][source_id]
+
+    def records(
+        self,
+        registry: Registry,
+        records: list[SQLRecord],
+        *,
+        fields: tuple[str, ...] = ("uid",),
+        log: bool = False,
+    ) -> None:
+        """Map records to existing records and create the missing ones.
+
+        Args:
+            registry: The registry of the records.
+            records: Records of the source instance.
+            fields: The fields to look up existing records, in order.
+            log: Whether to log records as `mapped`, otherwise only created
+                records are logged as `transferred`.
+        """
+        id_map = self.id_maps[registry]
+        pending = [record for record in records if record.id not in id_map]
+        if (
+            secondary_field := SECONDARY_MATCH_FIELDS.get(registry.__name__)
+        ) is not None:
+            fields = (*fields, secondary_field)
+        for field in fields:
+            if not pending:
+                return None
+            existing = self._existing(
+                registry, field, [getattr(record, field) for record in pending]
+            )
+            missing = []
+            for record in pending:
+                target_id = existing.get(getattr(record, field))
+                if target_id is None:
+                    missing.append(record)
+                    continue
+                id_map[record.id] = target_id
+                if log:
+                    self.transfer_logs["mapped"].append(
+                        f"{registry.__name__}(uid='{record.uid}')"
+                    )
+            pending = missing
+        if not pending:
+            return None
+
+        self._map_foreign_keys(registry, pending, exclude=NON_TRANSFERRED_FKS)
+        # self-referencing records, e.g. types, might have been created meanwhile
+        pending = [record for record in pending if record.id not in id_map]
+        run = self.transfer_logs["run"]
+        new_records = []
+        for record in pending:
+            new_record = copy(record)
+            for field in registry._meta.fields:
+                if not isinstance(field, ForeignKey):
+                    continue
+                if field.name == "created_by":
+                    value = ln_setup.settings.user.id
+                elif field.name == "run":
+                    value = run.id
+                elif field.name == "transform":
+                    value = run.transform_id
+                elif field.name == "branch":
+                    continue
+                else:
+                    value = self._target_id(field, getattr(record, field.attname))
+                setattr(new_record, field.attname, value)
+            new_record.id = None
+            new_record._state.db = "default"
+            new_record._state.adding = True
+            new_records.append(new_record)
+        bulk_create(new_records, ignore_conflicts=True)
+
+        field = fields[0]
+        created = self._existing(
+            registry, field, [getattr(record, field) for record in pending]
+        )
+        for record, new_record in zip(pending, new_records):
+            target_id = created.get(getattr(record, field))
+            if target_id is None:
+                # conflicts with other unique fields, e.g., the hash of an
+                # artifact, are resolved by the save logic
+                new_record.save()
+                target_id = new_record.id
+            id_map[record.id] = target_id
+            self.transfer_logs["transferred"].append(
+                f"{registry.__name__}(uid='{record.uid}')"
+            )
+        if registry.__name__ == "Schema":
+            self._schema_members([record.id for record in pending])
+
+    def links(
+        self,
+        through: Registry,
+        source_field: str,
+        target_field: str,
+        source_ids: list[int],
+        *,
+        log: bool = True,
+        from_sources: bool = False,
+    ) -> None:
+        """Transfer the link records of records and the records they link to.
+
+        Args:
+            through: The link model, e.g., `ArtifactULabel`.
+            source_field: The field of the link model that points to the
+                transferred records, e.g., `"artifact"`.
+            target_field: The field that points to the linked records, e.g., `"ulabel"`.
+            source_ids: The ids of the transferred records in the source instance.
+            log: Whether to log linked records as `mapped`.
+            from_sources: Whether to first create linked records from public
+                ontologies, see `save_validated_records()`.
+        """
+        from ._label_manager import _save_validated_records
+
+        links = []
+        for batch in _batches(source_ids):
+            links += list(
+                through.objects.using(self.db)
+                .filter(**{f"{source_field}_id__in": batch})
+                .order_by("id")
+            )
+        if not links:
+            return None
+        target_model = through._meta.get_field(target_field).related_model
+        targets = self._fetch(
+            target_model, {getattr(link, f"{target_field}_id") for link in links}
+        )
+        if from_sources and hasattr(target_model, "_ontology_id_field"):
+            _save_validated_records(targets)
+        self.records(target_model, targets, log=log)
+        self._map_foreign_keys(
+            through, links, exclude=LINK_DEFAULT_FIELDS | {source_field, target_field}
+        )
+        new_links = []
+        for link in links:
+            values = {}
+            for field in through._meta.concrete_fields:
+                if field.primary_key or field.name in LINK_DEFAULT_FIELDS:
+                    continue
+                value = getattr(link, field.attname)
+                if isinstance(field, ForeignKey):
+                    value = self._target_id(field, value)
+                values[field.attname] = value
+            new_links.append(through(**values))
+        create_links(through, source_field, new_links)
+
+    def _schema_members(self, source_ids: list[int]) -> None:
+        """Transfer the members and components of newly created schemas."""
+        from lamindb import settings
+
+        from .feature import parse_cat_dtype
+        from .schema import Schema
+
+        self.links(*_through_fields(Schema, "components"), source_ids, log=False)
+        schema_map = self.id_maps[Schema]
+        source_schema_ids = {schema_map[i]: i for i in source_ids}
+        schemas_by_itype = defaultdict(list)
+        for schema in Schema.objects.filter(id__in=list(source_schema_ids)):
+            if schema.itype is None or schema.itype == "Composite":
+                continue
+            if schema.n_members is not None and schema.n_members > (
+                settings.annotation.n_max_records
+            ):
+                logger.warning(
+                    f"skipping transfer of {schema.n_members} > {settings.annotation.n_max_records} members of {schema}"
+                )
+                continue
+            schemas_by_itype[schema.itype].append(source_schema_ids[schema.id])
+        for itype, schema_ids in schemas_by_itype.items():
+            members_registry = parse_cat_dtype(itype, is_itype=True)["registry"]
+            related_name = next(
+                rel.name
+                for rel in Schema._meta.related_objects
+                if rel.related_model is members_registry
+            )
+            self.links(*_through_fields(Schema, related_name), schema_ids, log=False)
+
+    def labels(self, registry: Registry, source_ids: list[int]) -> None:
+        """Transfer the labels of records and the features they are linked with."""
+        from ._label_manager import EXCLUDE_LABELS
+
+        related_names = dict_related_model_to_related_name(
+            registry, instance=self.db
+        ).values()
+        for related_name in related_names:
+            if (
+                related_name in EXCLUDE_LABELS
+                or related_name.startswith("_")
+                or related_name == "json_values"
+                # e.g. the blocks of an artifact aren't labels
+                or not registry._meta.get_field(related_name).many_to_many
+            ):
+                continue
+            self.links(
+                *_through_fields(registry, related_name),
+                source_ids,
+                from_sources=True,
+            )
+
+
+def transfer_records(records: QuerySet, annotations: bool = False) -> QuerySet:
+    """Transfer the records of a query set of another instance in bulk.
+
+    See :meth:`~lamindb.models.BasicQuerySet.transfer`.
+    """
+    from lamindb import context
+    from lamindb.models import Collection
+
+    db = records.db
+    if db is None or db == "default":
+        raise ValueError("Can only transfer records queried from another instance.")
+    registry = records.model
+    source_records = list(records)
+    if not source_records:
+        return registry.objects.none()
+    if issubclass(registry, IsVersioned) and not all(
+        record.is_latest for record in source_records
+    ):
+        raise NotImplementedError(
+            "You are attempting to transfer a record that's not the latest in its version history. This is currently not supported."
+        )
+    transfer_logs: dict = {
+        "mapped": [],
+        "transferred": [],
+        "run": get_transfer_run(source_records[0]),
+    }
+    transfer = BulkTransfer(db, transfer_logs)
+    transfer.records(registry, source_records, log=True)
+    source_ids = [record.id for record in source_records]
+    if registry is Collection:
+        logger.info("transfer artifacts")
+        transfer.links(*_through_fields(registry, "artifacts"), source_ids)
+    if annotations and hasattr(registry, "labels"):
+        if hasattr(registry, "schemas"):
+            transfer.links(*_through_fields(registry, "schemas"), source_ids)
+        transfer.labels(registry, source_ids)
+    for k, v in transfer_logs.items():
+        if k != "run" and len(v) > 0:
+            logger.important(f"{k}: {', '.join(v)}")
+
+    target_ids = [transfer.id_maps[registry][i] for i in source_ids]
+    if registry.__name__ in PROJECT_REGISTRIES and context.project is not None:
+        through, source_field, target_field = _through_fields(registry, "projects")
+        create_links(
+            through,
+            source_field,
+            [
+                through(
+                    **{
+                        f"{source_field}_id": target_id,
+                        f"{target_field}_id": context.project.id,
+                    }
+                )
+                for target_id in target_ids
+            ],
+        )
+    return registry.objects.filter(id__in=target_ids)
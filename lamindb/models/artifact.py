@@ -4,13 +4,13 @@ from __future__ import annotations
 import shutil
 import warnings
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path, PurePath, PurePosixPath
 from typing import TYPE_CHECKING, Any, Iterator, Literal, Union, overload
 
 import fsspec
 import lamindb_setup as ln_setup
 import pandas as pd
-from anndata import AnnData
 from django.db import ProgrammingError, models
 from django.db.models import CASCADE, PROTECT, Q
 from django.db.models.functions import Length
@@ -38,6 +38,7 @@ from lamindb.errors import FieldValidationError, NoWriteAccess, UnknownStorageLo
 from lamindb.models.query_set import QuerySet, SQLRecordList
 
 from ..base.users import current_user_id
+from ..core._compat import isinstance_if_imported
 from ..core._settings import is_read_only_connection, settings
 from ..core.loaders import load_to_memory
 from ..core.storage import (
@@ -47,14 +48,8 @@ from ..core.storage import (
     infer_suffix,
     write_to_disk,
 )
-from ..core.storage._anndata_accessor import _anndata_n_observations
-from ..core.storage._backed_access import (
-    _track_writes_factory,
-    backed_access,
-)
 from ..core.storage._polars_lazy_df import POLARS_SUFFIXES
 from ..core.storage._pyarrow_dataset import PYARROW_SUFFIXES
-from ..core.storage._tiledbsoma import _soma_n_observations
 from ..core.storage.paths import (
     AUTO_KEY_PREFIX,
     auto_storage_key_from_artifact,
@@ -62,6 +57,9 @@ from ..core.storage.paths import (
     check_path_is_child_of_root,
     filepath_cache_key_from_artifact,
     filepath_from_artifact,
+    filepaths_cache_keys_from_artifacts,
+    is_cache_up_to_date,
+    stat_cloud_files,
 )
 from ..errors import InvalidArgument, NoStorageLocationForSpace, ValidationError
 from ..models._is_versioned import (
@@ -77,7 +75,7 @@ from ._relations import (
     dict_related_model_to_related_name,
 )
 from .feature import Feature, JsonValue
-from .has_parents import view_lineage
+from .has_parents import lineage_edges, view_lineage
 from .run import Run, TracksRun, TracksUpdates, User
 from .save import check_and_attempt_clearing, check_and_attempt_upload
 from .schema import Schema
@@ -94,17 +92,10 @@ WARNING_RUN_TRANSFORM = "no run & transform got linked, call `ln.track()` & re-r
 
 WARNING_NO_INPUT = "run input wasn't tracked, call `ln.track()` and re-run"
 
-try:
-    from ..core.storage._zarr import identify_zarr_type
-except ImportError:
-
-    def identify_zarr_type(storepath):  # type: ignore
-        raise ImportError("Please install zarr: pip install 'lamindb[zarr]'")
-
-
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
+    from anndata import AnnData
     from mudata import MuData  # noqa: TC004
     from polars import LazyFrame as PolarsLazyFrame
     from pyarrow.dataset import Dataset as PyArrowDataset
@@ -235,7 +226,11 @@ def process_data(
     if key is not None:
         key_suffix = extract_suffix_from_path(PurePosixPath(key), arg_name="key")
         # use suffix as the (adata) format if the format is not provided
-        if isinstance(data, AnnData) and format is None and len(key_suffix) > 0:
+        if (
+            isinstance_if_imported(data, "anndata", "AnnData")
+            and format is None
+            and len(key_suffix) > 0
+        ):
             format = key_suffix[1:]
     else:
         key_suffix = None
@@ -260,7 +255,7 @@ def process_data(
         memory_rep = None
     elif (
         isinstance(data, pd.DataFrame)
-        or isinstance(data, AnnData)
+        or isinstance_if_imported(data, "anndata", "AnnData")
         or data_is_scversedatastructure(data, "MuData")
         or data_is_scversedatastructure(data, "SpatialData")
     ):
@@ -301,45 +296,77 @@ def get_stat_or_artifact(
     is_replace: bool = False,
     instance: str | None = None,
     skip_hash_lookup: bool = False,
+    file_stat: tuple[int | None, str | None, str | None] | None = None,
+    existing_artifacts: ExistingArtifacts | None = None,
 ) -> Union[tuple[int, str | None, str | None, int | None, Artifact | None], Artifact]:
-    """Retrieves file statistics or an existing artifact based on the path, hash, and key."""
+    """Retrieves file statistics or an existing artifact based on the path, hash, and key.
+
+    For many files, pass `file_stat` from :func:`get_file_stats` and
+    `existing_artifacts` to avoid hashing & queries per file.
+    """
     n_files = None
     if settings.creation.artifact_skip_size_hash:
         return None, None, None, n_files, None
-    stat = path.stat()  # one network request
-    if not isinstance(path, LocalPathClasses):
-        size, hash, hash_type = None, None, None
-        if stat is not None:
-            # convert UPathStatResult to fsspec info dict
-            stat = stat.as_info()
-            if (store_type := stat["type"]) == "file":
-                size, hash, hash_type = get_stat_file_cloud(stat)
-            elif store_type == "directory":
-                size, hash, hash_type, n_files = get_stat_dir_cloud(path)
+    if file_stat is not None:
+        size, hash, hash_type = file_stat
         if hash is None:
-            logger.warning(f"did not add hash for {path}")
             return size, hash, hash_type, n_files, None
     else:
-        if path.is_dir():
-            size, hash, hash_type, n_files = hash_dir(path)
+        stat = path.stat()  # one network request
+        if not isinstance(path, LocalPathClasses):
+            size, hash, hash_type = None, None, None
+            if stat is not None:
+                # convert UPathStatResult to fsspec info dict
+                stat = stat.as_info()
+                if (store_type := stat["type"]) == "file":
+                    size, hash, hash_type = get_stat_file_cloud(stat)
+                elif store_type == "directory":
+                    size, hash, hash_type, n_files = get_stat_dir_cloud(path)
+            if hash is None:
+                logger.warning(f"did not add hash for {path}")
+                return size, hash, hash_type, n_files, None
         else:
-            size, hash, hash_type = hash_file(path)
+            if path.is_dir():
+                size, hash, hash_type, n_files = hash_dir(path)
+            else:
+                size, hash, hash_type = hash_file(path)
     if not check_hash:
         return size, hash, hash_type, n_files, None
     previous_artifact_version = None
+    # folders aren't hashed before the batched queries, look them up one by one
+    if (
+        existing_artifacts is not None
+        and file_stat is not None
+        and (key is None or is_replace or key in existing_artifacts.keys)
+    ):
+        # the same logic as below but based on the result of batched queries
+        artifact_with_same_hash = (
+            None if skip_hash_lookup else existing_artifacts.by_hash.get(hash)
+        )
+        if artifact_with_same_hash is not None:
+            logger.important(
+                f"returning artifact with same hash: {artifact_with_same_hash}; to track this artifact as an input, use: ln.Artifact.get()"
+            )
+            return artifact_with_same_hash
+        if key is not None and not is_replace:
+            previous_artifact_version = existing_artifacts.by_key.get((key, storage.id))
+            if previous_artifact_version is not None:
+                logger.important(
+                    f"creating new artifact version for key '{key}' in storage '{storage.root}'"
+                )
+        return size, hash, hash_type, n_files, previous_artifact_version
     artifacts_qs = Artifact.objects.using(instance)
+    artifact_with_same_hash = None
+    queryset_same_key = None
     if skip_hash_lookup:
-        artifact_with_same_hash_exists = False
         if key is not None and not is_replace:
             # only search for a previous version of the artifact
             # ignoring hash
-            queryset_same_hash_or_same_key = artifacts_qs.filter(
+            queryset_same_key = artifacts_qs.filter(
                 ~Q(branch_id=-1),
                 key=key,
                 storage=storage,
             ).order_by("-created_at")
-        else:
-            queryset_same_hash_or_same_key = []
     else:
         # this purposefully leaves out the storage location and key that we have
         # in the hard database unique constraints
@@ -347,37 +374,132 @@ def get_stat_or_artifact(
         # storage locations and keys
         # if this is not desired, set skip_hash_lookup=True
         if key is None or is_replace:
-            queryset_same_hash = artifacts_qs.filter(~Q(branch_id=-1), hash=hash)
-            artifact_with_same_hash_exists = queryset_same_hash.count() > 0
+            artifact_with_same_hash = artifacts_qs.filter(
+                ~Q(branch_id=-1), hash=hash
+            ).first()
         else:
             # the following query achieves one more thing beyond hash lookup
             # it allows us to find a previous version of the artifact based on
             # matching key & storage even if the hash is different
-            # we do this here so that we don't have to do an additional query later
-            # see the `previous_artifact_version` variable below
-            queryset_same_hash_or_same_key = artifacts_qs.filter(
+            # if there is no artifact with the same hash, all artifacts in this
+            # query set match key & storage, see `previous_artifact_version` below
+            queryset_same_key = artifacts_qs.filter(
                 ~Q(branch_id=-1),
                 Q(hash=hash) | Q(key=key, storage=storage),
             ).order_by("-created_at")
-            queryset_same_hash = queryset_same_hash_or_same_key.filter(hash=hash)
-            artifact_with_same_hash_exists = queryset_same_hash.count() > 0
-    if key is not None and not is_replace:
-        if (
-            not artifact_with_same_hash_exists
-            and queryset_same_hash_or_same_key.count() > 0
-        ):
-            logger.important(
-                f"creating new artifact version for key '{key}' in storage '{storage.root}'"
-            )
-            previous_artifact_version = queryset_same_hash_or_same_key[0]
-    if artifact_with_same_hash_exists:
-        artifact_with_same_hash = queryset_same_hash[0]
+            artifact_with_same_hash = queryset_same_key.filter(hash=hash).first()
+    if artifact_with_same_hash is not None:
         logger.important(
             f"returning artifact with same hash: {artifact_with_same_hash}; to track this artifact as an input, use: ln.Artifact.get()"
         )
         return artifact_with_same_hash
+    if queryset_same_key is not None:
+        previous_artifact_version = queryset_same_key.first()
+        if previous_artifact_version is not None:
+            logger.important(
+                f"creating new artifact version for key '{key}' in storage '{storage.root}'"
+            )
+    return size, hash, hash_type, n_files, previous_artifact_version
+
+
+def _get_file_stat(
+    path: Path | UPath,
+) -> tuple[int | None, str | None, str | None] | None:
+    if isinstance(path, LocalPathClasses):
+        return hash_file(path)
+    stat = path.stat()
+    if stat is None:
+        return None, None, None
+    stat = stat.as_info()
+    if stat["type"] != "file":
+        return None
+    return get_stat_file_cloud(stat)
+
+
+# local files smaller than this in total are hashed one after another because
+# starting workers would take longer than hashing
+HASH_SERIAL_MAX_BYTES = 64 * 1024 * 1024
+# the number of files that are hashed or stat-ed concurrently
+HASH_MAX_WORKERS = 8
+
+
+def get_file_stats(
+    paths: list[Path | UPath], max_workers: int | None = None
+) -> list[tuple[int | None, str | None, str | None] | None]:
+    """Get size, hash & hash type of many files.
+
+    Local files are hashed and cloud files are stat-ed in a thread pool, hashing
+    releases the GIL. Local files with a total size below `HASH_SERIAL_MAX_BYTES`
+    are hashed serially. Returns `None` for paths that aren't files, e.g.,
+    directories.
+
+    Args:
+        paths: Paths of files.
+        max_workers: Maximal number of threads, defaults to `HASH_MAX_WORKERS`.
+    """
+    stats: list = [None] * len(paths)
+    # directories are hashed when constructing the artifact
+    positions = [
+        i
+        for i, path in enumerate(paths)
+        if not isinstance(path, LocalPathClasses) or path.is_file()
+    ]
+    file_paths = [paths[i] for i in positions]
+    if max_workers is None:
+        max_workers = HASH_MAX_WORKERS
+    max_workers = min(max_workers, len(file_paths))
+    if max_workers > 1 and all(
+        isinstance(path, LocalPathClasses) for path in file_paths
+    ):
+        total_bytes = sum(path.stat().st_size for path in file_paths)
+        if total_bytes < HASH_SERIAL_MAX_BYTES:
+            max_workers = 1
+    if max_workers <= 1:
+        file_stats = [_get_file_stat(path) for path in file_paths]
     else:
-        return size, hash, hash_type, n_files, previous_artifact_version
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            file_stats = list(executor.map(_get_file_stat, file_paths))
+    for i, path, stat in zip(positions, file_paths, file_stats):
+        if stat is not None and stat[1] is None:
+            logger.warning(f"did not add hash for {path}")
+        stats[i] = stat
+    return stats
+
+
+class ExistingArtifacts:
+    """Artifacts with the same hashes or keys as a batch of artifacts to create.
+
+    Queries the latest artifact by hash and by (key, storage) with a few `IN` queries
+    so that :func:`get_stat_or_artifact` doesn't need to query for every artifact.
+
+    Args:
+        hashes: Hashes of the artifacts to create.
+        keys: Keys of the artifacts to create.
+        using_key: The instance.
+    """
+
+    # to stay below the maximal number of query parameters
+    _chunk_size: int = 900
+
+    def __init__(
+        self, hashes: list[str], keys: list[str], using_key: str | None = None
+    ):
+        self.keys = set(keys)
+        self.by_hash: dict[str, Artifact] = {}
+        self.by_key: dict[tuple[str, int], Artifact] = {}
+        artifacts_qs = Artifact.objects.using(using_key).filter(~Q(branch_id=-1))
+        hashes = list(dict.fromkeys(hashes))
+        for i in range(0, len(hashes), self._chunk_size):
+            for artifact in artifacts_qs.filter(
+                hash__in=hashes[i : i + self._chunk_size]
+            ).order_by("-created_at"):
+                self.by_hash.setdefault(artifact.hash, artifact)
+        keys = list(self.keys)
+        for i in range(0, len(keys), self._chunk_size):
+            for artifact in artifacts_qs.filter(
+                key__in=keys[i : i + self._chunk_size]
+            ).order_by("-created_at"):
+                self.by_key.setdefault((artifact.key, artifact.storage_id), artifact)
 
 
 def check_path_in_existing_storage(
@@ -433,6 +555,8 @@ def get_artifact_kwargs_from_data(
     skip_hash_lookup: bool = False,
     to_disk_kwargs: dict[str, Any] | None = None,
     key_is_virtual: bool | None = None,
+    file_stat: tuple[int | None, str | None, str | None] | None = None,
+    existing_artifacts: ExistingArtifacts | None = None,
 ):
     memory_rep, path, suffix, storage, use_existing_storage_key = process_data(
         provisional_uid,
@@ -467,6 +591,8 @@ def get_artifact_kwargs_from_data(
         instance=using_key,
         is_replace=is_replace,
         skip_hash_lookup=skip_hash_lookup,
+        file_stat=file_stat,
+        existing_artifacts=existing_artifacts,
     )
     if isinstance(stat_or_artifact, Artifact):
         existing_artifact = stat_or_artifact
@@ -616,6 +742,13 @@ def data_is_scversedatastructure(
 
             # check only for local, expensive for cloud
             if fsspec.utils.get_protocol(data_path.as_posix()) == "file":
+                try:
+                    from ..core.storage._zarr import identify_zarr_type
+                except ImportError:
+                    raise ImportError(
+                        "Please install zarr: pip install 'lamindb[zarr]'"
+                    ) from None
+
                 return (
                     identify_zarr_type(
                         data_path if structure_type == "AnnData" else data,
@@ -853,13 +986,12 @@ def add_labels(
             )
         records = records_validated
 
-    for record in records:
-        if record._state.adding:
-            raise ValidationError(
-                f"{record} not validated. If it looks correct: record.save()"
-            )
-
     if feature is None:
+        for record in records:
+            if record._state.adding:
+                raise ValidationError(
+                    f"{record} not validated. If it looks correct: record.save()"
+                )
         d = dict_related_model_to_related_name(self.__class__)
         # strategy: group records by registry to reduce number of transactions
         records_by_related_name: dict = {}
@@ -873,46 +1005,69 @@ def add_labels(
         for related_name, records in records_by_related_name.items():
             getattr(self, related_name).add(*records)
     else:
-        validate_feature(feature, records)  # type:ignore
-        records_by_registry = defaultdict(list)
+        features_labels = get_features_labels(
+            self, records, feature, from_curator=from_curator
+        )
+        if features_labels:
+            self.features._add_label_feature_links(features_labels)
+
+
+def get_features_labels(
+    self,
+    records: list[SQLRecord],
+    feature: Feature,
+    *,
+    from_curator: bool = False,
+) -> dict[str, list[tuple[Feature, SQLRecord]]]:
+    """Validate label records for a feature and group them by registry.
+
+    Returns a dictionary that maps registry names onto (feature, record) tuples
+    that can be passed to `FeatureManager._add_label_feature_links()`.
+    """
+    for record in records:
+        if record._state.adding:
+            raise ValidationError(
+                f"{record} not validated. If it looks correct: record.save()"
+            )
+    validate_feature(feature, records)  # type:ignore
+    records_by_registry = defaultdict(list)
+    internal_features = set()  # type: ignore
+    # curators annotate features measured within the dataset
+    if not from_curator:
         schemas = self.schemas.filter(itype="Feature")
-        internal_features = set()  # type: ignore
         if len(schemas) > 0:
             for schema in schemas:
                 internal_features = internal_features.union(
                     set(schema.members.values_list("name", flat=True))
                 )  # type: ignore
-        for record in records:
-            records_by_registry[record.__class__.__get_name_with_module__()].append(
-                record
+    for record in records:
+        records_by_registry[record.__class__.__get_name_with_module__()].append(record)
+    features_labels = {}
+    for registry_name, records in records_by_registry.items():
+        if not from_curator and feature.name in internal_features:
+            raise ValidationError(
+                "Cannot manually annotate a feature measured *within* the dataset. Please use a Curator."
             )
-        for registry_name, records in records_by_registry.items():
-            if not from_curator and feature.name in internal_features:
+        dtype_str = feature._dtype_str
+        if registry_name not in dtype_str:
+            if not dtype_str.startswith("cat"):
                 raise ValidationError(
-                    "Cannot manually annotate a feature measured *within* the dataset. Please use a Curator."
+                    f"Feature {feature.name} needs dtype='cat' for label annotation, currently has dtype='{dtype_str}'"
                 )
-            dtype_str = feature._dtype_str
             if registry_name not in dtype_str:
-                if not dtype_str.startswith("cat"):
-                    raise ValidationError(
-                        f"Feature {feature.name} needs dtype='cat' for label annotation, currently has dtype='{dtype_str}'"
-                    )
-                if registry_name not in dtype_str:
-                    new_dtype = dtype_str.rstrip("]") + f"|{registry_name}]"
-                    raise ValidationError(
-                        f"Label type {registry_name} is not valid for Feature(name='{feature.name}', dtype='{dtype_str}'), consider a feature with dtype='{new_dtype}'"
-                    )
-            if registry_name not in self.features._accessor_by_registry:
-                logger.warning(f"skipping {registry_name}")
-                continue
-            if len(records) == 0:
-                continue
-            features_labels = {
-                registry_name: [(feature, label_record) for label_record in records]
-            }
-            self.features._add_label_feature_links(
-                features_labels,
-            )
+                new_dtype = dtype_str.rstrip("]") + f"|{registry_name}]"
+                raise ValidationError(
+                    f"Label type {registry_name} is not valid for Feature(name='{feature.name}', dtype='{dtype_str}'), consider a feature with dtype='{new_dtype}'"
+                )
+        if registry_name not in self.features._accessor_by_registry:
+            logger.warning(f"skipping {registry_name}")
+            continue
+        if len(records) == 0:
+            continue
+        features_labels[registry_name] = [
+            (feature, label_record) for label_record in records
+        ]
+    return features_labels
 
 
 def delete_permanently(artifact: Artifact, storage: bool, using_key: str):
@@ -1506,6 +1661,9 @@ class Artifact(SQLRecord, IsVersioned, TracksRun, TracksUpdates):
         _key_is_virtual = kwargs.pop("_key_is_virtual", None)
         _is_internal_call = kwargs.pop("_is_internal_call", False)
         skip_check_exists = kwargs.pop("skip_check_exists", False)
+        # precomputed in Artifact.from_dir()
+        file_stat = kwargs.pop("_file_stat", None)
+        existing_artifacts = kwargs.pop("_existing_artifacts", None)
         storage_was_passed = False
         if "storage" in kwargs:
             storage = kwargs.pop("storage")
@@ -1604,6 +1762,8 @@ class Artifact(SQLRecord, IsVersioned, TracksRun, TracksUpdates):
             skip_hash_lookup=skip_hash_lookup,
             to_disk_kwargs=to_disk_kwargs,
             key_is_virtual=_key_is_virtual,
+            file_stat=file_stat,
+            existing_artifacts=existing_artifacts,
         )
 
         # an object with the same hash already exists
@@ -2053,6 +2213,8 @@ class Artifact(SQLRecord, IsVersioned, TracksRun, TracksUpdates):
         """
         from lamindb import examples
 
+        from ..core.storage._anndata_accessor import _anndata_n_observations
+
         if not data_is_scversedatastructure(adata, "AnnData"):
             raise ValueError(
                 "data has to be an AnnData object or a path to AnnData-like"
@@ -2272,6 +2434,8 @@ class Artifact(SQLRecord, IsVersioned, TracksRun, TracksUpdates):
             kind="dataset",
             **kwargs,
         )
+        from ..core.storage._tiledbsoma import _soma_n_observations
+
         artifact.n_observations = _soma_n_observations(artifact.path)
         return artifact
 
@@ -2285,6 +2449,8 @@ class Artifact(SQLRecord, IsVersioned, TracksRun, TracksUpdates):
     ) -> SQLRecordList:
         """Create a list of :class:`~lamindb.Artifact` objects from a directory.
 
+        Files are hashed in parallel, see :attr:`~lamindb.core.subsettings.CreationSettings.artifact_hash_max_workers`.
+
         Hint:
             If you have a high number of files (several 100k) and don't want to
             track them individually, create a single :class:`~lamindb.Artifact` via
@@ -2331,16 +2497,45 @@ class Artifact(SQLRecord, IsVersioned, TracksRun, TracksUpdates):
         verbosity_int = settings._verbosity_int
         if verbosity_int >= 1:
             settings.verbosity = "warning"
+        filepaths = [
+            filepath for filepath in folderpath.rglob("*") if filepath.is_file()
+        ]
+        artifact_keys = [
+            folder_key
+            + "/"
+            + get_relative_path_to_directory(filepath, folderpath).as_posix()
+            for filepath in filepaths
+        ]
+        # hash in parallel and look up existing artifacts & previous versions
+        # in batches rather than once per file
+        file_stats: list = [None] * len(filepaths)
+        existing_artifacts = None
+        if filepaths and not settings.creation.artifact_skip_size_hash:
+            file_stats = get_file_stats(
+                filepaths, max_workers=settings.creation.artifact_hash_max_workers
+            )
+            existing_artifacts = ExistingArtifacts(
+                [stat[1] for stat in file_stats if stat and stat[1] is not None],
+                artifact_keys,
+                using_key=using_key,
+            )
+        # passing the storage avoids a storage lookup per file
+        storage_kwargs = {"storage": storage} if use_existing_storage else {}
         artifacts_dict = {}
-        for filepath in folderpath.rglob("*"):
-            if filepath.is_file():
-                relative_path = get_relative_path_to_directory(filepath, folderpath)
-                artifact_key = folder_key + "/" + relative_path.as_posix()
-                # if creating from rglob, we don't need to check for existence
-                artifact = Artifact(
-                    filepath, run=run, key=artifact_key, skip_check_exists=True
-                )
-                artifacts_dict[artifact.uid] = artifact
+        for filepath, artifact_key, file_stat in zip(
+            filepaths, artifact_keys, file_stats
+        ):
+            # if creating from rglob, we don't need to check for existence
+            artifact = Artifact(
+                filepath,
+                run=run,
+                key=artifact_key,
+                skip_check_exists=True,
+                _file_stat=file_stat,
+                _existing_artifacts=existing_artifacts,
+                **storage_kwargs,
+            )
+            artifacts_dict[artifact.uid] = artifact
         settings.verbosity = verbosity
 
         # run sanity check on hashes
@@ -2388,6 +2583,109 @@ class Artifact(SQLRecord, IsVersioned, TracksRun, TracksUpdates):
         )
         return artifacts
 
+    @classmethod
+    def from_paths(
+        cls,
+        paths: list[UPathStr],
+        keys: list[str | None] | None = None,
+        *,
+        run: Run | None = None,
+        skip_hash_lookup: bool = False,
+        **kwargs,
+    ) -> SQLRecordList:
+        """Create a list of :class:`~lamindb.Artifact` objects from many paths.
+
+        Equivalent to calling ``Artifact(path, key=key)`` for every path but hashes the
+        files in parallel and looks up artifacts with the same hash and previous
+        versions with the same key in a few batched queries rather than in a few
+        queries per path.
+
+        As with the single-path constructor, an existing artifact is returned if
+        a file with the same hash is already registered.
+
+        Args:
+            paths: Paths of files or folders.
+            keys: Keys of the artifacts, one per path. If `None`, keys are inferred
+                like in the single-path constructor.
+            run: A `Run` object.
+            skip_hash_lookup: Skip the hash lookup so that new artifacts are created
+                even if artifacts with the same hashes exist.
+            **kwargs: Further arguments passed to every `Artifact()` call, e.g., `description`.
+
+        Example::
+
+            import lamindb as ln
+
+            artifacts = ln.Artifact.from_paths(
+                ["sample1.fastq.gz", "sample2.fastq.gz"],
+                keys=["fastq/sample1.fastq.gz", "fastq/sample2.fastq.gz"],
+            )
+            artifacts.save()
+        """
+        if keys is not None and len(keys) != len(paths):
+            raise ValueError(
+                f"Got {len(paths)} paths but {len(keys)} keys, pass one key per path."
+            )
+        using_key = settings._using_key
+        filepaths = [create_path(path) for path in paths]
+        filepaths = [
+            filepath.resolve()
+            if filepath.protocol not in {"http", "https"}
+            else filepath
+            for filepath in filepaths
+        ]
+        if keys is None:
+            # infer keys of paths in existing storage locations so that previous
+            # versions can be looked up in the batch
+            storage_roots = [
+                UPath(root)
+                for root in Storage.objects.using(using_key)
+                .order_by(Length("root").desc())
+                .values_list("root", flat=True)
+            ]
+            lookup_keys = []
+            for filepath in filepaths:
+                for root in storage_roots:
+                    if check_path_is_child_of_root(filepath, root=root):
+                        lookup_keys.append(
+                            get_relative_path_to_directory(filepath, root).as_posix()
+                        )
+                        break
+            artifact_keys: list[str | None] = [None] * len(filepaths)
+        else:
+            lookup_keys = [key for key in keys if key is not None]
+            artifact_keys = list(keys)
+        file_stats: list = [None] * len(filepaths)
+        existing_artifacts = None
+        if filepaths and not settings.creation.artifact_skip_size_hash:
+            file_stats = get_file_stats(
+                filepaths, max_workers=settings.creation.artifact_hash_max_workers
+            )
+            existing_artifacts = ExistingArtifacts(
+                []
+                if skip_hash_lookup
+                else [stat[1] for stat in file_stats if stat and stat[1] is not None],
+                lookup_keys,
+                using_key=using_key,
+            )
+        artifacts = SQLRecordList(
+            [
+                Artifact(
+                    filepath,
+                    key=artifact_key,
+                    run=run,
+                    skip_hash_lookup=skip_hash_lookup,
+                    _file_stat=file_stat,
+                    _existing_artifacts=existing_artifacts,
+                    **kwargs,
+                )
+                for filepath, artifact_key, file_stat in zip(
+                    filepaths, artifact_keys, file_stats
+                )
+            ]
+        )
+        return artifacts
+
     def replace(
         self,
         data: Union[UPathStr, pd.DataFrame, AnnData, MuData],
@@ -2540,6 +2838,8 @@ class Artifact(SQLRecord, IsVersioned, TracksRun, TracksUpdates):
             is_run_input: Whether to track this artifact as run input.
             **kwargs: Keyword arguments for the accessor, i.e. `h5py` or `zarr` connection,
                 `pyarrow.dataset.dataset`, `polars.scan_*` function.
+                For `AnnData`, pass `cache_index=True` to cache the `obs` & `var` names
+                on disk, they are then memory-mapped instead of read from the store.
 
         Returns:
             Streaming accessors, in particular,
@@ -2570,6 +2870,11 @@ class Artifact(SQLRecord, IsVersioned, TracksRun, TracksUpdates):
                 #> pyarrow._dataset.FileSystemDataset
 
         """
+        from ..core.storage._backed_access import (
+            _track_writes_factory,
+            backed_access,
+        )
+
         if self._overwrite_versions and not self.is_latest:
             raise ValueError(INCONSISTENT_STATE_MSG)
         # all hdf5 suffixes including gzipped
@@ -2966,6 +3271,72 @@ def _synchronize_cleanup_on_error(
     return cache_path
 
 
+# the number of artifacts that are synchronized concurrently
+CACHE_MAX_WORKERS = 8
+
+
+def cache_artifacts(
+    artifacts: list[Artifact],
+    *,
+    max_workers: int | None = None,
+    mute: bool = False,
+) -> list[UPath]:
+    """Download artifacts to the local cache concurrently.
+
+    Resolves the paths of all artifacts with one query for their storage
+    locations, skips files whose cache is up to date based on a batch of
+    concurrent stat requests and synchronizes the remaining artifacts in a
+    thread pool. Returns the cache paths in the order of `artifacts`.
+    """
+    from lamindb_setup.core.upath import print_hook
+
+    for artifact in artifacts:
+        if artifact._overwrite_versions and not artifact.is_latest:
+            raise ValueError(INCONSISTENT_STATE_MSG)
+    filepaths_cache_keys = filepaths_cache_keys_from_artifacts(
+        artifacts, using_key=settings._using_key
+    )
+    cache_paths: list[UPath | None] = [None] * len(artifacts)
+    cloud_indices = [
+        i
+        for i, (filepath, _) in enumerate(filepaths_cache_keys)
+        if not isinstance(filepath, LocalPathClasses)
+    ]
+    cloud_stats = stat_cloud_files([filepaths_cache_keys[i][0] for i in cloud_indices])
+    for i, cloud_stat in zip(cloud_indices, cloud_stats):
+        if cloud_stat is None:
+            continue
+        filepath, cache_key = filepaths_cache_keys[i]
+        cache_path = setup_settings.paths.cloud_to_local_no_update(
+            filepath, cache_key=cache_key
+        )
+        if is_cache_up_to_date(filepath, cloud_stat, cache_path):
+            cache_paths[i] = cache_path
+    to_sync = [i for i, cache_path in enumerate(cache_paths) if cache_path is None]
+    if max_workers is None:
+        max_workers = CACHE_MAX_WORKERS
+    # aggregate progress over all artifacts if anything needs to be downloaded
+    print_progress = not mute and not set(to_sync).isdisjoint(cloud_indices)
+
+    def synchronize(i: int) -> UPath:
+        filepath, cache_key = filepaths_cache_keys[i]
+        # concurrent progress bars would garble the output
+        return _synchronize_cleanup_on_error(
+            filepath, cache_key=cache_key, print_progress=False
+        )
+
+    objectname = f"{len(to_sync)} artifacts"
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(to_sync)))
+    ) as executor:
+        futures = {executor.submit(synchronize, i): i for i in to_sync}
+        for n_done, future in enumerate(as_completed(futures), start=1):
+            cache_paths[futures[future]] = future.result()
+            if print_progress:
+                print_hook(len(to_sync), n_done, objectname, "synchronizing")
+    return cache_paths  # type: ignore
+
+
 def _delete_skip_storage(artifact, *args, **kwargs) -> None:
     super(SQLRecord, artifact).delete(*args, **kwargs)
 
@@ -3199,6 +3570,7 @@ def track_run_input(
 Artifact._delete_skip_storage = _delete_skip_storage
 Artifact._save_skip_storage = _save_skip_storage
 Artifact.view_lineage = view_lineage
+Artifact.lineage_edges = lineage_edges
 
 
 # PostgreSQL migration helper for _save_completed to _aux["storage_completed"]
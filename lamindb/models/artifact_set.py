@@ -9,8 +9,6 @@ from lamin_utils import logger
 from lamindb_setup.core._docs import doc_args
 from upath import UPath
 
-from ..core._mapped_collection import MappedCollection
-from ..core.storage._backed_access import _open_dataframe
 from .artifact import Artifact, track_run_input
 from .collection import Collection, _load_concat_artifacts
 
@@ -21,6 +19,8 @@ if TYPE_CHECKING:
     from polars import LazyFrame as PolarsLazyFrame
     from pyarrow.dataset import Dataset as PyArrowDataset
 
+    from ..core._mapped_collection import MappedCollection
+
 
 UNORDERED_WARNING = (
     "this query set is unordered, consider using `.order_by()` first "
@@ -46,6 +46,9 @@ class ArtifactSet(Iterable):
         self,
         join: Literal["inner", "outer"] = "outer",
         is_run_input: bool | None = None,
+        *,
+        max_workers: int | None = None,
+        on_disk: bool = False,
         **kwargs,
     ) -> DataFrame | AnnData:
         """{}"""  # noqa: D415
@@ -53,7 +56,9 @@ class ArtifactSet(Iterable):
             logger.warning(UNORDERED_WARNING)
 
         artifacts: list[Artifact] = list(self)
-        concat_object = _load_concat_artifacts(artifacts, join, **kwargs)
+        concat_object = _load_concat_artifacts(
+            artifacts, join, max_workers=max_workers, on_disk=on_disk, **kwargs
+        )
         # track only if successful
         track_run_input(artifacts, is_run_input)
         return concat_object
@@ -72,6 +77,8 @@ class ArtifactSet(Iterable):
         artifacts: list[Artifact] = list(self)
         paths: list[UPath] = [artifact.path for artifact in artifacts]
 
+        from ..core.storage._backed_access import _open_dataframe
+
         dataframe = _open_dataframe(paths, engine=engine, **kwargs)
         # track only if successful
         track_run_input(artifacts, is_run_input)
@@ -108,6 +115,20 @@ class ArtifactSet(Iterable):
             else:
                 paths.append(artifact.path)
             artifacts.append(artifact)
+        from ..core._mapped_collection import MappedCollection, mapped_manifest_path
+
+        # the index of the stores is reused across calls with the same arguments
+        manifest = mapped_manifest_path(
+            [artifact.hash for artifact in artifacts],
+            layers_keys,
+            obs_keys,
+            obsm_keys,
+            obs_filter,
+            join,
+            encode_labels,
+            unknown_label,
+            cache_categories,
+        )
         ds = MappedCollection(
             paths,
             layers_keys,
@@ -120,6 +141,7 @@ class ArtifactSet(Iterable):
             cache_categories,
             parallel,
             dtype,
+            manifest=manifest,
         )
         # track only if successful
         track_run_input(artifacts, is_run_input)
@@ -4,8 +4,11 @@ from typing import TYPE_CHECKING, Iterable, Literal, Union
 
 import numpy as np
 import pandas as pd
-from django.core.exceptions import FieldDoesNotExist
-from django.db.models import Manager, QuerySet
+from django.core.exceptions import EmptyResultSet, FieldDoesNotExist
+from django.db import connections
+from django.db.models import Manager, Q, QuerySet
+from django.db.models.functions import Lower
+from django.db.models.signals import post_delete, post_save
 from lamin_utils import colors, logger
 
 from lamindb.base.utils import strict_classmethod
@@ -51,6 +54,225 @@ def _concat_lists(values: ListLike | str) -> list[str]:
     return values
 
 
+# maximal number of values per `field__in` lookup
+MAX_VALUES_PER_QUERY = 10_000
+# up to this number of unmatched values, synonyms are searched with `icontains`
+# beyond it, all records with synonyms are fetched
+MAX_SYNONYM_LOOKUPS = 1_000
+SYNONYM_LOOKUPS_PER_QUERY = 100
+
+# in-process cache of registry values, see `settings.annotation.cache_registry_values`
+# maps (db, registry, query, field, synonyms field) to a _RegistryValues
+_registry_values_cache: dict[tuple, _RegistryValues] = {}
+
+
+class _RegistryValues:
+    """Field values & synonyms of a registry indexed for lookups."""
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        field: str,
+        synonyms_field: str | None,
+        is_str_field: bool,
+    ):
+        self.df = df.reset_index(drop=True)
+        self.field = field
+        self.lower = self.df[field].str.lower() if is_str_field else None
+        self.synonyms = None
+        if synonyms_field is not None:
+            synonyms = self.df[synonyms_field]
+            synonyms = synonyms[synonyms.fillna("").astype(bool)]
+            self.synonyms = synonyms.str.lower().str.split("|").explode()
+
+    def lookup(
+        self,
+        values: list,
+        lower_values: list[str] | None,
+        include_empty: bool,
+        with_synonyms: bool,
+    ) -> pd.DataFrame:
+        field_values = self.df[self.field]
+        mask = field_values.isin(values)
+        if lower_values is not None and self.lower is not None:
+            mask |= self.lower.isin(lower_values)
+        if include_empty:
+            mask |= field_values.isna() | (field_values == "")
+        if with_synonyms and self.synonyms is not None:
+            lowered = {v.lower() for v in values if isinstance(v, str)}
+            if self.lower is not None:
+                lowered.difference_update(self.lower[self.lower.isin(lowered)])
+            matched = self.synonyms[self.synonyms.isin(lowered)]
+            mask |= self.df.index.isin(matched.index)
+        return self.df[mask]
+
+
+def clear_registry_values_cache(registry: type[SQLRecord] | None = None) -> None:
+    """Clear cached registry values, see `settings.annotation.cache_registry_values`."""
+    if not _registry_values_cache:
+        return
+    for key in list(_registry_values_cache):
+        if registry is None or issubclass(key[1], registry):
+            _registry_values_cache.pop(key, None)
+
+
+def _clear_registry_values_cache_receiver(sender, **kwargs) -> None:
+    clear_registry_values_cache(sender)
+
+
+def _get_registry_values(
+    queryset: QuerySet,
+    columns: list[str],
+    field: str,
+    synonyms_field: str | None,
+    is_str_field: bool,
+) -> _RegistryValues | None:
+    try:
+        query = str(queryset.query)
+    except EmptyResultSet:
+        return None
+    registry = queryset.model
+    key = (queryset.db, registry, query, tuple(columns))
+    if key not in _registry_values_cache:
+        dispatch_uid = (
+            f"clear_registry_values_cache:{registry.__module__}.{registry.__name__}"
+        )
+        post_save.connect(
+            _clear_registry_values_cache_receiver,
+            sender=registry,
+            dispatch_uid=dispatch_uid,
+        )
+        post_delete.connect(
+            _clear_registry_values_cache_receiver,
+            sender=registry,
+            dispatch_uid=dispatch_uid,
+        )
+        df = pd.DataFrame.from_records(
+            queryset.order_by(registry._meta.pk.name).values_list(*columns),
+            columns=columns,
+        )
+        _registry_values_cache[key] = _RegistryValues(
+            df, field, synonyms_field, is_str_field
+        )
+    return _registry_values_cache[key]
+
+
+def _chunks(values: list, size: int) -> Iterable[list]:
+    for i in range(0, len(values), size):
+        yield values[i : i + size]
+
+
+def _query_candidate_records(
+    queryset: QuerySet,
+    values: Iterable,
+    field: str,
+    *,
+    case_sensitive: bool = True,
+    synonyms_field: str | None = None,
+) -> pd.DataFrame:
+    """Query the records of a registry that can match the values.
+
+    Rather than loading the whole registry, matches on `field` are looked up
+    in the database with `field__in`, chunked to respect the parameter limit of the backend.
+
+    Args:
+        queryset: The records to match against.
+        values: The values to match.
+        field: The field to match the values against.
+        case_sensitive: If `False`, also query records that match up to casing.
+        synonyms_field: If passed, also query records that have a synonym that
+            may match one of the values that have no match on `field`.
+
+    Returns:
+        A DataFrame with columns primary key, `field` and `synonyms_field`
+        of the candidate records ordered by primary key.
+    """
+    registry = queryset.model
+    pk_name = registry._meta.pk.name
+    columns = list(
+        dict.fromkeys(
+            [pk_name, field] + ([synonyms_field] if synonyms_field is not None else [])
+        )
+    )
+    # .tolist() converts numpy scalars into python objects the database can adapt
+    values_index = pd.Index(list(values)).unique()
+    is_empty = values_index.isna() | (values_index == "")
+    include_empty = bool(is_empty.any())
+    values = values_index[~is_empty].tolist()
+    try:
+        is_str_field = registry._meta.get_field(field).get_internal_type() in {
+            "CharField",
+            "TextField",
+        }
+    except FieldDoesNotExist:
+        is_str_field = False
+    lower_values = None
+    if not case_sensitive and is_str_field:
+        lower_values = list({v.lower() for v in values if isinstance(v, str)})
+
+    from ..core._settings import settings
+
+    if settings.annotation.cache_registry_values:
+        registry_values = _get_registry_values(
+            queryset, columns, field, synonyms_field, is_str_field
+        )
+        if registry_values is None:
+            return pd.DataFrame(columns=columns)
+        return registry_values.lookup(
+            values, lower_values, include_empty, synonyms_field is not None
+        )
+
+    max_query_params = connections[queryset.db].features.max_query_params
+    chunk_size = min(max_query_params or MAX_VALUES_PER_QUERY, MAX_VALUES_PER_QUERY)
+    # leave room for the parameters of the filters on the queryset
+    chunk_size = max(chunk_size - 100, 1)
+    # filters are passed as Q objects so that they're not interpreted as features
+    records = []
+    if lower_values is not None:
+        queryset_lower = queryset.annotate(_lower_field=Lower(field))
+        for chunk in _chunks(lower_values, chunk_size):
+            records += queryset_lower.filter(Q(_lower_field__in=chunk)).values_list(
+                *columns
+            )
+    else:
+        for chunk in _chunks(values, chunk_size):
+            records += queryset.filter(Q(**{f"{field}__in": chunk})).values_list(
+                *columns
+            )
+    if include_empty:
+        empty_filter = Q(**{f"{field}__isnull": True})
+        if is_str_field:
+            empty_filter |= Q(**{field: ""})
+        records += queryset.filter(empty_filter).values_list(*columns)[:1]
+    if synonyms_field is not None:
+        field_position = columns.index(field)
+        matched = {
+            r[field_position].lower()
+            for r in records
+            if isinstance(r[field_position], str)
+        }
+        synonym_values = [
+            v for v in values if isinstance(v, str) and v.lower() not in matched
+        ]
+        queryset_synonyms = queryset.exclude(
+            **{f"{synonyms_field}__isnull": True}
+        ).exclude(**{synonyms_field: ""})
+        if len(synonym_values) > MAX_SYNONYM_LOOKUPS:
+            records += queryset_synonyms.values_list(*columns)
+        else:
+            for chunk in _chunks(synonym_values, SYNONYM_LOOKUPS_PER_QUERY):
+                synonyms_filter = Q()
+                for value in chunk:
+                    synonyms_filter |= Q(**{f"{synonyms_field}__icontains": value})
+                records += queryset_synonyms.filter(synonyms_filter).values_list(
+                    *columns
+                )
+    df = pd.DataFrame.from_records(records, columns=columns)
+    return (
+        df.drop_duplicates(subset=[pk_name]).sort_values(pk_name).reset_index(drop=True)
+    )
+
+
 def _inspect(
     cls,
     values: ListLike,
@@ -87,9 +309,24 @@ def _inspect(
     if hasattr(registry, "_name_field") and field_str != registry._name_field:
         standardize = False
 
-    # inspect in the DB
+    if organism_record is not None:
+        queryset = queryset.filter(organism=organism_record)
+    synonyms_field = None
+    if standardize:
+        try:
+            synonyms_field = registry._meta.get_field("synonyms").name
+        except FieldDoesNotExist:
+            pass
+
+    # inspect in the DB against the records that can match
     result_db = inspect(
-        df=_filter_queryset_with_organism(queryset=queryset, organism=organism_record),
+        df=_query_candidate_records(
+            queryset,
+            values,
+            field_str,
+            case_sensitive=False,
+            synonyms_field=synonyms_field,
+        ),
         identifiers=values,
         field=field_str,
         standardize=standardize,
@@ -183,25 +420,24 @@ def _validate(
         getattr(registry, field_str), organism, values, queryset.db
     )
     _check_if_record_in_db(organism_record, queryset.db)
-    field_values = pd.Series(
-        _filter_queryset_with_organism(
-            queryset=queryset,
-            organism=organism_record,
-            values_list_field=field_str,
-        ),
-        dtype="object",
-    )
-    if field_values.empty:
+    if organism_record is not None:
+        queryset = queryset.filter(organism=organism_record)
+    # a single value to check for an empty registry and type compatibility
+    field_values = list(queryset.values_list(field_str, flat=True)[:1])
+    if not field_values:
         if not mute:
             msg = f"Your {queryset.model.__name__} registry is empty, consider populating it first!"
             if hasattr(queryset.model, "source_id"):
                 msg += "\n   → use `.import_source()` to import records from a source, e.g. a public ontology"
             logger.warning(msg)
         return np.array([False] * len(values))
+    field_values += _query_candidate_records(queryset, values, field_str)[
+        field_str
+    ].tolist()
 
     result = validate(
         identifiers=values,
-        field_values=field_values,
+        field_values=pd.Series(field_values, dtype="object"),
         case_sensitive=True,
         mute=mute,
         field=field_str,
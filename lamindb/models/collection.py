@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, Literal, overload
 
-import anndata as ad
+import numpy as np
 import pandas as pd
 from django.db import models
 from django.db.models import CASCADE, PROTECT, Q
@@ -18,19 +21,18 @@ from lamindb.base.fields import (
 from lamindb.base.utils import strict_classmethod
 
 from ..base.uids import base62_20
-from ..core._mapped_collection import MappedCollection
-from ..core.storage._backed_access import _open_dataframe
 from ..errors import FieldValidationError
 from ..models._is_versioned import process_revises
 from ._is_versioned import IsVersioned
 from .artifact import (
     Artifact,
+    cache_artifacts,
     get_run,
     populate_subsequent_run,
     save_schema_links,
     track_run_input,
 )
-from .has_parents import view_lineage
+from .has_parents import lineage_edges, view_lineage
 from .run import Run, TracksRun, TracksUpdates
 from .sqlrecord import (
     BaseSQLRecord,
@@ -43,10 +45,14 @@ from .sqlrecord import (
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Iterator
+    from pathlib import Path
 
+    import anndata as ad
+    import pyarrow as pa
     from polars import LazyFrame as PolarsLazyFrame
     from pyarrow.dataset import Dataset as PyArrowDataset
 
+    from ..core._mapped_collection import MappedCollection
     from ..core.storage import UPath
     from .block import CollectionBlock
     from .project import Project, Reference
@@ -56,28 +62,172 @@ if TYPE_CHECKING:
     from .ulabel import ULabel
 
 
+# the number of artifacts that are downloaded and parsed concurrently
+LOAD_MAX_WORKERS = 4
+
+
+def _map_concurrently(func, items: list, max_workers: int | None) -> list:
+    """Apply `func` to items in a thread pool, preserving the order."""
+    if max_workers is None:
+        max_workers = LOAD_MAX_WORKERS
+    max_workers = min(max_workers, len(items))
+    if max_workers <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, items))
+
+
+def _parquet_index(table: pa.Table, name: str | None) -> pd.Index:
+    """The pandas index of a table that is read from a parquet file."""
+    index_columns = table.schema.pandas_metadata["index_columns"]
+    if not index_columns:
+        return pd.RangeIndex(table.num_rows)
+    index_column = index_columns[0]
+    # a RangeIndex is only stored in the metadata
+    if isinstance(index_column, dict):
+        return pd.RangeIndex(
+            index_column["start"],
+            index_column["stop"],
+            index_column["step"],
+            name=index_column["name"],
+        )
+    return pd.Index(table.column(index_column).to_numpy(), name=name)
+
+
+def _concat_parquet(
+    cache_paths: list[Path], max_workers: int | None
+) -> pd.DataFrame | None:
+    """Concatenate parquet files into a preallocated dataframe.
+
+    Unlike `pd.concat()` of the loaded dataframes, this holds at most
+    `max_workers` arrow tables in memory next to the result. Returns `None` if
+    the result would differ from `pd.concat()`, e.g., if the schemas differ.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schemas = [pq.read_schema(path) for path in cache_paths]
+    schema = schemas[0]
+    if (
+        schema.pandas_metadata is None
+        or not all(
+            other.remove_metadata().equals(schema.remove_metadata())
+            # the pandas dtypes are stored in the metadata
+            and other.pandas_metadata["columns"] == schema.pandas_metadata["columns"]
+            for other in schemas[1:]
+        )
+    ):
+        return None
+    index_columns = schema.pandas_metadata["index_columns"]
+    empty_df = schema.empty_table().to_pandas()
+    # extension dtypes like categoricals are merged differently by pd.concat()
+    if len(index_columns) > 1 or not all(
+        isinstance(dtype, np.dtype)
+        for dtype in (*empty_df.dtypes, empty_df.index.dtype)
+    ):
+        return None
+    field_names = [name for name in schema.names if name not in index_columns]
+    n_rows = sum(pq.read_metadata(path).num_rows for path in cache_paths)
+    result = pd.DataFrame(
+        {i: np.empty(n_rows, dtype=dtype) for i, dtype in enumerate(empty_df.dtypes)}
+    )
+    if max_workers is None:
+        max_workers = LOAD_MAX_WORKERS
+    indexes = []
+    start = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # keep at most max_workers tables in memory, reading releases the GIL
+        paths = iter(cache_paths)
+        pending = deque(
+            executor.submit(pq.read_table, path)
+            for path in itertools.islice(paths, max_workers)
+        )
+        while pending:
+            table = pending.popleft().result()
+            if (path := next(paths, None)) is not None:
+                pending.append(executor.submit(pq.read_table, path))
+            stop = start + table.num_rows
+            for i, (name, dtype) in enumerate(zip(field_names, empty_df.dtypes)):
+                column = table.column(name)
+                # pandas converts integers with missing values to floats
+                if column.null_count > 0 and dtype.kind in "iub":
+                    for future in pending:
+                        future.cancel()
+                    return None
+                result.iloc[start:stop, i] = column.to_numpy()
+            indexes.append(_parquet_index(table, empty_df.index.name))
+            start = stop
+            del table
+            pa.default_memory_pool().release_unused()
+    result.columns = empty_df.columns
+    result.index = indexes[0].append(indexes[1:])
+    return result
+
+
 def _load_concat_artifacts(
-    artifacts: list[Artifact], join: Literal["inner", "outer"] = "outer", **kwargs
+    artifacts: list[Artifact],
+    join: Literal["inner", "outer"] = "outer",
+    *,
+    max_workers: int | None = None,
+    on_disk: bool = False,
+    **kwargs,
 ) -> pd.DataFrame | ad.AnnData:
+    artifacts = list(artifacts)
     suffixes = {artifact.suffix for artifact in artifacts}
     if len(suffixes) != 1:
         raise ValueError(
             "Can only load collections where all artifacts have the same suffix"
         )
+    suffix = suffixes.pop()
 
     # because we're tracking data flow on the collection-level, here, we don't
     # want to track it on the artifact-level
-    first_object = artifacts[0].load(is_run_input=False)
-    is_dataframe = isinstance(first_object, pd.DataFrame)
-    is_anndata = isinstance(first_object, ad.AnnData)
+    import anndata as ad
+
+    artifact_uids = [artifact.uid for artifact in artifacts]
+
+    if on_disk:
+        if suffix not in {".h5ad", ".zarr"}:
+            raise ValueError(f"Can only concatenate AnnData on disk, not {suffix}.")
+        from anndata.experimental import concat_on_disk
+        from lamindb_setup import settings as setup_settings
+        from lamindb_setup.core.hashing import hash_string
+
+        kwargs.setdefault("label", "artifact_uid")
+        kwargs.setdefault("keys", artifact_uids)
+        # the file is determined by the artifacts and all arguments of the concat
+        concat_args = repr((artifact_uids, join, sorted(kwargs.items())))
+        out_file = (
+            setup_settings.cache_dir / "concat" / f"{hash_string(concat_args)}.h5ad"
+        )
+        if not out_file.exists():
+            cache_paths = cache_artifacts(artifacts, max_workers=max_workers, mute=True)
+            out_file.parent.mkdir(parents=True, exist_ok=True)
+            # a backed AnnData object of a previous concat might still hold the
+            # file open, hence, write to a new file and move it in place
+            tmp_file = out_file.with_name(f"{out_file.stem}.{base62_20()}.h5ad")
+            try:
+                concat_on_disk(cache_paths, tmp_file, join=join, **kwargs)
+                tmp_file.replace(out_file)
+            finally:
+                tmp_file.unlink(missing_ok=True)
+        return ad.read_h5ad(out_file, backed="r")
+
+    if suffix == ".parquet" and not kwargs:
+        cache_paths = cache_artifacts(artifacts, max_workers=max_workers, mute=True)
+        concat_object = _concat_parquet(cache_paths, max_workers)
+        if concat_object is not None:
+            return concat_object
+
+    objects = _map_concurrently(
+        lambda artifact: artifact.load(is_run_input=False, mute=True),
+        artifacts,
+        max_workers,
+    )
+    is_dataframe = isinstance(objects[0], pd.DataFrame)
+    is_anndata = isinstance(objects[0], ad.AnnData)
     if not is_dataframe and not is_anndata:
-        raise ValueError(f"Unable to concatenate {suffixes.pop()} objects.")
-
-    objects = [first_object]
-    artifact_uids = [artifacts[0].uid]
-    for artifact in artifacts[1:]:
-        objects.append(artifact.load(is_run_input=False))
-        artifact_uids.append(artifact.uid)
+        raise ValueError(f"Unable to concatenate {suffix} objects.")
 
     if is_dataframe:
         concat_object = pd.concat(objects, join=join, **kwargs)
@@ -416,6 +566,8 @@ class Collection(SQLRecord, IsVersioned, TracksRun, TracksUpdates):
             artifacts = self.ordered_artifacts.all()
         paths = [artifact.path for artifact in artifacts]
 
+        from ..core.storage._backed_access import _open_dataframe
+
         dataframe = _open_dataframe(paths, engine=engine, **kwargs)
         # track only if successful
         track_run_input(self, is_run_input)
@@ -476,6 +628,7 @@ class Collection(SQLRecord, IsVersioned, TracksRun, TracksUpdates):
             parallel: Enable sampling with multiple processes.
             dtype: Convert numpy arrays from ``.X``, ``.layers`` and ``.obsm``
             stream: Whether to stream data from the array backend.
+                For shuffled access, see :meth:`~lamindb.core.MappedCollection.enable_readahead`.
             is_run_input: Whether to track this collection as run input.
 
         Examples:
@@ -492,11 +645,12 @@ class Collection(SQLRecord, IsVersioned, TracksRun, TracksUpdates):
         """
         path_list = []
         if self._state.adding:
-            artifacts = self._artifacts
+            all_artifacts = self._artifacts
             logger.warning("the collection isn't saved, consider calling `.save()`")
         else:
-            artifacts = self.ordered_artifacts.all()
-        for artifact in artifacts:
+            all_artifacts = self.ordered_artifacts.all()
+        artifacts = []
+        for artifact in all_artifacts:
             if ".h5ad" not in artifact.suffix and ".zarr" not in artifact.suffix:
                 logger.warning(f"ignoring artifact with suffix {artifact.suffix}")
                 continue
@@ -504,6 +658,21 @@ class Collection(SQLRecord, IsVersioned, TracksRun, TracksUpdates):
                 path_list.append(artifact.cache())
             else:
                 path_list.append(artifact.path)
+            artifacts.append(artifact)
+        from ..core._mapped_collection import MappedCollection, mapped_manifest_path
+
+        # the index of the stores is reused across calls with the same arguments
+        manifest = mapped_manifest_path(
+            [artifact.hash for artifact in artifacts],
+            layers_keys,
+            obs_keys,
+            obsm_keys,
+            obs_filter,
+            join,
+            encode_labels,
+            unknown_label,
+            cache_categories,
+        )
         ds = MappedCollection(
             path_list,
             layers_keys,
@@ -516,25 +685,39 @@ class Collection(SQLRecord, IsVersioned, TracksRun, TracksUpdates):
             cache_categories,
             parallel,
             dtype,
+            manifest=manifest,
         )
         # track only if successful
         track_run_input(self, is_run_input)
         return ds
 
-    def cache(self, is_run_input: bool | None = None) -> list[UPath]:
+    def cache(
+        self,
+        is_run_input: bool | None = None,
+        *,
+        max_workers: int | None = None,
+        mute: bool = False,
+    ) -> list[UPath]:
         """Download cloud artifacts in collection to local cache.
 
         Follows syncing logic: only downloads outdated artifacts.
 
+        Artifacts are downloaded concurrently, up-to-date artifacts are
+        detected with a single batch of stat requests where the filesystem
+        supports it.
+
         Returns ordered paths to locally cached on-disk artifacts via `.ordered_artifacts.all()`:
 
         Args:
             is_run_input: Whether to track this collection as run input.
+            max_workers: The number of artifacts that are downloaded concurrently,
+                defaults to `CACHE_MAX_WORKERS`.
+            mute: Silence logging of caching progress.
         """
-        path_list = []
-        for artifact in self.ordered_artifacts.all():
-            # do not want to track data lineage on the artifact level
-            path_list.append(artifact.cache(is_run_input=False))
+        # do not want to track data lineage on the artifact level
+        path_list = cache_artifacts(
+            list(self.ordered_artifacts.all()), max_workers=max_workers, mute=mute
+        )
         track_run_input(self, is_run_input)
         return path_list
 
@@ -542,15 +725,37 @@ class Collection(SQLRecord, IsVersioned, TracksRun, TracksUpdates):
         self,
         join: Literal["inner", "outer"] = "outer",
         is_run_input: bool | None = None,
+        *,
+        max_workers: int | None = None,
+        on_disk: bool = False,
         **kwargs,
     ) -> pd.DataFrame | ad.AnnData:
         """Cache and load to memory.
 
-        Returns an in-memory concatenated `DataFrame` or `AnnData` object.
+        Returns an in-memory concatenated `DataFrame` or `AnnData` object, or a
+        backed `AnnData` object if `on_disk=True`.
+
+        Artifacts are downloaded and parsed concurrently. Parquet files with the
+        same schema are copied into a preallocated `DataFrame` one by one, which
+        avoids holding two copies of the data.
+
+        Args:
+            join: Join the columns of the objects with an `"outer"` or `"inner"` join.
+            is_run_input: Whether to track this collection as run input.
+            max_workers: The number of artifacts that are loaded concurrently,
+                defaults to `LOAD_MAX_WORKERS`.
+            on_disk: Concatenate `AnnData` artifacts on disk with
+                `anndata.experimental.concat_on_disk` and return a backed `AnnData`
+                object. The concatenated file is written to the cache directory
+                and reused by later loads with the same arguments.
+            **kwargs: Keyword arguments for `pd.concat`, `ad.concat` or
+                `concat_on_disk`.
         """
         # cannot call track_run_input here, see comment further down
         artifacts = self.ordered_artifacts.all()
-        concat_object = _load_concat_artifacts(artifacts, join, **kwargs)
+        concat_object = _load_concat_artifacts(
+            artifacts, join, max_workers=max_workers, on_disk=on_disk, **kwargs
+        )
         # only call it here because there might be errors during load or concat
         track_run_input(self, is_run_input)
         return concat_object
@@ -668,3 +873,4 @@ class CollectionArtifact(BaseSQLRecord, IsLink, TracksRun):
 
 # mypy: ignore-errors
 Collection.view_lineage = view_lineage
+Collection.lineage_edges = lineage_edges
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import copy
 import importlib
 import warnings
-from typing import TYPE_CHECKING, Any, cast, get_args, overload
+from typing import TYPE_CHECKING, Any, get_args, overload
 
 import numpy as np
 import pandas as pd
@@ -11,8 +12,10 @@ from django.conf import settings as django_settings
 from django.db import connection, models
 from django.db.models import CASCADE, PROTECT
 from django.db.models.query_utils import DeferredAttribute
+from django.db.models.signals import post_delete, post_save
 from django.db.utils import IntegrityError as DjangoIntegrityError
 from lamin_utils import logger
+from lamindb_setup import settings as setup_settings
 from lamindb_setup._init_instance import get_schema_module_name
 from lamindb_setup.core import deprecated
 from lamindb_setup.core.hashing import HASH_LENGTH, hash_dict, hash_string
@@ -61,10 +64,98 @@ if TYPE_CHECKING:
 FEATURE_DTYPES = set(get_args(Dtype))
 
 
+# in-process cache of parsed dtypes, parsing only depends on the dtype string
+# and the modules of the instance
+# maps (dtype string, options, modules) to the parsed components
+_parsed_dtype_cache: dict[tuple, tuple[dict[str, Any], ...]] = {}
+# in-process cache of the type records of dtypes like `cat[Record[uid]]`
+# maps (instance, registry, uid or subtypes) to a type record
+_dtype_type_cache: dict[tuple, SQLRecord] = {}
+
+
+def clear_dtype_cache(registry: type[SQLRecord] | None = None) -> None:
+    """Clear cached type records of dtypes, e.g., after renaming a type."""
+    if not _dtype_type_cache:
+        return
+    for key in list(_dtype_type_cache):
+        if registry is None or issubclass(key[1], registry):
+            _dtype_type_cache.pop(key, None)
+
+
+def _clear_dtype_cache_receiver(sender, instance, **kwargs) -> None:
+    # renaming, moving or deleting a type changes what its dtypes resolve to
+    if instance.is_type or any(
+        type_record.pk == instance.pk for type_record in _dtype_type_cache.values()
+    ):
+        clear_dtype_cache(sender)
+
+
+def _get_dtype_type_record(parsed_dtype: dict[str, Any]) -> SQLRecord:
+    """The type record of a parsed dtype with `record_uid` or `subtypes_list`."""
+    registry = parsed_dtype["registry"]
+    record_uid = parsed_dtype.get("record_uid")
+    subtypes_list = parsed_dtype.get("subtypes_list")
+    key = (
+        setup_settings.instance.slug,
+        registry,
+        record_uid if record_uid else tuple(subtypes_list),
+    )
+    if key not in _dtype_type_cache:
+        if record_uid:
+            type_record = get_record_type_from_uid(registry, record_uid)
+        else:
+            type_record = get_record_type_from_nested_subtypes(
+                registry, subtypes_list, parsed_dtype["field_str"]
+            )
+        # types in the trash are resolved again to warn about them
+        if getattr(type_record, "branch_id", None) == -1:
+            return type_record
+        dispatch_uid = f"clear_dtype_cache:{registry.__module__}.{registry.__name__}"
+        post_save.connect(
+            _clear_dtype_cache_receiver, sender=registry, dispatch_uid=dispatch_uid
+        )
+        post_delete.connect(
+            _clear_dtype_cache_receiver, sender=registry, dispatch_uid=dispatch_uid
+        )
+        _dtype_type_cache[key] = type_record
+    # callers may modify the record, the cached record must stay untouched
+    return copy.copy(_dtype_type_cache[key])
+
+
+def _freeze_parsed_dtype(component: dict[str, Any]) -> dict[str, Any]:
+    """Parsed dtype to cache, its only nested container is stored as a tuple."""
+    if "subtypes_list" in component:
+        component = {**component, "subtypes_list": tuple(component["subtypes_list"])}
+    return component
+
+
+def _copy_parsed_dtype(component: dict[str, Any]) -> dict[str, Any]:
+    """Copy of a cached parsed dtype that callers can modify."""
+    result = dict(component)
+    if "subtypes_list" in result:
+        result["subtypes_list"] = list(result["subtypes_list"])
+    return result
+
+
 def parse_dtype(
     dtype_str: str, check_exists: bool = False, old_format: bool = False
 ) -> list[dict[str, Any]]:
     """Parses feature data type string into a structured list of components."""
+    key = ("dtype", dtype_str, old_format, frozenset(setup_settings.instance.modules))
+    if key not in _parsed_dtype_cache:
+        _parsed_dtype_cache[key] = tuple(
+            _freeze_parsed_dtype(component)
+            for component in _parse_dtype(dtype_str, old_format)
+        )
+    result = [_copy_parsed_dtype(component) for component in _parsed_dtype_cache[key]]
+    if check_exists:
+        for component in result:
+            if component.get("record_uid") or component.get("subtypes_list"):
+                _get_dtype_type_record(component)
+    return result
+
+
+def _parse_dtype(dtype_str: str, old_format: bool = False) -> list[dict[str, Any]]:
     from .artifact import Artifact
 
     allowed_dtypes = FEATURE_DTYPES
@@ -73,7 +164,7 @@ def parse_dtype(
     if dtype_str.startswith("list[") and dtype_str.endswith("]"):
         inner_dtype_str = dtype_str[5:-1]  # Remove "list[" and "]"
         # Recursively parse the inner type
-        inner_result = parse_dtype(inner_dtype_str, old_format=old_format)
+        inner_result = _parse_dtype(inner_dtype_str, old_format=old_format)
         # Add "list": True to each component
         for component in inner_result:
             if isinstance(component, dict):
@@ -94,7 +185,6 @@ def parse_dtype(
                 single_result = parse_cat_dtype(
                     cat_single_dtype_str,
                     related_registries=related_registries,
-                    check_exists=check_exists,
                     old_format=old_format,
                 )
                 result.append(single_result)
@@ -205,7 +295,9 @@ def get_record_type_from_nested_subtypes(
             type_record.is_type = row_dict.get("is_type", False)
             # Initialize _state attribute needed by Django models
             # Create a minimal state object with the required attributes
-            state = type("ModelState", (), {"adding": False, "db": "default"})()
+            state = type(
+                "ModelState", (), {"adding": False, "db": "default", "fields_cache": {}}
+            )()
             type_record._state = state
 
     except IntegrityError:
@@ -247,22 +339,13 @@ def dtype_as_object(dtype_str: str, old_format: bool = False) -> type | None:
     if dtype_str is None:
         return None
 
-    parsed_dtypes = parse_dtype(dtype_str, check_exists=True, old_format=old_format)
+    parsed_dtypes = parse_dtype(dtype_str, old_format=old_format)
     if len(parsed_dtypes) > 0:
         dtype_objects = []
         for parsed_dtype in parsed_dtypes:
-            if parsed_dtype.get("record_uid"):
+            if parsed_dtype.get("record_uid") or parsed_dtype.get("subtypes_list"):
                 # return the subtype record for dtypes with record_uid
-                dtype_object = get_record_type_from_uid(
-                    parsed_dtype["registry"],
-                    parsed_dtype["record_uid"],
-                )
-            elif parsed_dtype.get("subtypes_list"):
-                dtype_object = get_record_type_from_nested_subtypes(
-                    parsed_dtype["registry"],
-                    parsed_dtype["subtypes_list"],
-                    parsed_dtype["field"],
-                )
+                dtype_object = _get_dtype_type_record(parsed_dtype)
             else:
                 # return field for dtypes without record_uid, e.g. bt.CellType.ontology_id
                 dtype_object = parsed_dtype["field"]
@@ -297,7 +380,28 @@ def parse_cat_dtype(
 
     assert isinstance(dtype_str, str)  # noqa: S101
     if related_registries is None:
-        related_registries = dict_module_name_to_model_name(Artifact)
+        key = (
+            "cat",
+            dtype_str,
+            is_itype,
+            old_format,
+            frozenset(setup_settings.instance.modules),
+        )
+        if key not in _parsed_dtype_cache:
+            _parsed_dtype_cache[key] = (
+                _freeze_parsed_dtype(
+                    parse_cat_dtype(
+                        dtype_str,
+                        related_registries=dict_module_name_to_model_name(Artifact),
+                        is_itype=is_itype,
+                        old_format=old_format,
+                    )
+                ),
+            )
+        result = _copy_parsed_dtype(_parsed_dtype_cache[key][0])
+        if check_exists and (result.get("record_uid") or result.get("subtypes_list")):
+            _get_dtype_type_record(result)
+        return result
 
     # Parse the string considering nested brackets
     parsed = parse_nested_brackets(dtype_str, old_format=old_format)
@@ -335,17 +439,6 @@ def parse_cat_dtype(
     record_uid = parsed.get("record_uid")
     subtypes_list = parsed.get("subtypes_list")
 
-    # Handle old format (subtypes_list) or new format (record_uid)
-    if subtypes_list and check_exists:
-        # Old format: validate that the Record exists using nested subtypes
-        # subtypes_list is guaranteed to be list[str] when present
-        if isinstance(subtypes_list, list):
-            get_record_type_from_nested_subtypes(
-                registry, cast(list[str], subtypes_list), field_str
-            )
-    elif record_uid and check_exists:
-        get_record_type_from_uid(registry, record_uid)
-
     if filter_str != "":
         # TODO: validate or process filter string
         pass
@@ -365,6 +458,10 @@ def parse_cat_dtype(
     if subtypes_list:
         result["subtypes_list"] = subtypes_list
 
+    # Handle old format (subtypes_list) or new format (record_uid)
+    if check_exists and (record_uid or subtypes_list):
+        _get_dtype_type_record(result)
+
     return result
 
 
@@ -1438,13 +1535,17 @@ class JsonValue(SQLRecord, TracksRun):
         app_label = "lamindb"
         unique_together = ("feature", "hash")
 
-    @classmethod
-    def get_or_create(cls, feature, value):
+    @staticmethod
+    def _hash_value(value: Any) -> str:
         # simple values: (int, float, str, bool, datetime)
         if not isinstance(value, dict):
-            hash = hash_string(str(value))
+            return hash_string(str(value))
         else:
-            hash = hash_dict(value)
+            return hash_dict(value)
+
+    @classmethod
+    def get_or_create(cls, feature, value):
+        hash = cls._hash_value(value)
         try:
             return (
                 cls.objects.create(feature=feature, value=value, hash=hash),
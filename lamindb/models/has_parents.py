@@ -5,6 +5,7 @@ import builtins
 from typing import TYPE_CHECKING, Literal
 
 import lamindb_setup as ln_setup
+from django.db import connections
 from lamin_utils import logger
 
 from ..errors import ValidationError
@@ -265,10 +266,8 @@ def view_lineage(
 
     import graphviz
 
-    df_values = _get_all_parent_runs(data)
-    if with_children:
-        df_values += _get_all_child_runs(data)
-    df_edges = _df_edges_from_runs(df_values)
+    df_lineage_edges = lineage_edges(data, with_children=with_children)
+    df_edges = _df_edges_from_runs(df_lineage_edges, using_key=data._state.db)
 
     def add_node(
         record: Run | Artifact | Collection,
@@ -524,120 +523,189 @@ def get_record_label(record: SQLRecord, field: str | None = None):
         return rf"<{title}>"
 
 
-def _get_all_parent_runs(data: Artifact | Collection) -> list:
-    """Get all input file/collection runs recursively."""
-    name = data._meta.model_name
-    run_inputs_outputs = []
-
-    runs = [data.run] if data.run is not None else []
-    while len(runs) > 0:
-        inputs = []
-        for r in runs:
-            inputs_run = (
-                r.__getattribute__(f"input_{name}s")
-                .all()
-                .filter(branch_id__in=[0, 1])
-                .to_list()
-            )
-            if name == "artifact":
-                inputs_run += (
-                    r.input_collections.all().filter(branch_id__in=[0, 1]).to_list()
-                )
-            outputs_run = (
-                r.__getattribute__(f"output_{name}s")
-                .all()
-                .filter(branch_id__in=[0, 1])
-                .to_list()
-            )
-            if name == "artifact":
-                outputs_run += (
-                    r.output_collections.all().filter(branch_id__in=[0, 1]).to_list()
-                )
-            # if inputs are outputs artifacts are the same, will result infinite loop
-            # so only show as outputs
-            overlap = set(inputs_run).intersection(outputs_run)
-            if overlap:
-                logger.warning(
-                    f"The following artifacts are both inputs and outputs of Run(uid={r.uid}): {overlap}\n   → Only showing as outputs."
-                )
-                inputs_run = list(set(inputs_run) - overlap)
-            if len(inputs_run) > 0:
-                run_inputs_outputs += [(inputs_run, r)]
-            if len(outputs_run) > 0:
-                run_inputs_outputs += [(r, outputs_run)]
-            inputs += inputs_run
-        runs = [f.run for f in inputs if f.run is not None]
-    return run_inputs_outputs
-
-
-def _get_all_child_runs(data: Artifact | Collection) -> list:
-    """Get all output file/collection runs recursively."""
-    name = data._meta.model_name
-    all_runs: set[Run] = set()
-    run_inputs_outputs = []
-
-    if data.run is not None:
-        runs = {f.run for f in data.run.__getattribute__(f"output_{name}s").all()}
+def _lineage_edges_query(models: list[type[SQLRecord]], with_children: bool) -> str:
+    """Recursive SQL query for the edges of a data lineage graph.
+
+    Valid on Postgres and SQLite, the parameters are
+    the id of the starting run and the maximal depth, once for parents
+    and once more for children if `with_children` is `True`.
+    """
+    branch_ids = "(0, 1)"
+    input_edges = []
+    edges = []
+    for model in models:
+        model_name = model._meta.model_name
+        table = model._meta.db_table
+        link = model.input_of_runs.through  # type: ignore
+        link_table = link._meta.db_table
+        record_column = link._meta.get_field(model_name).column
+        run_column = link._meta.get_field("run").column
+        # a run consumes a record created by another run
+        input_edges.append(
+            f"SELECT l.{run_column}, r.run_id FROM {link_table} l"
+            f" JOIN {table} r ON r.id = l.{record_column}"
+            f" WHERE r.run_id IS NOT NULL AND r.branch_id IN {branch_ids}"
+        )
+        edges.append(
+            f"SELECT '{model_name}', l.{record_column}, 'run', l.{run_column}"
+            f" FROM {link_table} l JOIN {table} r ON r.id = l.{record_column}"
+            f" WHERE l.{run_column} IN (SELECT run_id FROM lineage_runs)"
+            f" AND r.branch_id IN {branch_ids}"
+        )
+        edges.append(
+            f"SELECT 'run', r.run_id, '{model_name}', r.id FROM {table} r"
+            f" WHERE r.run_id IN (SELECT run_id FROM lineage_runs)"
+            f" AND r.branch_id IN {branch_ids}"
+        )
+    input_edges_union = "\n        UNION ALL\n        ".join(input_edges)
+    ctes = [
+        f"""input_edges(run_id, parent_run_id) AS (
+        {input_edges_union}
+    )""",
+        """parent_runs(run_id, depth) AS (
+        SELECT %s, 0
+        UNION
+        SELECT e.parent_run_id, p.depth + 1 FROM parent_runs p
+        JOIN input_edges e ON e.run_id = p.run_id
+        WHERE p.depth < %s
+    )""",
+    ]
+    if with_children:
+        ctes.append(
+            """child_runs(run_id, depth) AS (
+        SELECT %s, 0
+        UNION
+        SELECT e.run_id, c.depth + 1 FROM child_runs c
+        JOIN input_edges e ON e.parent_run_id = c.run_id
+        WHERE c.depth < %s
+    )"""
+        )
+        ctes.append(
+            """lineage_runs(run_id) AS (
+        SELECT run_id FROM parent_runs UNION SELECT run_id FROM child_runs
+    )"""
+        )
     else:
-        runs = set()
-    if name == "artifact" and data.run is not None:
-        runs.update(
-            {
-                f.run
-                for f in data.run.output_collections.all().filter(branch_id__in=[0, 1])
-            }
+        ctes.append(
+            """lineage_runs(run_id) AS (
+        SELECT run_id FROM parent_runs
+    )"""
         )
-    while runs.difference(all_runs):
-        all_runs.update(runs)
-        child_runs: set[Run] = set()
-        for r in runs:
-            inputs_run = (
-                r.__getattribute__(f"input_{name}s")
-                .all()
-                .filter(branch_id__in=[0, 1])
-                .to_list()
-            )
-            if name == "artifact":
-                inputs_run += (
-                    r.input_collections.all().filter(branch_id__in=[0, 1]).to_list()
-                )
-            run_inputs_outputs += [(inputs_run, r)]
+    ctes_str = ",\n    ".join(ctes)
+    edges_union = "\nUNION ALL\n".join(edges)
+    return f"WITH RECURSIVE\n    {ctes_str}\n{edges_union}"
 
-            outputs_run = (
-                r.__getattribute__(f"output_{name}s")
-                .all()
-                .filter(branch_id__in=[0, 1])
-                .to_list()
-            )
-            if name == "artifact":
-                outputs_run += (
-                    r.output_collections.all().filter(branch_id__in=[0, 1]).to_list()
-                )
-            run_inputs_outputs += [(r, outputs_run)]
 
-            child_runs.update(
-                Run.filter(  # type: ignore
-                    **{f"input_{name}s__uid__in": [i.uid for i in outputs_run]}
-                ).to_list()
+def lineage_edges(
+    data: Artifact | Collection, with_children: bool = True, max_depth: int = 100
+):
+    """Get the edges of the data lineage graph.
+
+    Runs a single recursive query that traverses the runs upstream of the run
+    that created the data and, if `with_children` is `True`, also downstream.
+
+    Args:
+        with_children: Whether to also traverse the runs that consume
+            outputs of the run that created the data.
+        max_depth: Maximal number of runs to traverse along a path.
+
+    Returns:
+        A `DataFrame` with one row per edge and columns `source_type`, `source_id`,
+        `target_type`, `target_id`. Types are `"run"`, `"artifact"` or `"collection"`.
+
+    Examples:
+        >>> artifact.lineage_edges()
+    """
+    import pandas as pd
+
+    from .artifact import Artifact
+    from .collection import Collection
+
+    columns = ["source_type", "source_id", "target_type", "target_id"]
+    if data.run_id is None:
+        return pd.DataFrame(columns=columns)
+    # for artifacts, also include collections in the lineage
+    models = [Artifact, Collection] if isinstance(data, Artifact) else [Collection]
+    query = _lineage_edges_query(models, with_children)
+    params = [data.run_id, max_depth]
+    if with_children:
+        params += [data.run_id, max_depth]
+    with connections[data._state.db or "default"].cursor() as cursor:
+        cursor.execute(query, params)
+        rows = cursor.fetchall()
+    df = pd.DataFrame(rows, columns=columns).drop_duplicates()
+
+    # if inputs are also outputs of the same run, only show them as outputs
+    input_keys = set(
+        df.loc[
+            df["target_type"] == "run", ["source_type", "source_id", "target_id"]
+        ].itertuples(index=False, name=None)
+    )
+    output_keys = set(
+        df.loc[
+            df["source_type"] == "run", ["target_type", "target_id", "source_id"]
+        ].itertuples(index=False, name=None)
+    )
+    overlap = input_keys & output_keys
+    if overlap:
+        logger.warning(
+            f"The following records are both inputs and outputs of a run: {overlap}\n   → Only showing as outputs."
+        )
+        is_overlap = [
+            (source_type, source_id, target_id) in overlap
+            for source_type, source_id, target_id in zip(
+                df["source_type"], df["source_id"], df["target_id"]
             )
-            # for artifacts, also include collections in the lineage
-            if name == "artifact":
-                child_runs.update(
-                    Run.filter(  # type: ignore
-                        input_collections__uid__in=[i.uid for i in outputs_run]
-                    ).to_list()
-                )
-        runs = child_runs
-    return run_inputs_outputs
+        ]
+        df = df[~pd.Series(is_overlap, index=df.index) | (df["target_type"] != "run")]
+    return df.reset_index(drop=True)
 
 
-def _df_edges_from_runs(df_values: list):
+def _df_edges_from_runs(df_lineage_edges, using_key: str | None = None):
+    """Resolve the records of lineage edges in a single query per registry."""
     import pandas as pd
 
-    df = pd.DataFrame(df_values, columns=["source_record", "target_record"])
-    df = df.explode("source_record")
-    df = df.explode("target_record")
-    df = df.drop_duplicates().dropna()
+    from .artifact import Artifact
+    from .collection import Collection
+
+    registries = {"run": Run, "artifact": Artifact, "collection": Collection}
+    records: dict[str, dict[int, SQLRecord]] = {}
+    for type_name, registry in registries.items():
+        ids = set(
+            df_lineage_edges.loc[
+                df_lineage_edges["source_type"] == type_name, "source_id"
+            ]
+        ) | set(
+            df_lineage_edges.loc[
+                df_lineage_edges["target_type"] == type_name, "target_id"
+            ]
+        )
+        if not ids:
+            records[type_name] = {}
+            continue
+        qs = registry.objects.using(using_key).filter(id__in=ids)
+        if registry is Run:
+            # the run label uses the transform key
+            qs = qs.select_related("transform")
+        records[type_name] = {record.id: record for record in qs}
+
+    df = pd.DataFrame(
+        {
+            "source_record": [
+                records[t].get(i)
+                for t, i in zip(
+                    df_lineage_edges["source_type"], df_lineage_edges["source_id"]
+                )
+            ],
+            "target_record": [
+                records[t].get(i)
+                for t, i in zip(
+                    df_lineage_edges["target_type"], df_lineage_edges["target_id"]
+                )
+            ],
+        }
+    )
+    df = df.dropna()
     df["source"] = [f"{i._meta.model_name}_{i.uid}" for i in df["source_record"]]
     df["target"] = [f"{i._meta.model_name}_{i.uid}" for i in df["target_record"]]
     df["source_label"] = df["source_record"].apply(get_record_label)
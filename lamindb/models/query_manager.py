@@ -27,6 +27,8 @@ from lamin_utils._lookup import Lookup
 from lamindb_setup.core import deprecated
 from lamindb_setup.core._docs import doc_args
 
+from ._search_index import search_index_candidates
+
 if TYPE_CHECKING:
     from ..base.types import StrField
 
@@ -106,6 +108,11 @@ def _search(
     regex_lookup = Regex if case_sensitive else IRegex
     contains_lookup = Contains if case_sensitive else IContains
 
+    string_fields = {
+        field.name
+        for field in registry._meta.fields
+        if field.get_internal_type() in {"CharField", "TextField"}
+    }
     ranks = []
     contains_filters = []
     for field in fields:
@@ -145,7 +152,12 @@ def _search(
         ranks.append(left_rank)
         # simple contains filter
         contains_expr = contains_lookup(field_expr, string)
-        contains_filter = Q(contains_expr)
+        if field in string_fields and string != "":
+            # a lookup on the plain column can use a trigram index on postgres
+            lookup = "contains" if case_sensitive else "icontains"
+            contains_filter = Q(**{f"{field}__{lookup}": string})
+        else:
+            contains_filter = Q(contains_expr)
         contains_filters.append(contains_filter)
         # also rank by contains
         contains_rank = Cast(contains_expr, output_field=IntegerField())
@@ -161,6 +173,9 @@ def _search(
             )
             ranks.append(name_startswith_rank)
 
+    candidates = search_index_candidates(registry, fields, string, input_queryset.db)
+    if candidates is not None:
+        input_queryset = input_queryset.filter(Q(pk__in=candidates))
     ranked_queryset = (
         input_queryset.filter(reduce(lambda a, b: a | b, contains_filters))
         .alias(rank=sum(ranks))
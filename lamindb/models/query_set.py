@@ -24,7 +24,6 @@ from collections.abc import Iterable as IterableType
 from importlib import import_module
 from typing import TYPE_CHECKING, Any, Generic, NamedTuple, TypeVar, final
 
-import lamindb_setup as ln_setup
 import pandas as pd
 from django.core.exceptions import FieldError
 from django.db import models
@@ -43,12 +42,22 @@ from lamindb_setup.core import deprecated
 from lamindb_setup.core._docs import doc_args
 
 from ..errors import DoesNotExist, MultipleResultsFound
+from ._connections import close_connections, instance_connections, warmup_connections
 from ._is_versioned import IsVersioned
-from .can_curate import CanCurate, _inspect, _standardize, _validate
+from .can_curate import (
+    CanCurate,
+    _inspect,
+    _standardize,
+    _validate,
+    clear_registry_values_cache,
+)
 from .query_manager import _lookup, _search
-from .sqlrecord import Registry, SQLRecord
+from .sqlrecord import HasType, Registry, SQLRecord
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import pyarrow as pa
     from bionty.models import (
         CellLine,
         CellMarker,
@@ -79,7 +88,7 @@ if TYPE_CHECKING:
         Well,
     )
 
-    from lamindb.base.types import ListLike, StrField
+    from lamindb.base.types import FieldAttr, ListLike, StrField
     from lamindb.models import (
         Artifact,
         Branch,
@@ -99,6 +108,9 @@ if TYPE_CHECKING:
 
 T = TypeVar("T")
 
+# the number of ids per `__in` query, keeps them below the limits for query
+# parameters of SQLite and Postgres
+FILTER_BATCH_SIZE = 5000
 
 pd.set_option("display.max_columns", 200)
 
@@ -812,6 +824,42 @@ def reshape_annotate_result(
         )
 
     # --- Apply type conversions based on feature metadata ---
+    result_encoded = convert_feature_columns(result_encoded, feature_qs)
+
+    # --- Finalize result ---
+
+    # Reorder columns to prioritize features
+    result_encoded = reorder_subset_columns_in_df(
+        result_encoded,
+        feature_qs.to_list("name"),  # type: ignore
+    )
+
+    # Process additional included columns
+    if cols_from_include:
+        cols_from_include_encoded = {
+            fields_map.get(k, k): v  # type: ignore
+            for k, v in cols_from_include.items()
+        }
+        result_encoded = process_cols_from_include(
+            df_encoded, result_encoded, cols_from_include_encoded, pk_name_encoded
+        )
+
+    # Decode field names back to original, except where conflicts exist
+    # (e.g., if a feature is also named 'id', keep the encoded field name)
+    decode_map = {
+        encoded: original
+        for original, encoded in fields_map.items()  # type: ignore
+        if original not in result_encoded.columns
+    }
+
+    return result_encoded.drop_duplicates(subset=[pk_name_encoded]).rename(
+        columns=decode_map
+    )
+
+
+def convert_feature_columns(result: pd.DataFrame, feature_qs: QuerySet) -> pd.DataFrame:
+    """Convert aggregated feature values to the dtypes of the features."""
+
     def extract_and_check_scalar(series: pd.Series) -> tuple[pd.Series, bool]:
         """Extract single elements and return if column is now scalar."""
         has_multiple_values = False
@@ -830,31 +878,27 @@ def reshape_annotate_result(
         return extracted, is_scalar
 
     for feature in feature_qs:
-        if feature.name not in result_encoded.columns:
+        if feature.name not in result.columns:
             continue
 
-        result_encoded[feature.name], is_scalar = extract_and_check_scalar(
-            result_encoded[feature.name]
-        )
+        result[feature.name], is_scalar = extract_and_check_scalar(result[feature.name])
 
         if is_scalar:
             dtype_str = feature._dtype_str
             if dtype_str.startswith("cat"):
-                result_encoded[feature.name] = result_encoded[feature.name].astype(
-                    "category"
-                )
+                result[feature.name] = result[feature.name].astype("category")
             if dtype_str == "datetime":
                 # format and utc args are needed for mixed data
                 # pandera expects timezone-naive datetime objects, and hence,
                 # we need to localize with None
-                result_encoded[feature.name] = pd.to_datetime(
-                    result_encoded[feature.name], format="ISO8601", utc=True
+                result[feature.name] = pd.to_datetime(
+                    result[feature.name], format="ISO8601", utc=True
                 ).dt.tz_localize(None)
             if dtype_str == "date":
                 # see comments for datetime
-                result_encoded[feature.name] = (
+                result[feature.name] = (
                     pd.to_datetime(
-                        result_encoded[feature.name],
+                        result[feature.name],
                         format="ISO8601",
                         utc=True,
                     )
@@ -862,54 +906,47 @@ def reshape_annotate_result(
                     .dt.date
                 )
             if dtype_str == "bool":
-                result_encoded[feature.name] = result_encoded[feature.name].astype(
-                    "boolean"
-                )
+                result[feature.name] = result[feature.name].astype("boolean")
 
         dtype_str = feature._dtype_str
         if dtype_str.startswith("list"):
-            mask = result_encoded[feature.name].notna()
-            result_encoded.loc[mask, feature.name] = result_encoded.loc[
-                mask, feature.name
-            ].apply(lambda x: list(x) if isinstance(x, (set, list)) else [x])
+            mask = result[feature.name].notna()
+            result.loc[mask, feature.name] = result.loc[mask, feature.name].apply(
+                lambda x: list(x) if isinstance(x, (set, list)) else [x]
+            )
 
         if dtype_str == "dict":
             # this is the case when a dict is stored as a string; won't happen
             # within lamindb but might for external data
-            if isinstance(result_encoded[feature.name].iloc[0], str):
-                result_encoded[feature.name] = result_encoded[feature.name].apply(
+            if isinstance(result[feature.name].iloc[0], str):
+                result[feature.name] = result[feature.name].apply(
                     lambda x: ast.literal_eval(x) if isinstance(x, str) else x
                 )
 
-    # --- Finalize result ---
-
-    # Reorder columns to prioritize features
-    result_encoded = reorder_subset_columns_in_df(
-        result_encoded,
-        feature_qs.to_list("name"),  # type: ignore
-    )
-
-    # Process additional included columns
-    if cols_from_include:
-        cols_from_include_encoded = {
-            fields_map.get(k, k): v  # type: ignore
-            for k, v in cols_from_include.items()
-        }
-        result_encoded = process_cols_from_include(
-            df_encoded, result_encoded, cols_from_include_encoded, pk_name_encoded
-        )
+    return result
 
-    # Decode field names back to original, except where conflicts exist
-    # (e.g., if a feature is also named 'id', keep the encoded field name)
-    decode_map = {
-        encoded: original
-        for original, encoded in fields_map.items()  # type: ignore
-        if original not in result_encoded.columns
-    }
 
-    return result_encoded.drop_duplicates(subset=[pk_name_encoded]).rename(
-        columns=decode_map
-    )
+def cast_numeric_feature_columns(
+    df: pd.DataFrame, feature_qs: QuerySet
+) -> pd.DataFrame:
+    """Cast int and float features that were stored with a different type."""
+    # cast floats and ints where appropriate
+    # this is currently needed because the UI writes into the JSON field through JS
+    # and thus a `10` might be a float, not an int
+    # note: also type casting within reshape_annotate_result
+    for feature in feature_qs:
+        if feature.name in df.columns:
+            current_dtype = df[feature.name].dtype
+            dtype_str = feature._dtype_str
+            if dtype_str == "int" and not pd.api.types.is_integer_dtype(current_dtype):
+                df[feature.name] = df[feature.name].astype(
+                    "Int64"  # nullable integer dtype
+                )
+            elif dtype_str == "float" and not pd.api.types.is_float_dtype(
+                current_dtype
+            ):
+                df[feature.name] = df[feature.name].astype(float)
+    return df
 
 
 def process_links_features(
@@ -1025,16 +1062,7 @@ class BasicQuerySet(models.QuerySet):
         cls = _queryset_class_factory(self.model, QuerySet)
         return self._to_class(cls, copy)
 
-    @doc_args(SQLRecord.to_dataframe.__doc__)
-    def to_dataframe(
-        self,
-        *,
-        include: str | list[str] | None = None,
-        features: str | list[str] | None = None,
-        limit: int | None = 100,
-        order_by: str | None = "-id",
-    ) -> pd.DataFrame:
-        """{}"""  # noqa: D415
+    def _exclude_lamindb_artifacts(self) -> BasicQuerySet:
         if (
             self.model.__name__ == "Artifact"
             and "kind" not in str(self.query.where)
@@ -1043,16 +1071,15 @@ class BasicQuerySet(models.QuerySet):
             and self.query.high_mark
             is None  # this should be None, it represent _no_ LIMIT
         ):
-            subset = self.exclude(**{"kind__startswith": "__lamindb"})
+            return self.exclude(**{"kind__startswith": "__lamindb"})
         else:
-            subset = self
-        # check if queryset is already ordered
-        is_ordered = bool(subset.query.order_by)
-        # Only apply order_by if not already ordered and order_by is specified
-        if not is_ordered and order_by is not None:
-            subset = subset.order_by(order_by)
-        if limit is not None:
-            subset = subset[:limit]
+            return self
+
+    def _get_dataframe_spec(
+        self,
+        include: str | list[str] | None,
+        features: str | list[str] | None,
+    ) -> tuple[list[str], list[str], dict, dict, QuerySet | None]:
         if include is None:
             include_input = []
         elif isinstance(include, str):
@@ -1066,31 +1093,47 @@ class BasicQuerySet(models.QuerySet):
                 # should refactor this in the future
                 features = True  # type: ignore
         features_input = [] if features is None else features
-        include = get_backward_compat_filter_kwargs(subset, include_input)
-        field_names = get_basic_field_names(subset, include_input, features_input)
+        include = get_backward_compat_filter_kwargs(self, include_input)
+        field_names = get_basic_field_names(self, include_input, features_input)
 
         annotate_kwargs = {}
         filtered_relations = {}  # type: ignore
         feature_qs = None
         if features:
             feature_annotate_kwargs, feature_qs, filtered_relations = (
-                get_feature_annotate_kwargs(subset.model, features, subset)
+                get_feature_annotate_kwargs(self.model, features, self)
             )
             annotate_kwargs.update(feature_annotate_kwargs)
         if include_input:
             include_input = include_input.copy()[::-1]  # type: ignore
             include_kwargs = {s: F(s) for s in include_input if s not in field_names}
             annotate_kwargs.update(include_kwargs)
+        return (
+            include_input,
+            field_names,
+            annotate_kwargs,
+            filtered_relations,
+            feature_qs,
+        )
+
+    def _build_dataframe(
+        self,
+        include_input: list[str],
+        field_names: list[str],
+        annotate_kwargs: dict,
+        filtered_relations: dict,
+        feature_qs: QuerySet | None,
+    ) -> pd.DataFrame:
         if annotate_kwargs:
-            id_subquery = subset.values("id")
+            id_subquery = self.values("id")
             # for annotate, we want the queryset without filters so that joins don't affect the annotations
-            query_set_without_filters = subset.model.objects.using(subset.db).filter(
+            query_set_without_filters = self.model.objects.using(self.db).filter(
                 id__in=Subquery(id_subquery)
             )
-            if subset.query.order_by:
+            if self.query.order_by:
                 # Apply the same ordering to the new queryset
                 query_set_without_filters = query_set_without_filters.order_by(
-                    *subset.query.order_by
+                    *self.query.order_by
                 )
             if filtered_relations:
                 query_set_without_filters = query_set_without_filters.annotate(
@@ -1098,7 +1141,7 @@ class BasicQuerySet(models.QuerySet):
                 )
             queryset = query_set_without_filters.annotate(**annotate_kwargs)
         else:
-            queryset = subset
+            queryset = self
 
         # our main problem with this approach is that we lose ordering in categorical lists
         # we'd need to respect ordering through the primary key on the link table, but that's
@@ -1121,29 +1164,110 @@ class BasicQuerySet(models.QuerySet):
             if pk_column_name in df_reshaped.columns:
                 df_reshaped = df_reshaped.set_index(pk_column_name)
 
-        # cast floats and ints where appropriate
-        # this is currently needed because the UI writes into the JSON field through JS
-        # and thus a `10` might be a float, not an int
-        # note: also type casting within reshape_annotate_result
         if feature_qs is not None:
-            for feature in feature_qs:
-                if feature.name in df_reshaped.columns:
-                    current_dtype = df_reshaped[feature.name].dtype
-                    dtype_str = feature._dtype_str
-                    if dtype_str == "int" and not pd.api.types.is_integer_dtype(
-                        current_dtype
-                    ):
-                        df_reshaped[feature.name] = df_reshaped[feature.name].astype(
-                            "Int64"  # nullable integer dtype
-                        )
-                    elif dtype_str == "float" and not pd.api.types.is_float_dtype(
-                        current_dtype
-                    ):
-                        df_reshaped[feature.name] = df_reshaped[feature.name].astype(
-                            float
-                        )
+            df_reshaped = cast_numeric_feature_columns(df_reshaped, feature_qs)
         return df_reshaped
 
+    @doc_args(SQLRecord.to_dataframe.__doc__)
+    def to_dataframe(
+        self,
+        *,
+        include: str | list[str] | None = None,
+        features: str | list[str] | None = None,
+        limit: int | None = 100,
+        order_by: str | None = "-id",
+    ) -> pd.DataFrame:
+        """{}"""  # noqa: D415
+        subset = self._exclude_lamindb_artifacts()
+        # check if queryset is already ordered
+        is_ordered = bool(subset.query.order_by)
+        # Only apply order_by if not already ordered and order_by is specified
+        if not is_ordered and order_by is not None:
+            subset = subset.order_by(order_by)
+        if limit is not None:
+            subset = subset[:limit]
+        spec = subset._get_dataframe_spec(include, features)
+        return subset._build_dataframe(*spec)
+
+    def to_dataframe_batches(
+        self,
+        *,
+        batch_size: int = 10_000,
+        include: str | list[str] | None = None,
+        features: str | list[str] | None = None,
+        arrow: bool = False,
+    ) -> Iterator[pd.DataFrame] | Iterator[pa.RecordBatch]:
+        """Iterate over the query set in batches of `pd.DataFrame` objects.
+
+        Unlike :meth:`to_dataframe`, this doesn't load all results into memory at once
+        and is hence suited to export large registries. Pages through the records
+        in ascending order of the primary key without using `OFFSET` and reshapes every
+        page independently, so that the memory is bounded by the `batch_size`.
+
+        Args:
+            batch_size: Number of records per batch.
+            include: Related data to include as columns, see :meth:`to_dataframe`.
+            features: Features to include as columns, see :meth:`to_dataframe`.
+            arrow: If `True`, yields `pyarrow.RecordBatch` objects instead of `pd.DataFrame` objects.
+
+        Note:
+            Because batches are reshaped independently, the dtypes of a column, e.g.,
+            of a feature that has no values in a batch, can differ between batches.
+
+        Examples:
+
+            Iterate over all artifacts with their features::
+
+                for df in ln.Artifact.filter().to_dataframe_batches(features=True):
+                    ...
+
+            Export a registry to a parquet file::
+
+                import pyarrow.parquet as pq
+
+                writer = None
+                for batch in ln.Record.filter().to_dataframe_batches(arrow=True):
+                    if writer is None:
+                        writer = pq.ParquetWriter("records.parquet", batch.schema)
+                    writer.write_batch(batch)
+                writer.close()
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+        if arrow:
+            import pyarrow as pa
+
+        subset = self._exclude_lamindb_artifacts()._to_basic()
+        if subset.query.is_sliced:
+            # a sliced queryset can't be filtered further
+            subset = subset.model.objects.using(subset.db).filter(
+                pk__in=Subquery(subset.values("pk"))
+            )
+        spec = subset._get_dataframe_spec(include, features)
+        ids_queryset = subset.order_by("pk").values_list("pk", flat=True)
+        last_pk = None
+        while True:
+            page_ids_queryset = (
+                ids_queryset if last_pk is None else ids_queryset.filter(pk__gt=last_pk)
+            )
+            page_ids = list(page_ids_queryset[:batch_size])
+            if not page_ids:
+                break
+            # a range of the query set rather than an `IN` query with a parameter
+            # for every id
+            page = subset.filter(pk__lte=page_ids[-1])
+            if last_pk is not None:
+                page = page.filter(pk__gt=last_pk)
+            page = page.order_by("pk")
+            last_pk = page_ids[-1]
+            df = page._build_dataframe(*spec)
+            if arrow:
+                yield pa.RecordBatch.from_pandas(df)
+            else:
+                yield df
+            if len(page_ids) < batch_size:
+                break
+
     @deprecated(new_name="to_dataframe")
     def df(
         self,
@@ -1156,30 +1280,55 @@ class BasicQuerySet(models.QuerySet):
         """Describe the query set to learn about available fields."""
         return self.model.describe(return_str=return_str)
 
-    def delete(self, *args, permanent: bool | None = None, **kwargs):
+    def delete(
+        self,
+        *args,
+        permanent: bool | None = None,
+        storage: bool | None = None,
+        interactive: bool = True,
+        **kwargs,
+    ):
         """Delete all records in the query set.
 
+        Artifacts, collections, runs and transforms are deleted in bulk: records are moved to the trash with a
+        single update, records in the trash are deleted with set-based queries and the data of artifacts is then
+        deleted in storage in parallel batches.
+
         Args:
             permanent: Whether to permanently delete the record (skips trash).
                 Is only relevant for records that have the `branch` field.
                 If `None`, uses soft delete for records that have the `branch` field, hard delete otherwise.
+            storage: Whether to delete the data of artifacts in storage, see :meth:`~lamindb.Artifact.delete`.
+            interactive: Whether to prompt for confirmation, e.g., before deleting records that are already
+                in the trash. If `False`, raises a `ValueError` whenever a confirmation would be needed.
 
         Note:
-            Calling `delete()` twice on the same queryset does NOT permanently delete in bulk operations.
-            Use `permanent=True` for actual deletion.
+            For registries other than artifacts, collections, runs and transforms, calling `delete()` twice on the
+            same queryset does NOT permanently delete. Use `permanent=True` for actual deletion.
 
         Examples:
 
             For a `QuerySet` object `qs`, call::
 
                 qs.delete()
+
+            Permanently delete artifacts and their data without prompts::
+
+                qs.delete(permanent=True, storage=True, interactive=False)
         """
         from lamindb.models import Artifact, Collection, Run, Storage, Transform
 
-        # all these models have non-trivial delete behavior, hence we need to handle in a loop
+        # all these models have non-trivial delete behavior
         if self.model in {Artifact, Collection, Transform, Run}:
-            for record in self:
-                record.delete(*args, permanent=permanent, **kwargs)
+            from ._delete import delete_records
+
+            delete_records(
+                self,
+                permanent=permanent,
+                storage=storage,
+                interactive=interactive,
+                using_key=kwargs.get("using_key"),
+            )
         elif self.model is Storage:  # storage does not have soft delete
             if permanent is False:
                 raise ValueError(
@@ -1199,6 +1348,107 @@ class BasicQuerySet(models.QuerySet):
                         "use 'permanent=True' for permanent deletion."
                     )
                 super().delete(*args, **kwargs)
+            clear_registry_values_cache(self.model)
+            if issubclass(self.model, HasType):
+                from .feature import clear_dtype_cache
+
+                clear_dtype_cache(self.model)
+
+    def update(self, **kwargs) -> int:
+        """Update the records of the query set with a single SQL query.
+
+        See Django's `QuerySet.update()`, returns the number of updated records.
+        """
+        n_updated = super().update(**kwargs)
+        # `update()` doesn't send signals that invalidate the caches
+        clear_registry_values_cache(self.model)
+        if issubclass(self.model, HasType):
+            from .feature import clear_dtype_cache
+
+            clear_dtype_cache(self.model)
+        return n_updated
+
+    def add_feature_values(
+        self, values: pd.DataFrame, feature_field: FieldAttr | None = None
+    ) -> None:
+        """Add values for features to many artifacts, runs or records of the query set.
+
+        Unlike calling `record.features.add_values()` in a loop, this looks up feature
+        values with a few queries per feature and per label registry and creates all
+        missing values and links in bulk.
+
+        Args:
+            values: A `DataFrame` indexed by records of the query set or by their `uid`
+                with one column per feature. Missing values (`None`, `NaN`) are skipped.
+            feature_field: The field of a registry to map the columns of `values`,
+                defaults to `Feature.name`.
+
+        Examples:
+
+            ::
+
+                df = pd.DataFrame(
+                    {"species": ["human", "mouse"], "temperature": [27.6, 25.0]},
+                    index=[artifact1.uid, artifact2.uid],
+                )
+                ln.Artifact.filter(key__startswith="experiment_1/").add_feature_values(df)
+        """
+        from ._feature_manager import FeatureManager
+        from .feature import Feature
+
+        index = list(values.index)
+        by_uid = all(isinstance(key, str) for key in index)
+        for record in [] if by_uid else index:
+            if not isinstance(record, self.model):
+                raise ValueError(
+                    f"values must be indexed by {self.model.__name__} records or their uids"
+                )
+        field = "uid" if by_uid else "id"
+        keys = index if by_uid else [record.id for record in index]
+        records: dict = {}
+        for i in range(0, len(keys), FILTER_BATCH_SIZE):
+            batch = [key for key in keys[i : i + FILTER_BATCH_SIZE] if key is not None]
+            for record in self.filter(**{f"{field}__in": batch}):
+                records[getattr(record, field)] = record
+        missing = [str(key) for key, k in zip(index, keys) if k not in records]
+        if missing:
+            raise ValueError(
+                f"values are indexed by records that aren't in the query set: {missing}"
+            )
+        if by_uid:
+            values = values.set_axis([records[uid] for uid in keys])
+        FeatureManager.add_values_bulk(
+            values, Feature.name if feature_field is None else feature_field
+        )
+
+    def transfer(self, annotations: bool = False) -> QuerySet:
+        """Transfer the records of a query set from another instance in bulk.
+
+        Records that already exist in the current instance are looked up by
+        `uid` and are not transferred again. Related records, e.g., the storage
+        location of an artifact, are transferred along with the records.
+
+        Args:
+            annotations: Whether to also transfer the labels, features and
+                schemas that annotate the records, analogous to
+                `artifact.save(transfer="annotations")`.
+
+        Returns:
+            The records in the current instance.
+
+        See Also:
+            :doc:`transfer`
+
+        Examples:
+
+            ::
+
+                artifacts = ln.Artifact.connect("laminlabs/lamindata").filter(suffix=".h5ad")
+                artifacts.transfer(annotations=True)
+        """
+        from ._transfer import transfer_records
+
+        return transfer_records(self, annotations=annotations)
 
     def to_list(self, field: str | None = None) -> list[SQLRecord] | list[str]:
         """Populate an (unordered) list with the results.
@@ -1535,6 +1785,12 @@ class DB:
             ).order_by("created_at").to_dataframe(
                 include=["cell_types__name", "created_by__handle"]  # include additional info
             ).head()
+
+        Connections and instance metadata are shared across `DB` objects of the
+        same instance, open the connection upfront and close it when done::
+
+            db.warmup()
+            db.close()
     """
 
     Artifact: QuerySet[Artifact]  # type: ignore[type-arg]
@@ -1558,13 +1814,10 @@ class DB:
     def __init__(self, instance: str):
         self._instance = instance
         self._cache: dict[str, NonInstantiableQuerySet | BiontyDB | WetlabDB] = {}
-        self._available_registries: set[str] | None = None
 
-        owner, instance_name = instance.split("/")
-        instance_info = ln_setup._connect_instance._connect_instance(
-            owner=owner, name=instance_name
-        )
-        self._modules = ["lamindb"] + list(instance_info.modules)
+        # reuses the connection and metadata of previous DB objects
+        connected = instance_connections.connect(instance)
+        self._modules = ["lamindb"] + list(connected.modules)
 
     def __getattr__(self, name: str) -> NonInstantiableQuerySet | BiontyDB | WetlabDB:
         """Access a registry class or schema namespace for this database instance.
@@ -1616,25 +1869,22 @@ class DB:
     def __repr__(self) -> str:
         return f"DB('{self._instance}')"
 
-    def __dir__(self) -> list[str]:
-        """Return list of available registries and schema namespaces."""
-        base_attrs = [attr for attr in super().__dir__() if not attr.startswith("_")]
+    def warmup(self) -> None:
+        """Open the database connection ahead of the first query."""
+        warmup_connections(self._instance)
 
-        lamindb_registries = set()
-        try:
-            lamindb_module = import_module("lamindb")
-            if hasattr(lamindb_module, "__all__"):
-                for class_name in lamindb_module.__all__:
-                    model_class = getattr(lamindb_module, class_name, None)
-                    if model_class and hasattr(model_class, "connect"):
-                        lamindb_registries.add(class_name)
-        except ImportError:
-            pass
+    def close(self) -> None:
+        """Close the database connection and drop the cached instance metadata.
 
-        module_namespaces = set()
-        if "bionty" in self._modules:
-            module_namespaces.add("bionty")
-        if "wetlab" in self._modules:
-            module_namespaces.add("wetlab")
+        Other `DB` objects of the instance keep working and reconnect on their
+        next query.
+        """
+        close_connections(self._instance)
+        self._cache.clear()
 
-        return sorted(set(base_attrs) | lamindb_registries | module_namespaces)
+    def __dir__(self) -> list[str]:
+        """Return list of available registries and schema namespaces."""
+        base_attrs = [attr for attr in super().__dir__() if not attr.startswith("_")]
+        # cached with the instance metadata
+        registries = instance_connections.connect(self._instance).registries
+        return sorted(set(base_attrs) | registries)
@@ -20,6 +20,7 @@ from lamindb.base.utils import class_and_instance_method
 from lamindb.errors import FieldValidationError
 
 from ..base.uids import base62_16
+from ._sheet_export import sheet_to_dataframe
 from .artifact import Artifact
 from .can_curate import CanCurate
 from .collection import Collection
@@ -400,7 +401,13 @@ class Record(SQLRecord, HasType, HasParents, CanCurate, TracksRun, TracksUpdates
         return _query_relatives([self], "records")  # type: ignore
 
     @class_and_instance_method
-    def to_dataframe(cls_or_self, recurse: bool = False, **kwargs) -> pd.DataFrame:
+    def to_dataframe(
+        cls_or_self,
+        recurse: bool = False,
+        *,
+        columns: list[str] | None = None,
+        **kwargs,
+    ) -> pd.DataFrame:
         """Export to a pandas DataFrame.
 
         This is almost equivalent to::
@@ -409,8 +416,11 @@ class Record(SQLRecord, HasType, HasParents, CanCurate, TracksRun, TracksUpdates
 
         `to_dataframe()` ensures that the columns are ordered according to the schema of the type and encodes fields like `uid` and `name`.
 
+        Records are exported in pages and the values of each link model are queried separately, so that large sheets don't need a join of all feature tables.
+
         Args:
             recurse: `bool = False` Whether to include records of sub-types recursively.
+            columns: `list[str] | None = None` Only export these features, link models of other features aren't queried.
             **kwargs: Keyword arguments passed to Registry.to_dataframe().
         """
         if isinstance(cls_or_self, type):
@@ -429,7 +439,7 @@ class Record(SQLRecord, HasType, HasParents, CanCurate, TracksRun, TracksUpdates
             else self.records.filter(branch_id__in=branch_ids)
         )
         logger.important(f"exporting {qs.count()} records of '{self.name}'")
-        df = qs.to_dataframe(features="queryset", order_by="id", limit=None)
+        df = sheet_to_dataframe(qs, columns=columns)
         encoded_id = encode_lamindb_fields_as_columns(self.__class__, "id")
         encoded_uid = encode_lamindb_fields_as_columns(self.__class__, "uid")
         encoded_name = encode_lamindb_fields_as_columns(self.__class__, "name")
@@ -442,6 +452,8 @@ class Record(SQLRecord, HasType, HasParents, CanCurate, TracksRun, TracksUpdates
             df = df.rename(columns={"name": encoded_name})
         if self.schema is not None:
             all_features = self.schema.members.all()
+            if columns is not None:
+                all_features = all_features.filter(name__in=columns)
             desired_order = all_features.to_list("name")  # only members is ordered!
             for feature in all_features:
                 if feature.name not in df.columns:
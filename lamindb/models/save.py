@@ -5,10 +5,11 @@ import os
 import shutil
 import traceback
 from collections import defaultdict
+from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from django.db import IntegrityError, transaction
+from django.db import IntegrityError, connections, transaction
 from django.utils.functional import partition
 from lamin_utils import logger
 from lamindb_setup.core.upath import LocalPathClasses, UPath
@@ -21,6 +22,7 @@ from ..core.storage.paths import (
     delete_storage_using_key,
     store_file_or_folder,
 )
+from .can_curate import clear_registry_values_cache
 from .sqlrecord import (
     UNIQUE_FIELD_NAMES,
     SQLRecord,
@@ -221,6 +223,7 @@ def bulk_create(
                             record.save()
                 else:
                     raise e
+        clear_registry_values_cache(registry)
 
 
 def bulk_update(
@@ -264,6 +267,7 @@ def bulk_update(
                     f"processing batch {batch_num}/{total_batches} for {model_name}: {len(batch)} records"
                 )
             registry.objects.bulk_update(batch, field_names)
+        clear_registry_values_cache(registry)
 
 
 # This is also used within Artifact.save()
@@ -397,47 +401,112 @@ def check_and_attempt_clearing(
     return None
 
 
+def _check_and_attempt_upload_in_thread(
+    artifact: Artifact, using_key: str | None = None
+) -> Exception | None:
+    try:
+        # concurrent progress bars would garble the output
+        return check_and_attempt_upload(artifact, using_key, print_progress=False)
+    finally:
+        # a worker thread opens its own connections if it has to query storage locations
+        connections.close_all()
+
+
+def upload_artifacts(
+    artifacts: list[Artifact], using_key: str | None = None, max_workers: int = 1
+) -> list[Exception | None]:
+    """Upload artifacts using a bounded pool of `max_workers` threads.
+
+    Returns one entry per artifact: `None` if the upload succeeded or wasn't needed
+    and the exception otherwise. After the first failure, pending uploads are
+    cancelled and reported as :class:`~concurrent.futures.CancelledError`.
+    """
+    if max_workers <= 1 or len(artifacts) <= 1:
+        exceptions: list[Exception | None] = []
+        for artifact in artifacts:
+            exception = check_and_attempt_upload(artifact, using_key)
+            exceptions.append(exception)
+            if exception is not None:
+                break
+        exceptions += [CancelledError()] * (len(artifacts) - len(exceptions))
+        return exceptions
+
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(artifacts)))
+    try:
+        futures = [
+            executor.submit(_check_and_attempt_upload_in_thread, artifact, using_key)
+            for artifact in artifacts
+        ]
+        for future in as_completed(futures):
+            # check_and_attempt_upload returns rather than raises upload errors
+            if future.exception() is not None or future.result() is not None:
+                break
+    finally:
+        # waits for running uploads, pending uploads are never started
+        executor.shutdown(wait=True, cancel_futures=True)
+    return [
+        CancelledError()
+        if future.cancelled()
+        else (future.exception() or future.result())
+        for future in futures
+    ]
+
+
 def store_artifacts(
-    artifacts: Iterable[Artifact], using_key: str | None = None
+    artifacts: Iterable[Artifact],
+    using_key: str | None = None,
+    max_workers: int | None = None,
 ) -> None:
     """Upload artifacts in a list of database-committed artifacts to storage.
 
-    If any upload fails, subsequent artifacts are cleaned up from the DB.
+    Uploads run concurrently, see :attr:`~lamindb.core.subsettings.CreationSettings.artifact_upload_max_workers`.
+
+    If any upload fails, artifacts that weren't uploaded are cleaned up from the DB.
     """
     from .artifact import Artifact
 
+    artifacts = list(artifacts)
+    if max_workers is None:
+        max_workers = settings.creation.artifact_upload_max_workers
+
+    # failure here sets ._clear_storagekey
+    # for cleanup below
+    upload_exceptions = upload_artifacts(artifacts, using_key, max_workers)
+
     exception: Exception | None = None
     # because uploads might fail, we need to maintain a new list of the succeeded uploads
     stored_artifacts = []
-
-    # upload new local artifacts
-    for artifact in artifacts:
-        # failure here sets ._clear_storagekey
-        # for cleanup below
-        exception = check_and_attempt_upload(artifact, using_key)
-        if exception is not None:
-            break
-
-        stored_artifacts += [artifact]
-        # update to show successful saving
-        # only update if _storage_completed was set to False before
-        # this should be a single transaction for the updates of all the artifacts
-        # but then it would just abort all artifacts, even successfully saved before
-        # TODO: there should also be some kind of exception handling here
-        # but this requires proper refactoring
+    failed_artifacts = []
+    for artifact, upload_exception in zip(artifacts, upload_exceptions):
+        if upload_exception is None:
+            stored_artifacts.append(artifact)
+        elif not isinstance(upload_exception, CancelledError):
+            failed_artifacts.append((artifact, upload_exception))
+            if exception is None:
+                exception = upload_exception
+
+    # update to show successful saving
+    # only update if _storage_completed was set to False before
+    # a single bulk update per database rather than a transaction per artifact
+    completed_artifacts_by_db = defaultdict(list)
+    for artifact in stored_artifacts:
         if artifact._storage_completed is False:
             artifact._storage_completed = None  # None indicates "not False" and removes the data from the JSON field
-            super(
-                Artifact, artifact
-            ).save()  # each .save is a separate transaction here
-        # if check_and_attempt_upload was successful
-        # then this can have only ._clear_storagekey from .replace
-        exception = check_and_attempt_clearing(
+            completed_artifacts_by_db[artifact._state.db].append(artifact)
+    for db, completed_artifacts in completed_artifacts_by_db.items():
+        Artifact.objects.using(db).bulk_update(completed_artifacts, ["_aux"])
+
+    for artifact in stored_artifacts:
+        # the upload was successful
+        # so this can have only ._clear_storagekey from .replace
+        exception_clear = check_and_attempt_clearing(
             artifact, raise_file_not_found_error=True, using_key=using_key
         )
-        if exception is not None:
+        if exception_clear is not None:
             logger.warning(f"clean up of {artifact._clear_storagekey} failed")  # type: ignore
-            break
+            failed_artifacts.append((artifact, exception_clear))
+            if exception is None:
+                exception = exception_clear
 
     if exception is not None:
         # clean up metadata for artifacts not uploaded to storage
@@ -453,14 +522,21 @@ def store_artifacts(
                         logger.warning(
                             f"clean up of {artifact._clear_storagekey} after the upload error failed"  # type: ignore
                         )
-        error_message = prepare_error_message(artifacts, stored_artifacts, exception)
+        error_message = prepare_error_message(
+            artifacts, stored_artifacts, exception, failed_artifacts=failed_artifacts
+        )
         # this is bad because we're losing the original traceback
         # needs to be refactored - also, the orginal error should be raised
         raise RuntimeError(error_message)
     return None
 
 
-def prepare_error_message(records, stored_artifacts, exception) -> str:
+def prepare_error_message(
+    records,
+    stored_artifacts,
+    exception,
+    failed_artifacts: list[tuple[Artifact, Exception]] | None = None,
+) -> str:
     if len(stored_artifacts) == 0:
         error_message = (
             "No entries were uploaded or committed"
@@ -472,14 +548,24 @@ def prepare_error_message(records, stored_artifacts, exception) -> str:
             " successfully uploaded and committed to the database:\n"
         )
         for record in stored_artifacts:
-            error_message += (
-                f"- {', '.join(record.__repr__().split(', ')[:3]) + ', ...)'}\n"
-            )
+            error_message += f"- {_short_repr(record)}\n"
         error_message += "\nSee error message:\n\n"
-    error_message += f"{str(exception)}\n\n{traceback.format_exc()}"
+    if failed_artifacts is not None and len(failed_artifacts) > 1:
+        error_message += "The following entries failed:\n"
+        for record, record_exception in failed_artifacts:
+            error_message += f"- {_short_repr(record)}: {record_exception}\n"
+        error_message += "\n"
+    # the exception might have been caught in a worker thread
+    # so format its own traceback rather than the one currently handled
+    error_traceback = "".join(traceback.format_exception(exception))
+    error_message += f"{str(exception)}\n\n{error_traceback}"
     return error_message
 
 
+def _short_repr(record) -> str:
+    return ", ".join(record.__repr__().split(", ")[:3]) + ", ...)"
+
+
 def upload_artifact(
     artifact,
     using_key: str | None = None,
@@ -65,6 +65,7 @@ from ..errors import (
     NoWriteAccess,
     ValidationError,
 )
+from ._connections import instance_connections
 from ._is_versioned import IsVersioned
 from .query_manager import QueryManager, _lookup, _search
 
@@ -77,6 +78,7 @@ if TYPE_CHECKING:
     from .block import BranchBlock, SpaceBlock
     from .query_set import SQLRecordList
     from .run import Run, User
+    from .storage import Storage
     from .transform import Transform
 
 
@@ -466,6 +468,21 @@ def suggest_records_with_similar_names(
     return None
 
 
+def check_storage_is_managed(storage: Storage) -> None:
+    """Raise if artifacts in a storage location can't be deleted in storage."""
+    isettings = setup_settings.instance
+    if storage.instance_uid != isettings.uid:
+        from ..errors import IntegrityError
+        from .storage import Storage
+
+        raise IntegrityError(
+            "Cannot simply delete artifacts outside of this instance's managed storage locations."
+            "\n(1) If you only want to delete the metadata record in this instance, pass `storage=False`"
+            f"\n(2) If you want to delete the artifact in storage, please connect to the writing lamindb instance (uid={storage.instance_uid})."
+            f"\nThese are all managed storage locations of this instance:\n{Storage.filter(instance_uid=isettings.uid).to_dataframe()}"
+        )
+
+
 def delete_record(record: BaseSQLRecord, is_soft: bool = True):
     def delete():
         if is_soft:
@@ -792,98 +809,8 @@ class Registry(ModelBase):
         # we're in the default instance
         if instance is None or instance == "default":
             return QuerySet(model=cls, using=None)
-        # connection already established
-        if instance in connections:
-            return QuerySet(model=cls, using=instance)
-
-        owner, name = get_owner_name_from_identifier(instance)
-        current_instance_owner_name: list[str] = setup_settings.instance.slug.split("/")
-
-        # move on to different instances
-        cache_using_filepath = (
-            setup_settings.cache_dir / f"instance--{owner}--{name}--uid.txt"
-        )
-        settings_file = instance_settings_file(name, owner)
-        if not settings_file.exists():
-            result = connect_instance_hub(owner=owner, name=name)
-            if isinstance(result, str):
-                raise RuntimeError(
-                    f"Failed to load instance {instance}, please check your permissions!"
-                )
-            iresult, storage = result
-            # this can happen if querying via an old instance name
-            if [iresult.get("owner"), iresult["name"]] == current_instance_owner_name:
-                return QuerySet(model=cls, using=None)
-            # do not use {} syntax below, it gives rise to a dict if the schema modules
-            # are empty and then triggers a TypeError in missing_members = source_modules - target_modules
-            source_modules = set(  # noqa
-                [mod for mod in iresult["schema_str"].split(",") if mod != ""]
-            )
-
-            # Try to connect to a clone if targeting a public instance but fall back to normal access if access failed
-            db = None
-            if (
-                "_public" in iresult["db_user_name"]
-                and "postgresql" in iresult["db_scheme"]
-            ):
-                db = _synchronize_clone(storage["root"])
-            if db is None:
-                if [
-                    iresult.get("owner"),
-                    iresult["name"],
-                ] == current_instance_owner_name:
-                    return QuerySet(model=cls, using=None)
-                db = update_db_using_local(iresult, settings_file)
-                is_fine_grained_access = (
-                    iresult["fine_grained_access"]
-                    and iresult["db_permissions"] == "jwt"
-                )
-            else:
-                is_fine_grained_access = False
-
-            cache_using_filepath.write_text(
-                f"{iresult['lnid']}\n{iresult['schema_str']}", encoding="utf-8"
-            )
-
-            # access_db can take both: the dict from connect_instance_hub and isettings
-            into_db_token = iresult
-        else:
-            isettings = load_instance_settings(settings_file)
-            source_modules = isettings.modules
-            db = None
-            if "public" in isettings.db and isettings.dialect == "postgresql":
-                db = _synchronize_clone(isettings.storage.root_as_str)
-
-            # Try to connect to a clone if targeting a public instance but fall back to normal access if access failed
-            if db is None:
-                if [isettings.owner, isettings.name] == current_instance_owner_name:
-                    return QuerySet(model=cls, using=None)
-                db = isettings.db
-                is_fine_grained_access = (
-                    isettings._fine_grained_access
-                    and isettings._db_permissions == "jwt"
-                )
-            else:
-                is_fine_grained_access = False
-
-            cache_using_filepath.write_text(
-                f"{isettings.uid}\n{','.join(source_modules)}", encoding="utf-8"
-            )
-            # access_db can take both: the dict from connect_instance_hub and isettings
-            into_db_token = isettings
-
-        target_modules = setup_settings.instance.modules
-        if missing_members := source_modules - target_modules:
-            logger.info(
-                f"in transfer, source lamindb instance has additional modules: {', '.join(missing_members)}"
-            )
-
-        add_db_connection(db, instance)
-        if is_fine_grained_access:
-            db_token = DBToken(into_db_token)
-            db_token_manager.set(db_token, instance)
-
-        return QuerySet(model=cls, using=instance)
+        using = instance_connections.connect(instance).using
+        return QuerySet(model=cls, using=using)
 
     def __get_module_name__(cls) -> str:
         schema_module_name = cls.__module__.split(".")[0]
@@ -1557,22 +1484,12 @@ class SQLRecord(BaseSQLRecord, metaclass=Registry):
             return
         name_with_module = self.__class__.__get_name_with_module__()
 
-        if name_with_module == "Artifact":
+        if name_with_module == "Artifact" and (
+            kwargs["storage"] or kwargs["storage"] is None
+        ):
             # this first check means an invalid delete fails fast rather than cascading through
             # database and storage permission errors
-            isettings = setup_settings.instance
-            if self.storage.instance_uid != isettings.uid and (
-                kwargs["storage"] or kwargs["storage"] is None
-            ):
-                from ..errors import IntegrityError
-                from .storage import Storage
-
-                raise IntegrityError(
-                    "Cannot simply delete artifacts outside of this instance's managed storage locations."
-                    "\n(1) If you only want to delete the metadata record in this instance, pass `storage=False`"
-                    f"\n(2) If you want to delete the artifact in storage, please connect to the writing lamindb instance (uid={self.storage.instance_uid})."
-                    f"\nThese are all managed storage locations of this instance:\n{Storage.filter(instance_uid=isettings.uid).to_dataframe()}"
-                )
+            check_storage_is_managed(self.storage)
 
         # change branch_id to trash
         trash_branch_id = -1
@@ -1745,9 +1662,13 @@ def get_name_field(
     return field
 
 
+# seconds that a connection to another instance is kept open for reuse
+CONN_MAX_AGE = 600
+
+
 def add_db_connection(db: str, using: str):
     db_config = dj_database_url.config(
-        default=db, conn_max_age=600, conn_health_checks=True
+        default=db, conn_max_age=CONN_MAX_AGE, conn_health_checks=True
     )
     db_config["TIME_ZONE"] = "UTC"
     db_config["OPTIONS"] = {}
@@ -1755,6 +1676,100 @@ def add_db_connection(db: str, using: str):
     connections.settings[using] = db_config
 
 
+def connect_instance_db(instance: str) -> tuple[str | None, set[str]]:
+    """Add a database connection for an instance.
+
+    Returns the connection alias, `None` for the current instance, and the
+    modules of the instance.
+    """
+    owner, name = get_owner_name_from_identifier(instance)
+    current_instance_owner_name: list[str] = setup_settings.instance.slug.split("/")
+
+    # move on to different instances
+    cache_using_filepath = (
+        setup_settings.cache_dir / f"instance--{owner}--{name}--uid.txt"
+    )
+    settings_file = instance_settings_file(name, owner)
+    if not settings_file.exists():
+        result = connect_instance_hub(owner=owner, name=name)
+        if isinstance(result, str):
+            raise RuntimeError(
+                f"Failed to load instance {instance}, please check your permissions!"
+            )
+        iresult, storage = result
+        # this can happen if querying via an old instance name
+        if [iresult.get("owner"), iresult["name"]] == current_instance_owner_name:
+            return None, setup_settings.instance.modules
+        # do not use {} syntax below, it gives rise to a dict if the schema modules
+        # are empty and then triggers a TypeError in missing_members = source_modules - target_modules
+        source_modules = set(  # noqa
+            [mod for mod in iresult["schema_str"].split(",") if mod != ""]
+        )
+
+        # Try to connect to a clone if targeting a public instance but fall back to normal access if access failed
+        db = None
+        if (
+            "_public" in iresult["db_user_name"]
+            and "postgresql" in iresult["db_scheme"]
+        ):
+            db = _synchronize_clone(storage["root"])
+        if db is None:
+            if [
+                iresult.get("owner"),
+                iresult["name"],
+            ] == current_instance_owner_name:
+                return None, setup_settings.instance.modules
+            db = update_db_using_local(iresult, settings_file)
+            is_fine_grained_access = (
+                iresult["fine_grained_access"] and iresult["db_permissions"] == "jwt"
+            )
+        else:
+            is_fine_grained_access = False
+
+        cache_using_filepath.write_text(
+            f"{iresult['lnid']}\n{iresult['schema_str']}", encoding="utf-8"
+        )
+
+        # access_db can take both: the dict from connect_instance_hub and isettings
+        into_db_token = iresult
+    else:
+        isettings = load_instance_settings(settings_file)
+        source_modules = isettings.modules
+        db = None
+        if "public" in isettings.db and isettings.dialect == "postgresql":
+            db = _synchronize_clone(isettings.storage.root_as_str)
+
+        # Try to connect to a clone if targeting a public instance but fall back to normal access if access failed
+        if db is None:
+            if [isettings.owner, isettings.name] == current_instance_owner_name:
+                return None, setup_settings.instance.modules
+            db = isettings.db
+            is_fine_grained_access = (
+                isettings._fine_grained_access and isettings._db_permissions == "jwt"
+            )
+        else:
+            is_fine_grained_access = False
+
+        cache_using_filepath.write_text(
+            f"{isettings.uid}\n{','.join(source_modules)}", encoding="utf-8"
+        )
+        # access_db can take both: the dict from connect_instance_hub and isettings
+        into_db_token = isettings
+
+    target_modules = setup_settings.instance.modules
+    if missing_members := source_modules - target_modules:
+        logger.info(
+            f"in transfer, source lamindb instance has additional modules: {', '.join(missing_members)}"
+        )
+
+    add_db_connection(db, instance)
+    if is_fine_grained_access:
+        db_token = DBToken(into_db_token)
+        db_token_manager.set(db_token, instance)
+
+    return instance, source_modules
+
+
 REGISTRY_UNIQUE_FIELD = {"storage": "root", "ulabel": "name"}
 
 
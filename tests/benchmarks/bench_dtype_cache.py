@@ -0,0 +1,64 @@
+"""Benchmark parsing the feature dtypes of a wide schema.
+
+Run against a connected SQLite test instance::
+
+    python tests/benchmarks/bench_dtype_cache.py --n-features 2000
+
+Reports the time of `parse_dtype()` and `dtype_as_object()` over the dtypes
+of all features, first with cleared caches and then with warm caches, and the
+number of database queries of each pass.
+"""
+
+import argparse
+import time
+
+import bionty as bt
+import lamindb as ln
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from lamindb.models.feature import (
+    _parsed_dtype_cache,
+    clear_dtype_cache,
+    dtype_as_object,
+    parse_dtype,
+    serialize_dtype,
+)
+
+
+def time_pass(function, dtype_strs: list[str]) -> tuple[float, int]:
+    """Time in ms and number of queries to process all dtypes."""
+    t_start = time.perf_counter()
+    with CaptureQueriesContext(connection) as queries:
+        for dtype_str in dtype_strs:
+            function(dtype_str)
+    return (time.perf_counter() - t_start) * 1e3, len(queries)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n-features", type=int, default=2000)
+    args = parser.parse_args()
+
+    sample_type = ln.Record(name="DtypeBenchmarkSample", is_type=True).save()
+    dtype_strs = [
+        serialize_dtype(sample_type),
+        serialize_dtype(list[ln.ULabel]),
+        serialize_dtype(bt.CellType.ontology_id),
+        "float",
+    ] * (args.n_features // 4)
+    try:
+        for function in (parse_dtype, dtype_as_object):
+            _parsed_dtype_cache.clear()
+            clear_dtype_cache()
+            cold_ms, cold_queries = time_pass(function, dtype_strs)
+            warm_ms, warm_queries = time_pass(function, dtype_strs)
+            print(
+                f"{function.__name__}: {cold_ms:.1f}ms and {cold_queries} queries"
+                f" cold, {warm_ms:.1f}ms and {warm_queries} queries warm"
+            )
+    finally:
+        sample_type.delete(permanent=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark the time of `import lamindb` in a fresh interpreter.
+
+Run with an instance configured::
+
+    python tests/benchmarks/bench_import.py --n-repeats 10
+
+Reports the wall time of `python -c "import lamindb"` and the time of the
+import statement itself, the difference is the startup of the interpreter.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+IMPORT_SCRIPT = """
+import time
+
+t_start = time.perf_counter()
+import lamindb
+print(time.perf_counter() - t_start)
+"""
+
+
+def time_import() -> tuple[float, float]:
+    """Wall time of the subprocess and time of the import in seconds."""
+    t_start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall_time = time.perf_counter() - t_start
+    return wall_time, float(result.stdout.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n-repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    # the first import compiles bytecode and warms up the file system cache
+    time_import()
+    wall_times, import_times = zip(*(time_import() for _ in range(args.n_repeats)))
+    print(
+        f"python -c 'import lamindb': {statistics.median(wall_times):.3f}s median,"
+        f" {min(wall_times):.3f}s min"
+    )
+    print(
+        f"import lamindb: {statistics.median(import_times):.3f}s median,"
+        f" {min(import_times):.3f}s min"
+    )
+
+
+if __name__ == "__main__":
+    main()
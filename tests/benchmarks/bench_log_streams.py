@@ -0,0 +1,78 @@
+"""Benchmark printing while `ln.track()` tracks stdout in a log file.
+
+Run with an instance configured::
+
+    python tests/benchmarks/bench_log_streams.py --n-writes 200000
+
+Compares the time of writing lines, progress bar updates and a long line
+without line breaks to untracked and to tracked stdout. The terminal is
+replaced by `os.devnull` so that only the overhead of tracking is measured.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import lamindb_setup as ln_setup
+from lamindb.core._context import LogStreamTracker
+
+
+class BenchmarkRun:
+    def __init__(self, uid: str):
+        self.uid = uid
+
+
+def write_lines(n_writes: int) -> None:
+    for i in range(n_writes):
+        sys.stdout.write(f"line {i}\n")
+
+
+def write_progress_bar(n_writes: int) -> None:
+    for i in range(n_writes):
+        sys.stdout.write(f"\rprogress {i}/{n_writes}")
+    sys.stdout.write("\n")
+
+
+def write_long_line(n_writes: int) -> None:
+    for i in range(n_writes):
+        sys.stdout.write(f"{i} ")
+    sys.stdout.write("\n")
+
+
+def time_writes(write, n_writes: int, tracked: bool) -> float:
+    """Time in seconds until the writes are in the log file."""
+    tracker = LogStreamTracker()
+    t_start = time.perf_counter()
+    if tracked:
+        tracker.start(BenchmarkRun("benchmarklogs"))
+    write(n_writes)
+    if tracked:
+        tracker.finish()
+        tracker.log_file_path.unlink()
+    return time.perf_counter() - t_start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n-writes", type=int, default=200_000)
+    args = parser.parse_args()
+
+    ln_setup.settings.cache_dir.mkdir(parents=True, exist_ok=True)
+    stdout = sys.stdout
+    results = []
+    with open(os.devnull, "w") as devnull:
+        sys.stdout = devnull
+        try:
+            for write in (write_lines, write_progress_bar, write_long_line):
+                untracked = time_writes(write, args.n_writes, tracked=False)
+                tracked = time_writes(write, args.n_writes, tracked=True)
+                results.append((write.__name__, untracked, tracked))
+        finally:
+            sys.stdout = stdout
+    for name, untracked, tracked in results:
+        print(f"{name}: {untracked:.3f}s untracked, {tracked:.3f}s tracked")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark `.search()` with and without a search index.
+
+Run against a connected SQLite test instance::
+
+    python tests/benchmarks/bench_search_index.py --n-records 20000
+
+Reports the time and the number of database queries per search, the latter
+must not include lookups of the search index once it's been inspected.
+"""
+
+import argparse
+import time
+
+import lamindb as ln
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from lamindb.core import create_search_index, drop_search_index
+
+
+def time_searches(strings: list[str], n_repeats: int) -> tuple[float, float]:
+    """Mean time in ms and mean number of queries per search."""
+    # the first search inspects the search index
+    list(ln.Record.search(strings[0], field="name"))
+    t_start = time.perf_counter()
+    with CaptureQueriesContext(connection) as queries:
+        for _ in range(n_repeats):
+            for string in strings:
+                list(ln.Record.search(string, field="name", limit=3))
+    n_searches = n_repeats * len(strings)
+    return (
+        (time.perf_counter() - t_start) * 1e3 / n_searches,
+        len(queries) / n_searches,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n-records", type=int, default=20_000)
+    parser.add_argument("--n-repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    benchmark_type = ln.Record(name="SearchBenchmark", is_type=True).save()
+    records = [
+        ln.Record(name=f"benchmark label {i} of sample {i % 97}", type=benchmark_type)
+        for i in range(args.n_records)
+    ]
+    ln.save(records)
+    strings = ["label 123", "sample 42", "benchmark label 9", "not a label"]
+    try:
+        ms, n_queries = time_searches(strings, args.n_repeats)
+        print(f"without index: {ms:.2f}ms and {n_queries:.1f} queries per search")
+        create_search_index(ln.Record, ["name"])
+        ms, n_queries = time_searches(strings, args.n_repeats)
+        print(f"with index:    {ms:.2f}ms and {n_queries:.1f} queries per search")
+    finally:
+        drop_search_index(ln.Record)
+        ln.Record.filter(type=benchmark_type).delete(permanent=True)
+        benchmark_type.delete(permanent=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -365,6 +365,87 @@ def test_from_dir(get_test_filepaths, key):
         artifact.delete(permanent=True, storage=False)
 
 
+def test_from_dir_batched_lookup(tmp_path, monkeypatch):
+    test_dirpath = tmp_path / "from_dir_batched"
+    (test_dirpath / "sub").mkdir(parents=True)
+    for i in range(4):
+        (test_dirpath / "sub" / f"file_{i}.txt").write_text(f"content {i}")
+    ln.settings.creation.artifact_hash_max_workers = 1
+    try:
+        artifacts_serial = ln.Artifact.from_dir(test_dirpath)
+    finally:
+        ln.settings.creation.artifact_hash_max_workers = None
+    # small directories are hashed serially, enforce hashing in threads
+    monkeypatch.setattr(ln.models.artifact, "HASH_SERIAL_MAX_BYTES", 0)
+    artifacts = ln.Artifact.from_dir(test_dirpath)
+    assert len(artifacts) == 4
+    hashes_by_key = {artifact.key: artifact.hash for artifact in artifacts}
+    assert hashes_by_key == {
+        artifact.key: artifact.hash for artifact in artifacts_serial
+    }
+    assert "from_dir_batched/sub/file_0.txt" in hashes_by_key
+    artifacts.save()
+    # existing artifacts are found by hash, a changed file becomes a new version
+    (test_dirpath / "sub" / "file_0.txt").write_text("new content 0")
+    artifacts_again = ln.Artifact.from_dir(test_dirpath)
+    uids = {artifact.uid for artifact in artifacts}
+    new_artifacts = [a for a in artifacts_again if a.uid not in uids]
+    assert len(new_artifacts) == 1
+    assert new_artifacts[0].key == "from_dir_batched/sub/file_0.txt"
+    previous_version = next(
+        a for a in artifacts if a.key == "from_dir_batched/sub/file_0.txt"
+    )
+    assert new_artifacts[0].stem_uid == previous_version.stem_uid
+    for artifact in artifacts:
+        artifact.delete(permanent=True)
+
+
+def test_from_paths(tmp_path):
+    filepaths = []
+    for i in range(3):
+        filepath = tmp_path / f"from_paths_{i}.txt"
+        filepath.write_text(f"from paths {i}")
+        filepaths.append(filepath)
+    keys = [f"from_paths/file_{i}.txt" for i in range(3)]
+    existing = ln.Artifact(filepaths[0], key=keys[0]).save()
+    versioned = ln.Artifact(filepaths[1], key=keys[1]).save()
+    filepaths[1].write_text("from paths 1, new content")
+    with pytest.raises(ValueError):
+        ln.Artifact.from_paths(filepaths, keys=keys[:2])
+    artifacts = ln.Artifact.from_paths(filepaths, keys=keys, description="batch")
+    assert len(artifacts) == 3
+    # same hash returns the existing artifact
+    assert artifacts[0] == existing
+    # same key with a different hash creates a new version
+    assert artifacts[1]._state.adding
+    assert artifacts[1].stem_uid == versioned.stem_uid
+    assert artifacts[1].description == "batch"
+    assert artifacts[2]._state.adding
+    assert artifacts[2].key == keys[2]
+    # without keys, only the hashes are looked up
+    artifacts_without_keys = ln.Artifact.from_paths(filepaths, description="batch")
+    assert artifacts_without_keys[0] == existing
+    assert artifacts_without_keys[1].key is None
+    existing.delete(permanent=True)
+    versioned.delete(permanent=True)
+
+
+def test_from_paths_folder(tmp_path):
+    folder = tmp_path / "from_paths_folder"
+    folder.mkdir()
+    (folder / "file.txt").write_text("from paths folder")
+    filepath = tmp_path / "from_paths_file.txt"
+    filepath.write_text("from paths file next to a folder")
+    artifacts = ln.Artifact.from_paths([folder, filepath], description="folder").save()
+    assert artifacts[0].n_files == 1
+    # registering the same folder again returns the existing artifact
+    artifacts_again = ln.Artifact.from_paths([folder, filepath], description="folder")
+    assert artifacts_again[0] == artifacts[0]
+    assert artifacts_again[1] == artifacts[1]
+    for artifact in artifacts:
+        artifact.delete(permanent=True)
+
+
 def test_create_from_dataframe(example_dataframe: pd.DataFrame):
     df = example_dataframe
     artifact = ln.Artifact.from_dataframe(df, description="test1")
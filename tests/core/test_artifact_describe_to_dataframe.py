@@ -5,6 +5,9 @@ import lamindb as ln
 import numpy as np
 import pandas as pd
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from lamindb.models import _django, _feature_manager, _label_manager
 from lamindb.models._describe import describe_postgres, describe_sqlite
 
 
@@ -208,3 +211,60 @@ def test_describe_to_dataframe_example_dataset():
     bt.Gene.filter().delete(permanent=True)
     ln.Record.filter().delete(permanent=True)
     bt.CellType.filter().delete(permanent=True)
+
+
+@pytest.mark.skipif(
+    ln.setup.settings.instance.dialect != "sqlite", reason="tests the SQLite path"
+)
+def test_describe_json_aggregation_sqlite(tmp_path, monkeypatch):
+    filepath = tmp_path / "describe_json_aggregation.txt"
+    filepath.write_text("describe json aggregation")
+    artifact = ln.Artifact(filepath, description="json aggregation").save()
+    features = [
+        ln.Feature(name="agg_note", dtype=str).save(),
+        ln.Feature(name="agg_temperature", dtype=float).save(),
+        ln.Feature(name="agg_record", dtype=ln.Record).save(),
+        ln.Feature(name="agg_cell_type", dtype=bt.CellType).save(),
+    ]
+    record = ln.Record(name="aggregated record").save()
+    cell_types = [
+        bt.CellType(name="aggregated cell A").save(),
+        bt.CellType(name="aggregated cell B").save(),
+    ]
+    ulabel = ln.ULabel(name="aggregated ulabel").save()
+    artifact.features.add_values(
+        {
+            "agg_note": "a note",
+            "agg_temperature": 21.6,
+            "agg_record": "aggregated record",
+            "agg_cell_type": ["aggregated cell A", "aggregated cell B"],
+        }
+    )
+    artifact.ulabels.add(ulabel)
+
+    # the output of the previous path with one query per relation
+    with monkeypatch.context() as m:
+        for module in (_django, _feature_manager, _label_manager):
+            m.setattr(module, "supports_json_aggregation", lambda using: False)
+        with CaptureQueriesContext(connection) as queries_per_relation:
+            expected_output = artifact.describe(return_str=True)
+        expected_values = artifact.features.get_values()
+
+    assert _django.supports_json_aggregation(artifact._state.db)
+    with CaptureQueriesContext(connection) as queries:
+        output = artifact.describe(return_str=True)
+    assert output == expected_output
+    assert "aggregated cell A" in output
+    assert "21.6" in output
+    assert "aggregated ulabel" in output
+    assert artifact.features.get_values() == expected_values
+    assert len(queries) <= 10
+    assert len(queries) < len(queries_per_relation)
+
+    artifact.delete(permanent=True)
+    ulabel.delete(permanent=True)
+    for cell_type in cell_types:
+        cell_type.delete(permanent=True)
+    record.delete(permanent=True)
+    for feature in features:
+        feature.delete(permanent=True)
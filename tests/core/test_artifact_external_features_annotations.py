@@ -677,3 +677,92 @@ def test_add_list_of_cat_features():
     feat2.delete(permanent=True)
     type_1.records.all().delete(permanent=True)
     type_1.delete(permanent=True)
+
+
+def test_features_add_values_bulk():
+    import pandas as pd
+
+    ulabel1 = ln.ULabel(name="bulk ulabel 1").save()
+    ulabel2 = ln.ULabel(name="bulk ulabel 2").save()
+    feature_ulabel = ln.Feature(name="bulk_ulabel", dtype=ln.ULabel).save()
+    feature_ulabels = ln.Feature(name="bulk_ulabels", dtype=list[ln.ULabel]).save()
+    feature_int = ln.Feature(name="bulk_int", dtype=int).save()
+    feature_str = ln.Feature(name="bulk_str", dtype=str).save()
+    artifacts = [
+        ln.Artifact.from_dataframe(
+            pd.DataFrame({"a": [i]}), key=f"bulk_{i}.parquet"
+        ).save()
+        for i in range(3)
+    ]
+    # a value that already exists
+    artifacts[0].features.add_values({"bulk_str": "a"})
+
+    df = pd.DataFrame(
+        {
+            "bulk_ulabel": ["bulk ulabel 1", ulabel2, None],
+            "bulk_ulabels": [["bulk ulabel 1", "bulk ulabel 2"], None, None],
+            "bulk_int": pd.array([1, 2, None], dtype="Int64"),
+            "bulk_str": ["a", "b", "a"],
+        },
+        index=artifacts,
+    )
+    queryset = ln.Artifact.filter(key__startswith="bulk_")
+    queryset.add_feature_values(df)
+    assert artifacts[0].features.get_values() == {
+        "bulk_ulabel": "bulk ulabel 1",
+        "bulk_ulabels": ["bulk ulabel 1", "bulk ulabel 2"],
+        "bulk_int": 1,
+        "bulk_str": "a",
+    }
+    assert artifacts[1].features.get_values() == {
+        "bulk_ulabel": "bulk ulabel 2",
+        "bulk_int": 2,
+        "bulk_str": "b",
+    }
+    assert artifacts[2].features.get_values() == {"bulk_str": "a"}
+    assert ln.models.JsonValue.filter(feature=feature_str).count() == 2
+    assert ln.models.JsonValue.filter(feature=feature_int).count() == 2
+    # adding the same values again does not create duplicates, also by uid
+    queryset.add_feature_values(df.set_axis([artifact.uid for artifact in artifacts]))
+    assert artifacts[0].ulabels.through.filter(artifact=artifacts[0]).count() == 3
+    assert ln.models.JsonValue.filter(feature=feature_str).count() == 2
+
+    with pytest.raises(ValidationError) as error:
+        queryset.add_feature_values(
+            pd.DataFrame({"bulk_ulabel": ["invalid"]}, index=artifacts[:1])
+        )
+    assert error.exconly().startswith(
+        "lamindb.errors.ValidationError: These values could not be validated: {'ULabel': ('name', ['invalid'])}"
+    )
+    # invalid values of two fields of the same registry are both reported
+    feature_uid = ln.Feature(name="bulk_ulabel_uid", dtype=ln.ULabel.uid).save()
+    with pytest.raises(ValidationError) as error:
+        queryset.add_feature_values(
+            pd.DataFrame(
+                {"bulk_ulabel": ["invalid"], "bulk_ulabel_uid": ["invalid uid"]},
+                index=artifacts[:1],
+            )
+        )
+    assert "'ULabel.name': ('name', ['invalid'])" in error.exconly()
+    assert "'ULabel.uid': ('uid', ['invalid uid'])" in error.exconly()
+    with pytest.raises(ValidationError) as error:
+        queryset.add_feature_values(
+            pd.DataFrame({"bulk_int": ["1"]}, index=artifacts[:1])
+        )
+    assert "Expected dtype for 'bulk_int' is 'int'" in error.exconly()
+    with pytest.raises(ValueError) as error:
+        ln.Artifact.filter(key="bulk_0.parquet").add_feature_values(df)
+    assert "aren't in the query set" in error.exconly()
+
+    for artifact in artifacts:
+        artifact.delete(permanent=True)
+    for feature in [
+        feature_ulabel,
+        feature_ulabels,
+        feature_int,
+        feature_str,
+        feature_uid,
+    ]:
+        feature.delete(permanent=True)
+    ulabel1.delete(permanent=True)
+    ulabel2.delete(permanent=True)
@@ -179,3 +179,36 @@ def test_validate_called_on_object_raises_error():
         "ULabel.validate() is a class method and must be called on the ULabel class, not on a ULabel object"
         in str(error.value)
     )
+
+
+def test_inspect_validate_query_candidate_records():
+    bt.CellType.filter().delete(permanent=True)
+    bt.CellType(name="T cell", synonyms="T-cell|T lymphocyte").save()
+    bt.CellType(name="B cell").save()
+    values = ["T cell", "t cell", "T-cell", "unknown"]
+
+    for cache_registry_values in [False, True]:
+        ln.settings.annotation.cache_registry_values = cache_registry_values
+        try:
+            assert bt.CellType.validate(values, mute=True).tolist() == [
+                True,
+                False,
+                False,
+                False,
+            ]
+            result = bt.CellType.inspect(values, mute=True, from_source=False)
+            assert result.validated == ["T cell"]
+            assert result.synonyms_mapper == {"t cell": "T cell", "T-cell": "T cell"}
+            # new records are visible to subsequent calls
+            bt.CellType(name="unknown").save()
+            assert bt.CellType.validate(values, mute=True).sum() == 2
+            bt.CellType.filter(name="unknown").delete(permanent=True)
+            assert bt.CellType.validate(values, mute=True).sum() == 1
+        finally:
+            ln.settings.annotation.cache_registry_values = False
+
+    # more values than fit into a single query
+    many_values = [f"cell type {i}" for i in range(25_000)] + ["B cell"]
+    assert bt.CellType.validate(many_values, mute=True).sum() == 1
+
+    bt.CellType.filter().delete(permanent=True)
@@ -5,6 +5,7 @@ import lamindb as ln
 import numpy as np
 import pandas as pd
 import pytest
+from lamindb.core import MappedCollection
 from lamindb.errors import FieldValidationError
 from scipy.sparse import csc_matrix, csr_matrix
 
@@ -122,6 +123,35 @@ def test_from_inconsistent_artifacts(df, adata):
     ln.context._run = None
 
 
+def test_load_dataframe_collection():
+    df1 = pd.DataFrame({"feat1": [1, 2], "feat2": ["a", "b"]})
+    df2 = pd.DataFrame({"feat1": [3, 4, 5], "feat2": ["c", "d", "e"]})
+    df3 = pd.DataFrame({"feat1": [6], "feat3": [1.0]}, index=["r1"])
+    artifacts = [
+        ln.Artifact.from_dataframe(df, key=f"df_{i}.parquet").save()
+        for i, df in enumerate([df1, df2, df3])
+    ]
+    # same schemas are concatenated as arrow tables
+    collection = ln.Collection(artifacts[:2], key="dataframes").save()
+    pd.testing.assert_frame_equal(collection.load(), pd.concat([df1, df2]))
+    pd.testing.assert_frame_equal(collection.load(max_workers=1), pd.concat([df1, df2]))
+    pd.testing.assert_frame_equal(
+        collection.load(ignore_index=True), pd.concat([df1, df2], ignore_index=True)
+    )
+    # different schemas are concatenated with pandas
+    collection2 = ln.Collection(artifacts, key="dataframes 2").save()
+    pd.testing.assert_frame_equal(collection2.load(), pd.concat([df1, df2, df3]))
+    pd.testing.assert_frame_equal(
+        collection2.load(join="inner"), pd.concat([df1, df2, df3], join="inner")
+    )
+    with pytest.raises(ValueError):
+        collection.load(on_disk=True)
+    collection2.delete(permanent=True)
+    collection.delete(permanent=True)
+    for artifact in artifacts:
+        artifact.delete(permanent=True)
+
+
 def test_from_consistent_artifacts(adata, adata2):
     artifact1 = ln.Artifact.from_anndata(adata, key="my_test.h5ad").save()
     artifact2 = ln.Artifact.from_anndata(adata2, key="my_test.h5ad").save()
@@ -139,6 +169,24 @@ def test_from_consistent_artifacts(adata, adata2):
     adata_joined = collection.artifacts.order_by("-created_at").load()
     assert "artifact_uid" in adata_joined.obs.columns
     assert artifact1.uid in adata_joined.obs.artifact_uid.cat.categories
+    # cache concurrently
+    assert collection.cache(max_workers=2, mute=True) == [
+        artifact.cache() for artifact in collection.ordered_artifacts.all()
+    ]
+    # concatenate on disk
+    adata_backed = collection.load(on_disk=True, max_workers=2)
+    assert adata_backed.isbacked
+    assert adata_backed.n_obs == 4
+    assert artifact1.uid in adata_backed.obs.artifact_uid.cat.categories
+    # the concatenated file is reused while it's open
+    adata_backed2 = collection.load(on_disk=True)
+    assert adata_backed2.filename == adata_backed.filename
+    # other arguments write another file
+    adata_backed3 = collection.load(on_disk=True, label="dataset")
+    assert adata_backed3.filename != adata_backed.filename
+    assert "dataset" in adata_backed3.obs.columns
+    for backed in (adata_backed, adata_backed2, adata_backed3):
+        backed.file.close()
 
     # re-run with hash-based lookup
     collection2 = ln.Collection([artifact1, artifact2], key="My test 1", run=run)
@@ -168,7 +216,7 @@ def test_from_consistent_artifacts(adata, adata2):
     artifact2.delete(permanent=True)
 
 
-def test_mapped(adata, adata2):
+def test_mapped(adata, adata2, tmp_path):
     # prepare test data
     adata.strings_to_categoricals()
     adata.obs["feat2"] = adata.obs["feat1"]
@@ -331,11 +379,81 @@ def test_mapped(adata, adata2):
         assert ls_ds.check_vars_non_aligned(["MYC", "TCF7", "GATA1"]) == [2]
         assert not ls_ds.check_vars_sorted()
         assert len(ls_ds.get_label_weights("feat1")) == 6
+        # missing labels are counted as "nan"
+        assert ls_ds.get_label_weights("feat1", return_categories=True) == {
+            "A": 0.5,
+            "B": 1.0 / 3.0,
+            "nan": 1.0,
+        }
+        assert list(ls_ds.get_batch([4, 5])["feat1"]) == [
+            np.nan,
+            ls_ds.encoders["feat1"]["B"],
+        ]
 
     with collection_outer.mapped(layers_keys="layer1", join="outer") as ls_ds:
         assert np.array_equal(ls_ds[0]["layer1"], np.array([0, 0, 0, 3, 0, 2]))
         assert np.array_equal(ls_ds[4]["layer1"], np.array([1, 2, 5, 0, 0, 0]))
 
+    # batched reads match single reads
+    with collection_outer.mapped(
+        layers_keys=["X", "layer1"], obsm_keys="X_pca", obs_keys="feat1", join="outer"
+    ) as ls_ds:
+        indices = [5, 0, 3, 4, 1, 3]
+        batch = ls_ds.get_batch(indices)
+        assert batch["X"].shape == (6, 6)
+        for i, idx in enumerate(indices):
+            item = ls_ds[idx]
+            assert np.array_equal(batch["X"][i], item["X"])
+            assert np.array_equal(batch["layer1"][i], item["layer1"])
+            assert np.array_equal(batch["obsm_X_pca"][i], item["obsm_X_pca"])
+            assert batch["_store_idx"][i] == item["_store_idx"]
+        assert batch["feat1"][3] is np.nan
+        items = ls_ds.__getitems__(indices)
+        assert len(items) == 6
+        assert items[0]["feat1"] == ls_ds[5]["feat1"]
+        # reading chunks of rows ahead gives the same results
+        item = ls_ds[5]
+        ls_ds.enable_readahead(chunk_size=2, max_workers=2, n_chunks_ahead=2)
+        ls_ds.readahead(indices)
+        batch_readahead = ls_ds.get_batch(indices)
+        for key in ["X", "layer1", "obsm_X_pca", "_store_idx"]:
+            assert np.array_equal(batch_readahead[key], batch[key])
+        assert batch_readahead["feat1"][3] is np.nan
+        assert list(np.delete(batch_readahead["feat1"], 3)) == list(
+            np.delete(batch["feat1"], 3)
+        )
+        item_readahead = ls_ds[5]
+        assert np.array_equal(item_readahead["X"], item["X"])
+        assert item_readahead["feat1"] == item["feat1"]
+        stats = ls_ds.readahead_stats
+        assert stats["hits"] > 0
+        assert stats["bytes_fetched"] > 0
+        # a tiny cache holds no chunks
+        ls_ds.enable_readahead(chunk_size=2, max_cache_bytes=1)
+        batch_readahead = ls_ds.get_batch(indices)
+        assert np.array_equal(batch_readahead["X"], batch["X"])
+        assert ls_ds.readahead_stats["n_cached_chunks"] == 0
+    # the index is memory-mapped from the manifest when reopening
+    paths = [artifact.cache() for artifact in collection_outer.ordered_artifacts.all()]
+    for _ in range(2):
+        with MappedCollection(
+            paths,
+            obs_keys="feat1",
+            obs_filter={"feat1": ["A", "B"]},
+            join="outer",
+            manifest=tmp_path / "manifest",
+        ) as ls_ds:
+            assert ls_ds.shape == (5, 6)
+            assert ls_ds.encoders == {"feat1": {"A": 0, "B": 1}}
+            assert [ls_ds[i]["feat1"] for i in range(5)] == [0, 1, 0, 1, 1]
+            assert np.array_equal(ls_ds[4]["X"], np.array([4, 5, 8, 0, 0, 0]))
+    assert (tmp_path / "manifest" / "manifest.json").exists()
+    assert isinstance(ls_ds.indices, np.memmap)
+    with collection.mapped(obs_keys="feat1", encode_labels=False) as ls_ds:
+        batch = ls_ds.get_batch([3, 0])
+        assert np.array_equal(batch["X"], np.array([[4, 5, 8], [1, 2, 3]]))
+        assert list(batch["feat1"]) == ["B", "A"]
+
     # csc matrix in layers
     with pytest.raises(ValueError):
         collection_csc.mapped(layers_keys="layer1")
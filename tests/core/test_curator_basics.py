@@ -6,6 +6,7 @@ import lamindb as ln
 import pandas as pd
 import pytest
 from lamindb.core.exceptions import ValidationError
+from lamindb.curators.core import annotate_artifact
 
 
 def _strip_ansi(text: str) -> str:
@@ -480,6 +481,39 @@ def test_nullable():
     disease.delete(permanent=True)
 
 
+def test_save_artifact_links_labels_of_all_features():
+    disease = ln.Feature(name="disease_bulk", dtype=ln.ULabel).save()
+    sample = ln.Feature(name="sample_bulk", dtype=ln.Record).save()
+    labels = ln.ULabel.from_values(["asthma", "flu"], create=True).save()
+    records = ln.Record.from_values(["sample_a", "sample_b"], create=True).save()
+    schema = ln.Schema(features=[disease, sample]).save()
+    df = pd.DataFrame(
+        {
+            "disease_bulk": pd.Categorical(["asthma", "flu", "asthma"]),
+            "sample_bulk": pd.Categorical(["sample_a", "sample_b", "sample_b"]),
+        }
+    )
+    curator = ln.curators.DataFrameCurator(df, schema)
+    artifact = curator.save_artifact(key="examples/annotate_bulk.parquet")
+    assert set(artifact.labels.get(disease).to_list("name")) == {"asthma", "flu"}
+    assert set(artifact.labels.get(sample).to_list("name")) == {
+        "sample_a",
+        "sample_b",
+    }
+    assert artifact.features.slots["columns"].members.count() == 2
+    # annotating again doesn't duplicate links
+    annotate_artifact(artifact, curator=curator, cat_vectors=curator.cat._cat_vectors)
+    assert artifact.links_ulabel.filter(feature=disease).count() == 2
+    assert artifact._links_schema.count() == 1
+
+    artifact.delete(permanent=True)
+    schema.delete(permanent=True)
+    ln.ULabel.filter(id__in=[label.id for label in labels]).delete(permanent=True)
+    ln.Record.filter(id__in=[record.id for record in records]).delete(permanent=True)
+    disease.delete(permanent=True)
+    sample.delete(permanent=True)
+
+
 def test_pandera_dataframe_schema(
     df,
     df_missing_sample_type_column,
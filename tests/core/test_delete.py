@@ -35,3 +35,82 @@ def test_recreate_soft_deleted_record():
     assert record.branch_id == 1
     assert record.description == "new description"
     bt.Ethnicity.objects.filter().delete()
+
+
+def test_delete_artifacts_in_bulk(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"bulk_{i}.txt"
+        path.write_text(str(i))
+        paths.append(path)
+    artifact_v1 = ln.Artifact(paths[0], description="bulk v1").save()
+    artifact_v2 = ln.Artifact(paths[1], revises=artifact_v1).save()
+    artifact_other = ln.Artifact(paths[2], description="bulk other").save()
+    storage_paths = [artifact_v1.path, artifact_v2.path, artifact_other.path]
+    ids = [artifact_v1.id, artifact_v2.id, artifact_other.id]
+
+    # the latest version is trashed, the previous version becomes the latest
+    ln.Artifact.filter(id__in=[artifact_v2.id, artifact_other.id]).delete()
+    assert ln.Artifact.filter(id__in=ids, branch_id=-1).count() == 2
+    artifact_v1.refresh_from_db()
+    artifact_v2.refresh_from_db()
+    assert artifact_v1.is_latest
+    assert not artifact_v2.is_latest
+
+    # no prompt in non-interactive mode
+    with pytest.raises(ValueError) as error:
+        ln.Artifact.filter(id__in=ids, branch_id=-1).delete(interactive=False)
+    assert "2 Artifact records are already in trash!" in error.exconly()
+    assert ln.Artifact.filter(id__in=ids, branch_id=-1).count() == 2
+
+    # filtering by ids includes all branches
+    ln.Artifact.filter(id__in=ids).delete(permanent=True, interactive=False)
+    assert ln.Artifact.filter(id__in=ids).count() == 0
+    assert not any(path.exists() for path in storage_paths)
+
+
+def test_delete_latest_versions_permanently_in_bulk(tmp_path):
+    paths = []
+    for i in range(2):
+        path = tmp_path / f"bulk_version_{i}.txt"
+        path.write_text(str(i))
+        paths.append(path)
+    artifact_v1 = ln.Artifact(paths[0], description="bulk version v1").save()
+    artifact_v2 = ln.Artifact(paths[1], revises=artifact_v1).save()
+    assert not ln.Artifact.get(artifact_v1.id).is_latest
+
+    # like `artifact.delete(permanent=True)`, the previous version becomes the latest
+    ln.Artifact.filter(id=artifact_v2.id).delete(permanent=True, interactive=False)
+    assert not ln.Artifact.filter(id=artifact_v2.id).exists()
+    artifact_v1.refresh_from_db()
+    assert artifact_v1.is_latest
+    artifact_v1.delete(permanent=True, storage=True)
+
+
+def test_delete_storage_paths_reports_failures(tmp_path, monkeypatch):
+    from lamindb.core.storage import paths
+    from lamindb_setup.core.upath import UPath
+
+    file = tmp_path / "file.txt"
+    file.write_text("a")
+    folder = tmp_path / "folder"
+    folder.mkdir()
+    (folder / "file.txt").write_text("b")
+    protected = tmp_path / "protected.txt"
+    protected.write_text("c")
+    delete_storage = paths.delete_storage
+
+    def delete_storage_with_error(storagepath, **kwargs):
+        if storagepath.name == "protected.txt":
+            raise PermissionError("not allowed")
+        return delete_storage(storagepath, **kwargs)
+
+    monkeypatch.setattr(paths, "delete_storage", delete_storage_with_error)
+    failed = paths.delete_storage_paths(
+        [UPath(file), UPath(folder), UPath(tmp_path / "missing.txt"), UPath(protected)]
+    )
+    assert not file.exists()
+    assert not folder.exists()
+    assert protected.exists()
+    assert list(failed) == [str(UPath(protected))]
+    assert isinstance(failed[str(UPath(protected))], PermissionError)
@@ -4,6 +4,8 @@ import bionty as bt
 import lamindb as ln
 import pandas as pd
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from lamindb import Record
 from lamindb.errors import ValidationError
 from lamindb.models.feature import (
@@ -343,6 +345,62 @@ def test_nested_cat_with_filter():
     customer_type.delete(permanent=True)
 
 
+def test_dtype_cache_invalidated_on_type_changes():
+    lab_type = ln.Record(name="CachedLab", is_type=True).save()
+    sample_type = ln.Record(name="CachedSample", is_type=True, type=lab_type).save()
+    feature = ln.Feature(name="cached_sample", dtype=sample_type).save()
+    assert feature.dtype == "cat[Record[CachedLab[CachedSample]]]"
+    # parsed components are copies of the cached ones
+    parse_dtype(feature._dtype_str)[0]["field_str"] = "uid"
+    assert parse_dtype(feature._dtype_str)[0]["field_str"] == "name"
+    sample_type.name = "CachedSpecimen"
+    sample_type.save()
+    assert feature.dtype == "cat[Record[CachedLab[CachedSpecimen]]]"
+    assert dtype_as_object(feature._dtype_str).name == "CachedSpecimen"
+    # returned type records are copies of the cached ones
+    dtype_as_object(feature._dtype_str).name = "Modified"
+    assert dtype_as_object(feature._dtype_str).name == "CachedSpecimen"
+    # bulk updates don't send signals but still invalidate the cache
+    ln.Record.filter(uid=sample_type.uid).update(name="UpdatedSpecimen")
+    assert dtype_as_object(feature._dtype_str).name == "UpdatedSpecimen"
+    feature.delete(permanent=True)
+    ln.Record.filter(uid=sample_type.uid).delete(permanent=True)
+    with pytest.raises(ln.errors.DoesNotExist):
+        parse_dtype(f"cat[Record[{sample_type.uid}]]", check_exists=True)
+    lab_type.delete(permanent=True)
+
+
+def test_dtype_as_object_cache_queries():
+    # parsing the dtypes of a wide schema during curation
+    sample_type = ln.Record(name="BenchmarkSample", is_type=True).save()
+    dtype_strs = [
+        serialize_dtype(sample_type),
+        serialize_dtype(list[ln.ULabel]),
+        serialize_dtype(bt.CellType.ontology_id),
+        "float",
+    ] * 100
+    dtype_as_object(dtype_strs[0])
+    # only the first call queries the type record
+    with CaptureQueriesContext(connection) as queries:
+        for dtype_str in dtype_strs:
+            dtype_as_object(dtype_str)
+    assert len(queries) == 0
+    sample_type.delete(permanent=True)
+
+
+def test_parse_dtype_cache_copies():
+    dtype_str = "cat[Record[LabA[Experiment]]]"
+    result = parse_dtype(dtype_str, old_format=True)
+    subtypes_list = list(result[0]["subtypes_list"])
+    # modifying the result doesn't modify the cached parsed dtype
+    result[0]["subtypes_list"].append("Sample")
+    result[0]["registry_str"] = "ULabel"
+    result_again = parse_dtype(dtype_str, old_format=True)
+    assert result_again[0]["subtypes_list"] == subtypes_list
+    assert result_again[0]["registry_str"] == "Record"
+    assert result_again[0]["field"] is ln.Record.name
+
+
 # -----------------------------------------------------------------------------
 # parsing django filter expressions
 # -----------------------------------------------------------------------------
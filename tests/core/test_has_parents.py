@@ -67,3 +67,51 @@ def test_view_lineage_connected_instance():
 
     if af and af.run:
         af.view_lineage()
+
+
+def test_lineage_edges():
+    import pandas as pd
+
+    transform = ln.Transform(key="test lineage edges").save()
+    run1 = ln.Run(transform=transform).save()
+    run2 = ln.Run(transform=transform).save()
+    run3 = ln.Run(transform=transform).save()
+    artifact1 = ln.Artifact.from_dataframe(
+        pd.DataFrame({"a": [1]}), description="lineage 1", run=run1
+    ).save()
+    run2.input_artifacts.add(artifact1)
+    artifact2 = ln.Artifact.from_dataframe(
+        pd.DataFrame({"a": [2]}), description="lineage 2", run=run2
+    ).save()
+    collection = ln.Collection(artifact2, key="lineage collection", run=run2).save()
+    run3.input_collections.add(collection)
+    artifact3 = ln.Artifact.from_dataframe(
+        pd.DataFrame({"a": [3]}), description="lineage 3", run=run3
+    ).save()
+
+    df = artifact2.lineage_edges()
+    edges = set(df.itertuples(index=False, name=None))
+    assert edges == {
+        ("run", run1.id, "artifact", artifact1.id),
+        ("artifact", artifact1.id, "run", run2.id),
+        ("run", run2.id, "artifact", artifact2.id),
+        ("run", run2.id, "collection", collection.id),
+        ("collection", collection.id, "run", run3.id),
+        ("run", run3.id, "artifact", artifact3.id),
+    }
+    df = artifact2.lineage_edges(with_children=False)
+    assert ("run", run3.id, "artifact", artifact3.id) not in set(
+        df.itertuples(index=False, name=None)
+    )
+    df = artifact3.lineage_edges(max_depth=1)
+    assert ("run", run1.id, "artifact", artifact1.id) not in set(
+        df.itertuples(index=False, name=None)
+    )
+    graph = artifact2.view_lineage(return_graph=True)
+    assert f"artifact_{artifact3.uid}" in graph.source
+
+    artifact3.delete(permanent=True)
+    collection.delete(permanent=True)
+    artifact2.delete(permanent=True)
+    artifact1.delete(permanent=True)
+    transform.delete(permanent=True)
@@ -0,0 +1,45 @@
+import subprocess
+import sys
+
+import pytest
+
+# heavy dependencies that `import lamindb` shouldn't import
+HEAVY_MODULES = [
+    "anndata",
+    "h5py",
+    "pandera",
+    "scipy",
+    "zarr",
+    "lamindb.curators",
+    "lamindb.examples",
+    "lamindb.integrations",
+    "lamindb.core.storage._backed_access",
+]
+
+IMPORT_SCRIPT = f"""
+import sys
+
+import lamindb
+print(",".join(module for module in {HEAVY_MODULES} if module in sys.modules))
+"""
+
+
+def test_import_lamindb_is_lazy():
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT], capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+    imported_modules = result.stdout.splitlines()[-1]
+    assert imported_modules == ""
+
+
+def test_lazy_modules_on_access():
+    import lamindb as ln
+
+    assert ln.curators.DataFrameCurator.__name__ == "DataFrameCurator"
+    assert callable(ln.integrations.save_tiledbsoma_experiment)
+    assert ln.examples.datasets is ln.core.datasets
+    assert ln.core.MappedCollection.__name__ == "MappedCollection"
+    assert "curators" in dir(ln)
+    with pytest.raises(AttributeError):
+        ln.not_a_module  # noqa: B018
@@ -74,6 +74,18 @@ def test_queryset_caching():
     assert res_1 != res_2
 
 
+def test_DB_close_keeps_other_objects_working():
+    """Closing a `DB` object must not break other objects of the same instance."""
+    cxg_db = ln.DB("laminlabs/cellxgene")
+    other_db = ln.DB("laminlabs/cellxgene")
+    qs = other_db.Artifact.filter(suffix=".h5ad")
+    artifact = qs.first()
+    cxg_db.close()
+    assert qs.first() == artifact
+    assert other_db.Artifact.filter(uid=artifact.uid).one() == artifact
+    assert artifact.storage is not None
+
+
 def test_DB_dir():
     """__dir__ must return discovered registries."""
     cxg = ln.DB("laminlabs/cellxgene")
@@ -82,3 +94,60 @@ def test_DB_dir():
     assert "Collection" in dir_result
     assert "Gene" not in dir_result
     assert "bionty" in dir_result
+
+
+def test_connect_reuses_instance_connection():
+    from lamindb.models._connections import (
+        INSTANCE_METADATA_TTL,
+        instance_connections,
+    )
+
+    slug = ln.setup.settings.instance.slug
+    ln.core.close_connections()
+    stats = ln.core.connection_stats()
+    assert ln.Artifact.connect(slug)._db is None
+    assert ln.ULabel.connect(slug)._db is None
+    db = ln.DB(slug)
+    assert db.ULabel.filter().count() == ln.ULabel.filter().count()
+    new_stats = ln.core.connection_stats()
+    assert new_stats["connects"] == stats["connects"] + 1
+    assert new_stats["reuses"] == stats["reuses"] + 3
+    # expired metadata is resolved again
+    instance_connections.ttl = 0
+    try:
+        ln.Artifact.connect(slug)
+    finally:
+        instance_connections.ttl = INSTANCE_METADATA_TTL
+    assert ln.core.connection_stats()["connects"] == stats["connects"] + 2
+    db.close()
+    assert instance_connections.get(slug) is None
+
+
+def test_connect_reuses_existing_alias(monkeypatch):
+    import copy
+
+    from django.db import connections
+    from lamindb.models import sqlrecord
+    from lamindb.models._connections import instance_connections
+
+    instance = "testuser1/reused-alias"
+    connections.settings[instance] = copy.deepcopy(connections.settings["default"])
+    cache_filepath = (
+        ln.setup.settings.cache_dir / "instance--testuser1--reused-alias--uid.txt"
+    )
+    cache_filepath.write_text("reuseduid\nbionty", encoding="utf-8")
+
+    def connect_instance_db(instance):
+        raise AssertionError("the connection settings must not be rebuilt")
+
+    monkeypatch.setattr(sqlrecord, "connect_instance_db", connect_instance_db)
+    try:
+        connected = instance_connections.connect(instance)
+        assert connected.using == instance
+        assert connected.modules == {"bionty"}
+        assert "bionty" in connected.registries
+        assert instance_connections.get(instance) == connected
+    finally:
+        instance_connections.close(instance)
+        del connections.settings[instance]
+        cache_filepath.unlink()
@@ -4,6 +4,7 @@ from contextlib import contextmanager
 
 import bionty as bt
 import lamindb as ln
+import pandas as pd
 import pytest
 from django.core.exceptions import FieldError
 from lamindb.base.users import current_user_id
@@ -81,6 +82,37 @@ def test_to_dataframe():
     assert qs.to_dataframe().iloc[0]["handle"] == ln.setup.settings.user.handle
 
 
+def test_to_dataframe_batches():
+    project_label = ln.Record(name="project of batches").save()
+    labels = ln.Record.from_values(
+        [f"Batches {i}" for i in range(5)], create=True
+    ).save()
+    # a record within the pages that doesn't match the filter
+    other_label = ln.Record(name="Other than batches").save()
+    labels += ln.Record.from_values(["Batches 5"], create=True).save()
+    project_label.children.add(*labels)
+    qs = ln.Record.filter(name__startswith="Batches")
+    batches = list(qs.to_dataframe_batches(batch_size=2, include="parents__name"))
+    assert [len(df) for df in batches] == [2, 2, 2]
+    df = pd.concat(batches)
+    assert df.index.tolist() == sorted(label.id for label in labels)
+    assert df["parents__name"].iloc[0] == {project_label.name}
+    df_expected = qs.to_dataframe(include="parents__name", limit=None)
+    assert set(df.index) == set(df_expected.index)
+    record_batches = list(qs.to_dataframe_batches(batch_size=3, arrow=True))
+    assert [batch.num_rows for batch in record_batches] == [3, 3]
+    assert "name" in record_batches[0].schema.names
+    # sliced query sets
+    assert sum(len(df) for df in qs[:3].to_dataframe_batches(batch_size=2)) == 3
+    assert list(ln.Record.filter(name="no such record").to_dataframe_batches()) == []
+    with pytest.raises(ValueError):
+        next(qs.to_dataframe_batches(batch_size=0))
+    for label in labels:
+        label.delete(permanent=True)
+    other_label.delete(permanent=True)
+    project_label.delete(permanent=True)
+
+
 def test_complex_df_with_features():
     # should not fail
     ln.Artifact.connect("laminlabs/lamindata").to_dataframe(include="features")
@@ -317,3 +317,43 @@ def test_to_artifact_exports_all_records():
     assert len(df) == 101, f"Expected 101 records, got {len(df)}"
     sheet.records.all().delete(permanent=True)
     sheet.delete(permanent=True)
+
+
+def test_to_dataframe_pages_and_columns():
+    from lamindb.models._sheet_export import sheet_to_dataframe
+
+    feature_str = ln.Feature(name="sheet_page_str", dtype=str).save()
+    feature_label = ln.Feature(name="sheet_page_label", dtype=ln.ULabel).save()
+    schema = ln.Schema([feature_str, feature_label], name="sheet_page_schema").save()
+    sheet = ln.Record(name="PagedSheet", is_type=True, schema=schema).save()
+    labels = ln.ULabel.from_values(["label_a", "label_b"], create=True).save()
+    for i in range(5):
+        record = ln.Record(name=f"paged_record_{i}").save()
+        record.features.add_values(
+            {"sheet_page_str": f"value_{i}", "sheet_page_label": labels[i % 2].name}
+        )
+        record.type = sheet
+        record.save()
+
+    qs = sheet.records.all()
+    df = sheet_to_dataframe(qs)
+    assert df.columns.to_list() == ["uid", "name", "sheet_page_str", "sheet_page_label"]
+    assert df["sheet_page_label"].to_list() == ["label_a", "label_b"] * 2 + ["label_a"]
+    # keyset pagination doesn't change the result
+    pd.testing.assert_frame_equal(sheet_to_dataframe(qs, page_size=2), df)
+
+    df = sheet.to_dataframe(columns=["sheet_page_label"])
+    assert df.columns.to_list() == [
+        "sheet_page_label",
+        "__lamindb_record_uid__",
+        "__lamindb_record_name__",
+    ]
+    assert len(df) == 5
+
+    sheet.records.all().delete(permanent=True)
+    sheet.delete(permanent=True)
+    schema.delete(permanent=True)
+    for label in labels:
+        label.delete(permanent=True)
+    feature_str.delete(permanent=True)
+    feature_label.delete(permanent=True)
@@ -1,5 +1,7 @@
 # ruff: noqa: F811
 
+from pathlib import Path
+
 import lamindb as ln
 import pytest
 from _dataset_fixtures import (  # noqa
@@ -57,6 +59,39 @@ def test_store_artifacts_acid(get_mini_csv):
     artifact.delete(permanent=True)
 
 
+def test_store_artifacts_concurrently():
+    paths = []
+    for i in range(4):
+        path = Path(f"concurrent_upload_{i}.txt")
+        path.write_text(f"concurrent upload {i}")
+        paths.append(path)
+    artifacts = [ln.Artifact(path, description="concurrent upload") for path in paths]
+    ln.save(artifacts)
+    for artifact in artifacts:
+        assert artifact.path.exists()
+        assert ln.Artifact.get(artifact.uid)._storage_completed is None
+
+    # a failed upload cleans up its record and keeps the others
+    new_paths = []
+    for i in range(4, 6):
+        path = Path(f"concurrent_upload_{i}.txt")
+        path.write_text(f"concurrent upload {i}")
+        new_paths.append(path)
+    failing_artifacts = [
+        ln.Artifact(path, description="concurrent upload") for path in new_paths
+    ]
+    new_paths[1].unlink()
+    with pytest.raises(RuntimeError) as error:
+        ln.save(failing_artifacts)
+    assert "No entries were uploaded" not in error.exconly()
+    assert ln.Artifact.filter(uid=failing_artifacts[1].uid).count() == 0
+    assert ln.Artifact.get(failing_artifacts[0].uid)._storage_completed is None
+
+    ln.Artifact.filter(description="concurrent upload").delete(permanent=True)
+    for path in paths + new_paths:
+        path.unlink(missing_ok=True)
+
+
 def test_save_parents():
     import bionty as bt
 
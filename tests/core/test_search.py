@@ -1,6 +1,8 @@
 import bionty as bt
 import lamindb as ln
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 
 @pytest.fixture(scope="module")
@@ -63,3 +65,47 @@ def test_search_None():
         ValueError, match="Cannot search for None value! Please pass a valid string."
     ):
         bt.CellType.search(None)
+
+
+def test_search_index():
+    from lamindb.core import create_search_index, drop_search_index
+
+    records = ln.Record.from_values(
+        ["search index label", "label of search index", "Search-Index", "other"],
+        field="name",
+        create=True,
+    )
+    ln.save(records)
+    expected = list(ln.Record.search("search index").values_list("name", flat=True))
+    assert len(expected) == 2
+
+    create_search_index(ln.Record, ["name", "description"])
+    result = ln.Record.search("search index", field=["name", "description"])
+    assert "_search" in str(result.query)
+    assert (
+        list(ln.Record.search("search index").values_list("name", flat=True))
+        == expected
+    )
+    assert list(result.values_list("name", flat=True)) == expected
+    # the indexed columns are looked up once
+    with CaptureQueriesContext(connection) as queries:
+        ln.Record.search("search index", field=["name", "description"])
+    assert len(queries) == 0
+    # strings shorter than a trigram don't use the index
+    assert "_search" not in str(ln.Record.search("ot", field="name").query)
+    assert ln.Record.search("ot", field="name").first().name == "other"
+
+    # the index is kept in sync through triggers
+    record = ln.Record(name="newly indexed label").save()
+    assert ln.Record.search("newly indexed", field="name").one() == record
+    record.name = "renamed label"
+    record.save()
+    assert not ln.Record.search("newly indexed", field="name").exists()
+    assert ln.Record.search("renamed", field="name").one() == record
+    record.delete(permanent=True)
+    assert not ln.Record.search("renamed", field="name").exists()
+
+    drop_search_index(ln.Record)
+    assert "_search" not in str(ln.Record.search("search index", field="name").query)
+    for record in records:
+        record.delete(permanent=True)
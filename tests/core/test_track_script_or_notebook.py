@@ -493,3 +493,38 @@ def test_logstream_tracker_exception_handling():
 
     finally:
         sys.excepthook = original_excepthook
+
+
+def test_logstream_tracker_carriage_returns_and_rotation():
+    ln.settings.run_logs_max_bytes = 2000
+    tracker = LogStreamTracker()
+    log_path = Path(ln_setup.settings.cache_dir / "run_logs_rotation.txt")
+    try:
+        tracker.start(MockRun("rotation"))
+        # a progress bar that redraws its line
+        for i in range(100):
+            sys.stdout.write(f"\rprogress {i}/100")
+        sys.stdout.write("\n")
+        sys.stdout.write("\rdone\r\n")
+        print("error line", file=sys.stderr)
+        tracker.flush()
+        content = log_path.read_text()
+        assert "progress 99/100\ndone\nerror line\n" in content
+        assert "progress 98/100" not in content
+        for i in range(100):
+            # the size is measured in bytes, not in characters
+            print(f"line {i:03d} " + "é" * 40)
+        tracker.finish()
+        # the log file was rotated and the previous part is kept
+        content = log_path.read_text()
+        previous = log_path.with_name(f"{log_path.name}.1").read_text()
+        assert log_path.stat().st_size <= 2000
+        assert log_path.with_name(f"{log_path.name}.1").stat().st_size <= 2000
+        assert content.startswith("line ")
+        assert content.endswith("line 099 " + "é" * 40 + "\n")
+        assert previous.endswith("\n")
+    finally:
+        ln.settings.run_logs_max_bytes = None
+        for path in (log_path, log_path.with_name(f"{log_path.name}.1")):
+            if path.exists():
+                path.unlink()
@@ -1,3 +1,4 @@
+import asyncio
 import concurrent.futures
 from pathlib import Path
 from typing import Iterable
@@ -5,6 +6,7 @@ from typing import Iterable
 import lamindb as ln
 import pandas as pd
 import pytest
+from lamindb.core._functions import flush_buffered_runs, run_buffer
 
 
 @ln.step()
@@ -102,3 +104,78 @@ def test_step_parallel():
     ln.context._run = None
     ln.context._transform = None
     ln.context._path = None
+
+
+@ln.step(buffered=True)
+def buffered_inner(value: int) -> int:
+    return value * 2
+
+
+@ln.step(buffered=True)
+def buffered_outer(n: int, save_artifact: bool = False) -> list[int]:
+    if save_artifact:
+        ln.Artifact.from_dataframe(
+            pd.DataFrame({"a": [n]}), key="buffered_step.parquet"
+        ).save()
+    return [buffered_inner(i) for i in range(n)]
+
+
+@ln.step()
+async def async_step(value: int) -> int:
+    await asyncio.sleep(0)
+    return value + 1
+
+
+def test_step_buffered():
+    ln.track()
+    n_runs_before = ln.Run.filter(entrypoint="buffered_inner").count()
+
+    assert buffered_outer(3) == [0, 2, 4]
+    # runs are only kept in memory
+    assert len(run_buffer) == 4
+    assert ln.Run.filter(entrypoint="buffered_inner").count() == n_runs_before
+    flush_buffered_runs()
+    assert len(run_buffer) == 0
+
+    outer_run = ln.Run.filter(entrypoint="buffered_outer").order_by("-id").first()
+    inner_runs = ln.Run.filter(initiated_by_run=outer_run).order_by("started_at")
+    assert len(inner_runs) == 3
+    assert [run.params["value"] for run in inner_runs] == [0, 1, 2]
+    assert outer_run.initiated_by_run == ln.context.run
+    assert outer_run.status == "completed"
+    assert outer_run.started_at < inner_runs[0].started_at
+    assert inner_runs[2].finished_at < outer_run.finished_at
+    # the transform is resolved once
+    assert len({run.transform_id for run in inner_runs}) == 1
+
+    # a buffered run is saved as soon as a record links it
+    buffered_outer(1, save_artifact=True)
+    artifact = ln.Artifact.get(key="buffered_step.parquet")
+    assert artifact.run.entrypoint == "buffered_outer"
+    assert artifact.run.status == "completed"
+    assert len(run_buffer) == 1
+    ln.finish()
+    assert len(run_buffer) == 0
+    assert ln.Run.get(entrypoint="buffered_inner", initiated_by_run=artifact.run)
+
+    artifact.delete(permanent=True)
+    ln.Run.filter(entrypoint__startswith="buffered_").delete(permanent=True)
+    ln.context._uid = None
+    ln.context._run = None
+    ln.context._transform = None
+    ln.context._path = None
+
+
+def test_step_async():
+    ln.track()
+    assert asyncio.run(async_step(1)) == 2
+    run = ln.Run.filter(entrypoint="async_step").order_by("-id").first()
+    assert run.params == {"value": 1}
+    assert run.status == "completed"
+    assert run.initiated_by_run == ln.context.run
+
+    run.delete(permanent=True)
+    ln.context._uid = None
+    ln.context._run = None
+    ln.context._transform = None
+    ln.context._path = None
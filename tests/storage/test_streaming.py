@@ -168,6 +168,41 @@ def test_backed_access(adata_format):
         shutil.rmtree(fp)
 
 
+def test_backed_access_lazy_index():
+    fp = ln.examples.datasets.anndata_file_pbmc68k_test()
+
+    with backed_access(fp, using_key=None) as access:
+        assert access.shape == (30, 200)
+        # positional indexing doesn't read the names
+        sub = access[2:10, [1, 2, 5]]
+        assert sub.shape == (8, 3)
+        assert access._obs_names._index is None
+        assert access._var_names._index is None
+        assert sub.obs_names.tolist() == access.obs_names[2:10].tolist()
+        assert access._var_names._index is None
+        assert sub.var_names.tolist() == access.var_names[[1, 2, 5]].tolist()
+        # indexing by names reads the names of the respective axis only
+        assert access[:, ["SSU72", "PARK7"]].shape == (30, 2)
+
+    artifact = ln.Artifact(fp, key="lazy_index/pbmc68k.h5ad").save()
+    cache_dir = ln.setup.settings.cache_dir / "anndata_index"
+    obs_cache = cache_dir / f"{artifact.hash}_obs.npy"
+    obs_cache.unlink(missing_ok=True)
+
+    with artifact.open(cache_index=True) as access:
+        obs_names = access.obs_names
+    assert obs_cache.exists()
+
+    with artifact.open(cache_index=True) as access:
+        sub = access[[3, 1, 2]]
+        # names are read from the memory-mapped cache
+        assert sub.obs_names.tolist() == obs_names[[3, 1, 2]].tolist()
+        assert access[obs_names[:2].tolist()].shape == (2, 200)
+
+    obs_cache.unlink()
+    artifact.delete(permanent=True)
+
+
 def test_add_column():
     previous_storage = ln.setup.settings.storage.root_as_str
     ln.settings.storage = "s3://lamindb-test/storage"
@@ -151,6 +151,26 @@ def test_transfer_from_remote_to_local(ccaplog):
     )  # there is an issue here with permanent deletion because of schema module mismatch
 
 
+def test_transfer_query_set():
+    artifacts = ln.Artifact.connect("laminlabs/lamin-dev").filter(
+        ln.Q(uid__startswith="livFRRpM") | ln.Q(uid__startswith="qz35YaRk")
+    )
+    transferred = artifacts.transfer(annotations=True)
+    assert set(transferred.values_list("uid", flat=True)) == set(
+        artifacts.values_list("uid", flat=True)
+    )
+    artifact = transferred.get(uid__startswith="qz35YaRk")
+    assert artifact.organisms.get(name="mouse")
+    assert artifact.features.slots["obs"].members.filter(name="organism").exists()
+
+    # transferring again maps to the existing records
+    assert artifacts.transfer(annotations=True).count() == 2
+    assert ln.Artifact.filter(uid__startswith="qz35YaRk").count() == 1
+
+    for artifact in transferred.to_list():
+        artifact.delete(storage=False, permanent=True)
+
+
 def test_transfer_into_space():
     # grab any ulabel from the default space
     ulabel = ln.ULabel.connect("laminlabs/lamin-dev").filter(space__id=1).first()